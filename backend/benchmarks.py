@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the in-memory catalog structures in server.py
+Runs against a synthetic London-sized-and-beyond catalog; no MongoDB needed,
+except for favorites-load, which talks to the mongod at MONGO_URL.
+
+Usage: python benchmarks.py <benchmark> [--size N] [--queries N]
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import marshal
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "museums_benchmark")
+
+import server  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+# Created and dropped by favorites-load; deliberately not DB_NAME, which may hold real users' data
+FAVORITES_LOAD_DB = "museums_favorites_load"
+
+NAME_WORDS = [
+    "Royal", "National", "Natural", "Science", "History", "Modern", "Ancient", "Maritime",
+    "Postal", "Transport", "Design", "Fashion", "Textile", "Clockmakers", "Garden", "Foundling",
+    "Wellcome", "Horniman", "Courtauld", "Wallace", "Sloane", "Hunterian", "Victoria", "Albert",
+    "Docklands", "Brunel", "Dickens", "Freud", "Faraday", "Darwin", "Churchill", "Thames",
+    "Bankside", "Greenwich", "Kensington", "Bloomsbury", "Hampstead", "Southwark", "Camden",
+    "Islington", "Chelsea", "Lambeth", "Hackney", "Brixton", "Richmond", "Dulwich", "Crystal",
+]
+NAME_SUFFIXES = ["Museum", "Gallery", "Collection", "House", "Archive", "Institute"]
+CATEGORIES = ["Art", "History", "Science", "Culture", "Military", "Transport", "Design", "Nature"]
+EATERY_WORDS = [
+    "Wagamama", "Pret", "Leon", "Nandos", "Dishoom", "Franco", "Manca", "Padella", "Hoppers",
+    "Bistro", "Tavern", "Arms", "Kitchen", "Canteen", "Deli", "Bakery", "Crown", "Anchor",
+]
+CUISINES = ["British", "Italian", "Japanese", "Indian", "French", "Coffee", "Healthy", "American"]
+SYLLABLES = [
+    "ash", "bel", "cor", "dun", "el", "fen", "gar", "hol", "ing", "kel", "lan",
+    "mor", "nor", "pen", "quin", "ros", "sel", "tam", "ul", "ver", "wick", "yar",
+]
+FILLER_WORDS = [
+    "collection", "exhibition", "galleries", "artifacts", "paintings", "sculpture", "history",
+    "science", "interactive", "family", "archive", "permanent", "temporary", "victorian",
+    "medieval", "roman", "egyptian", "industrial", "maritime", "natural", "modern", "design",
+]
+
+
+def proper_noun(rng: random.Random) -> str:
+    return "".join(rng.choices(SYLLABLES, k=rng.randint(2, 3))).capitalize()
+
+
+def synthetic_catalog(size: int, seed: int = 7):
+    """Museum records shaped like LONDON_MUSEUMS, spread over Greater London"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(size):
+        lat = rng.uniform(51.30, 51.68)
+        lon = rng.uniform(-0.45, 0.25)
+        name = " ".join([proper_noun(rng)] + rng.sample(NAME_WORDS, rng.randint(0, 2)) + [rng.choice(NAME_SUFFIXES)])
+        eateries = []
+        for _ in range(rng.randint(3, 10)):
+            eateries.append({
+                "name": " ".join(rng.sample(EATERY_WORDS, rng.randint(1, 2))),
+                "type": rng.choice(["Cafe", "Restaurant", "Pub"]),
+                "cuisine": rng.choice(CUISINES),
+                "distance": f"{rng.randint(1, 8)} min walk",
+                "price_range": rng.choice(["£", "££", "£££"]),
+                "address": f"{rng.randint(1, 200)} {rng.choice(NAME_WORDS)} Street",
+                "latitude": lat + rng.uniform(-0.003, 0.003),
+                "longitude": lon + rng.uniform(-0.004, 0.004),
+            })
+        records.append({
+            "id": str(i + 1),
+            "name": name,
+            "description": " ".join(rng.choices(FILLER_WORDS, k=60)),
+            "short_description": " ".join(rng.choices(FILLER_WORDS, k=10)),
+            "address": f"{rng.randint(1, 200)} {rng.choice(NAME_WORDS)} Road, London",
+            "latitude": lat,
+            "longitude": lon,
+            "image_url": f"https://example.org/images/{i + 1}.jpg",
+            "category": rng.choice(CATEGORIES),
+            "free_entry": rng.random() < 0.4,
+            "opening_hours": "Daily 10:00-17:00",
+            "website": None,
+            "phone": None,
+            "transport": [
+                {"type": "tube", "name": f"{rng.choice(NAME_WORDS)} Road", "line": "Central", "distance": "5 min walk"},
+                {"type": "bus", "name": f"{rng.choice(NAME_WORDS)} Street", "routes": ["1", "8"], "distance": "2 min walk"},
+            ],
+            "nearby_eateries": eateries,
+            "featured": rng.random() < 0.05,
+            "rating": round(rng.uniform(3.5, 5.0), 1),
+        })
+    return records
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """One random deletion, substitution or transposition"""
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(["delete", "substitute", "transpose"])
+    if edit == "delete":
+        return word[:i] + word[i + 1:]
+    if edit == "substitute":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def levenshtein(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def report(label: str, samples_ms):
+    samples_ms = sorted(samples_ms)
+    p95 = samples_ms[int(len(samples_ms) * 0.95) - 1] if len(samples_ms) >= 20 else samples_ms[-1]
+    print(f"  {label:<38} mean {statistics.mean(samples_ms):8.3f} ms   p95 {p95:8.3f} ms")
+
+
+def bench_fuzzy(size: int, queries: int):
+    """Trigram fuzzy search vs. an edit-distance scan over every museum name"""
+    records = synthetic_catalog(size)
+    index = server.TrigramIndex()
+    _, build_ms = timed(lambda: [index.add(r) for r in records])
+    print(f"Trigram index over {size} museums built in {build_ms:.0f} ms")
+
+    rng = random.Random(11)
+    targets = rng.sample(records, queries)
+    typo_queries = [" ".join(misspell(w, rng) for w in server.tokenize(r["name"])) for r in targets]
+
+    latencies, hits = [], 0
+    for record, query in zip(targets, typo_queries):
+        ranked, ms = timed(index.search, query)
+        latencies.append(ms)
+        hits += record["id"] in ranked[:10]
+    report("trigram search", latencies)
+    print(f"  target museum in top 10 for {hits}/{queries} misspelled queries")
+
+    names = [(r["id"], " ".join(server.tokenize(r["name"]))) for r in records]
+    scan_latencies = []
+    for query in typo_queries[:3]:
+        _, ms = timed(lambda: sorted(names, key=lambda item: levenshtein(query, item[1]))[:10])
+        scan_latencies.append(ms)
+    report("edit-distance scan (baseline)", scan_latencies)
+
+
+def bench_nearby(size: int, queries: int):
+    """Grid-index k-nearest and radius queries at growing catalog sizes vs. a full haversine scan"""
+    rng = random.Random(5)
+    points = [(rng.uniform(51.35, 51.65), rng.uniform(-0.40, 0.20)) for _ in range(queries)]
+    for n in (size // 100, size // 10, size):
+        records = synthetic_catalog(n)
+        index = server.GridIndex()
+        for record in records:
+            index.add(record)
+        print(f"{n} museums")
+        report("k=10 nearest", [timed(index.nearest, lat, lon, 10)[1] for lat, lon in points])
+        report("within 1 km", [timed(index.within, lat, lon, 1000)[1] for lat, lon in points])
+        scan = [
+            timed(lambda: heapq.nsmallest(10, (
+                (server.haversine_m(lat, lon, r["latitude"], r["longitude"]), r["id"]) for r in records
+            )))[1]
+            for lat, lon in points[:20]
+        ]
+        report("full scan k=10 (baseline)", scan)
+
+
+def legacy_encode(content) -> bytes:
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def bench_serialize(size: int, queries: int):
+    """Per-request CPU of /museums and /tours: per-request Museum(**m) vs. validated-once models"""
+    museum_list = TypeAdapter(List[server.Museum])
+    for label, records in (("built-in catalog", server.LONDON_MUSEUMS), (f"{size} synthetic", synthetic_catalog(size))):
+        store = server.CatalogStore(records)
+        rows = list(store)
+        print(f"/museums, {label} ({len(rows)} museums)")
+
+        def revalidating():
+            # What a response_model=List[Museum] route did: build, dump, validate again, encode
+            models = [server.Museum(**m) for m in rows]
+            validated = museum_list.validate_python([m.model_dump() for m in models])
+            return legacy_encode(validated)
+
+        report("Museum(**m) + response_model", [timed(revalidating)[1] for _ in range(queries)])
+        report("validated once + TypeAdapter", [timed(lambda: server.encode_json(store.models(rows)))[1] for _ in range(queries)])
+
+    store = server.CatalogStore(server.LONDON_MUSEUMS)
+
+    def tours(museums_for):
+        return [{**tour, "museums": museums_for(tour["museum_ids"])} for tour in server.WALKING_TOURS]
+
+    print(f"/tours ({len(server.WALKING_TOURS)} tours)")
+    report("Museum(**m) + jsonable_encoder", [
+        timed(lambda: legacy_encode(tours(lambda ids: [server.Museum(**m) for m in store.get_many(ids)])))[1]
+        for _ in range(queries)
+    ])
+    report("validated once + TypeAdapter", [
+        timed(lambda: server.encode_json(tours(lambda ids: store.models(store.get_many(ids)))))[1]
+        for _ in range(queries)
+    ])
+
+
+async def favorites_load(users: int, queries: int):
+    # Always a throwaway database of its own, whatever DB_NAME the environment points the app at
+    if server.db.name == FAVORITES_LOAD_DB:
+        sys.exit(f"DB_NAME is {FAVORITES_LOAD_DB}, the database this benchmark drops; point DB_NAME elsewhere")
+    database = server.client[FAVORITES_LOAD_DB]
+    await server.client.drop_database(FAVORITES_LOAD_DB)
+    favorites = database.favorites
+    await server.IndexProvisioner(server.COLLECTION_INDEXES).ensure(database)
+
+    # Seed 1-8 favorites per user, created in bulk ahead of the timed operations
+    rng = random.Random(3)
+    museum_ids = [m["id"] for m in server.LONDON_MUSEUMS]
+    start, batch, seeded = time.perf_counter(), [], 0
+    for u in range(users):
+        user_id = f"device-{u}"
+        for museum_id in rng.sample(museum_ids, rng.randint(1, 8)):
+            batch.append(server.Favorite(user_id=user_id, museum_id=museum_id).dict())
+        if len(batch) >= 10_000:
+            await favorites.insert_many(batch, ordered=False)
+            seeded, batch = seeded + len(batch), []
+    if batch:
+        await favorites.insert_many(batch, ordered=False)
+        seeded += len(batch)
+    print(f"Seeded {seeded} favorites for {users} users in {time.perf_counter() - start:.0f} s")
+
+    async def timed_async(op):
+        start = time.perf_counter()
+        await op
+        return (time.perf_counter() - start) * 1000
+
+    async def add(key):
+        await favorites.find_one_and_update(
+            key, {"$setOnInsert": server.Favorite(**key).dict(exclude=set(key))},
+            projection={"_id": 0, "id": 1}, upsert=True,
+        )
+
+    samples = {"add": [], "check": [], "check 20 ($in)": [], "list": [], "remove": []}
+    for _ in range(queries):
+        user_id, museum_id = f"device-{rng.randrange(users)}", rng.choice(museum_ids)
+        key = {"user_id": user_id, "museum_id": museum_id}
+        samples["add"].append(await timed_async(add(key)))
+        samples["check"].append(await timed_async(favorites.find_one(key, {"_id": 1})))
+        samples["check 20 ($in)"].append(await timed_async(favorites.find(
+            {"user_id": user_id, "museum_id": {"$in": rng.sample(museum_ids, 20)}}, {"museum_id": 1, "_id": 0}
+        ).to_list(None)))
+        samples["list"].append(await timed_async(favorites.find(
+            {"user_id": user_id}, {"_id": 0, "museum_id": 1, "created_at": 1, "id": 1}
+        ).sort([("created_at", 1), ("id", 1)]).to_list(None)))
+        samples["remove"].append(await timed_async(favorites.delete_one(key)))
+    for label, latencies in samples.items():
+        report(label, latencies)
+
+    # Every operation should be answered from the compound indexes, never a collection scan
+    plan = await favorites.find({"user_id": "device-0"}).sort([("created_at", 1), ("id", 1)]).explain()
+    print(f"  list plan: {json.dumps(plan['queryPlanner']['winningPlan'])[:200]}")
+    await server.client.drop_database(FAVORITES_LOAD_DB)
+
+
+def bench_favorites_load(size: int, queries: int):
+    """Per-user favorites at scale: add/check/list/remove latency against a local mongod.
+
+    Runs in its own database (FAVORITES_LOAD_DB), created and dropped by the benchmark, so it never
+    touches the favorites in DB_NAME.
+    """
+    asyncio.run(favorites_load(size, queries))
+
+
+def bench_boot(size: int, queries: int):
+    """Loading the built-in catalog: Python literal in server.py vs. JSON vs. the compiled snapshot"""
+    sources = (("built-in catalog", server.LONDON_MUSEUMS), (f"{size // 10} synthetic", synthetic_catalog(size // 10)),
+               (f"{size} synthetic", synthetic_catalog(size)))
+    runs = max(3, min(queries, 20))
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, records in sources:
+            literal = f"LONDON_MUSEUMS = {records!r}\n"
+            code = marshal.dumps(compile(literal, "server.py", "exec"))
+            source, snapshot = Path(tmp) / "catalog.json", Path(tmp) / "catalog.snapshot"
+            source.write_text(json.dumps(records))
+            server.compile_catalog_snapshot(source, snapshot)
+            print(f"{label}: literal {len(literal) / 1024:.0f} KB, snapshot {snapshot.stat().st_size / 1024:.0f} KB")
+            report("literal, first boot (compile + exec)", [
+                timed(lambda: exec(compile(literal, "server.py", "exec"), {}))[1] for _ in range(3)
+            ])
+            report("literal, cached .pyc (unmarshal + exec)", [timed(exec, marshal.loads(code), {})[1] for _ in range(runs)])
+            report("JSON parse", [timed(json.loads, source.read_bytes())[1] for _ in range(runs)])
+            report("snapshot (read + sha256 + unpickle)", [
+                timed(server.load_catalog_snapshot, source, snapshot)[1] for _ in range(runs)
+            ])
+
+
+def bench_publish(size: int, queries: int):
+    """One admin edit: copy-on-write snapshot with index deltas vs. re-deriving every index"""
+    runs = max(3, min(queries, 20))
+    for n in (size // 3, size):
+        catalog = server.CatalogSnapshot(synthetic_catalog(n))
+        rng = random.Random(n)
+        print(f"{n} museums")
+
+        def edit():
+            record = dict(catalog.get(str(rng.randint(1, n))))
+            record["name"] = f"{proper_noun(rng)} {record['name']}"
+            return [(record["id"], record, 1)]
+
+        report("copy-on-write snapshot", [timed(catalog.with_changes, edit(), 1)[1] for _ in range(runs)])
+        report("re-derive every index", [timed(lambda: catalog.copy()._derive())[1] for _ in range(3)])
+
+        # Both paths must answer alike, and the published snapshot must not see the edit
+        changes = edit()
+        name = changes[0][1]["name"]
+        before = catalog.search_index.search(name)
+        incremental = catalog.with_changes(changes, 1)
+        rebuilt = incremental.copy()
+        rebuilt._derive()
+        for index in ("search_index", "trigram_index"):
+            assert getattr(incremental, index).search(name) == getattr(rebuilt, index).search(name), index
+        assert incremental.suggest_index.suggest(name[:4]) == rebuilt.suggest_index.suggest(name[:4])
+        assert incremental.grid_index.nearest(51.5, -0.12, 10) == rebuilt.grid_index.nearest(51.5, -0.12, 10)
+        assert catalog.search_index.search(name) == before
+
+
+BENCHMARKS = {
+    "fuzzy": (bench_fuzzy, 50_000),
+    "nearby": (bench_nearby, 100_000),
+    "serialize": (bench_serialize, 1_000),
+    "favorites-load": (bench_favorites_load, 1_000_000),
+    "boot": (bench_boot, 10_000),
+    "publish": (bench_publish, 30_000),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS))
+    parser.add_argument("--size", type=int, help="synthetic catalog size (users for favorites-load)")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    bench, default_size = BENCHMARKS[args.benchmark]
+    bench(args.size or default_size, args.queries)
+
+
+if __name__ == "__main__":
+    main()
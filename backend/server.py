@@ -1,15 +1,40 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Any, List, Optional
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
+import gzip
 import hashlib
+import json
+import base64
+import copy
+import csv
+import fcntl
+import io
+import gc
+import mmap
+import pickle
+import struct
+import sys
+import numpy as np
+import math
+import re
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict
 
 
 ROOT_DIR = Path(__file__).parent
@@ -26,8 +51,70 @@ db = client[os.environ['DB_NAME']]
 # Create the main app without a prefix
 app = FastAPI()
 
+def make_etag(body: bytes) -> str:
+    """Strong ETag from a content hash alone, so every worker gives the same bytes the same tag"""
+    return f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 7232 requires for this header)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for coding in (accept_encoding or "").lower().split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+def user_scoped(dependency):
+    """Mark a dependency that identifies the caller; responses of routes that use it are private"""
+    dependency.user_scoped = True
+    return dependency
+
+def uses_user_scoped(dependant) -> bool:
+    return any(getattr(sub.call, "user_scoped", False) or uses_user_scoped(sub) for sub in dependant.dependencies)
+
+class ConditionalGetRoute(APIRoute):
+    """Route that tags every GET 200 response with an ETag and answers a matching If-None-Match with 304.
+
+    Responses served from the response cache carry their cache entry, and are swapped for the
+    entry's pre-compressed gzip body when the client accepts it. Routes that depend on a
+    user_scoped dependency answer per caller, so shared caches are told not to store them.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        cache_control = "private, no-cache" if uses_user_scoped(self.dependant) else "no-cache"
+
+        async def conditional_handler(request: Request) -> Response:
+            response = await handler(request)
+            if request.method != "GET" or response.status_code != 200 or not hasattr(response, "body"):
+                return response
+            entry = getattr(response, "cached_entry", None)
+            if entry is not None and entry.compressible and accepts_gzip(request.headers.get("accept-encoding")):
+                response = entry.gzip_response()
+            etag = response.headers.get("etag")
+            if etag is None:
+                etag = make_etag(response.body)
+                response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = cache_control
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                # A 304 carries the validators and caching headers the 200 would have (RFC 7232 4.1)
+                headers = {"ETag": etag, "Cache-Control": cache_control}
+                if "vary" in response.headers:
+                    headers["Vary"] = response.headers["vary"]
+                return Response(status_code=304, headers=headers)
+            return response
+
+        return conditional_handler
+
 # Create a router with the /api prefix
-api_router = APIRouter(prefix="/api")
+api_router = APIRouter(prefix="/api", route_class=ConditionalGetRoute)
 
 
 # Define Models
@@ -86,1052 +173,1525 @@ class MuseumCreate(BaseModel):
     featured: bool = False
     rating: float = 4.5
 
+class MuseumSummary(BaseModel):
+    """Compact projection for list screens (view=summary)"""
+    id: str
+    name: str
+    short_description: str
+    image_url: str
+    category: str
+    rating: float = 4.5
+    free_entry: bool
+
+class NearbyMuseum(Museum):
+    distance_m: float
+
+class EateryNearPoint(BaseModel):
+    """A NearbyEatery found from an arbitrary point: distance_m replaces the museum-relative `distance`"""
+    name: str
+    type: str
+    cuisine: Optional[str] = None
+    price_range: str
+    address: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    distance_m: float
+    museum_ids: List[str]
+
+class Suggestion(BaseModel):
+    type: str  # museum, category, station, eatery
+    label: str
+    museum_ids: List[str] = []
+
 class Favorite(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
     museum_id: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-# Pre-populated museum data for London - with front entrance photos and nearby eateries within 1/4 mile
-LONDON_MUSEUMS = [
-    {
-        "id": "1",
-        "name": "British Museum",
-        "description": "The British Museum is one of the world's most famous museums, housing a vast collection of world art and artifacts spanning over two million years of history. Highlights include the Rosetta Stone, the Elgin Marbles, and Egyptian mummies. The museum's stunning Great Court, designed by Norman Foster, is the largest covered public square in Europe.",
-        "short_description": "World-famous museum with over 8 million artifacts from all continents",
-        "address": "Great Russell Street, London WC1B 3DG",
-        "latitude": 51.5194,
-        "longitude": -0.1269,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/u76djmv8_london-uk-22-april-2024-600nw-2471806603.jpg",
-        "category": "History",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-17:00, Fri until 20:30",
-        "website": "https://www.britishmuseum.org",
-        "phone": "+44 20 7323 8299",
-        "transport": [
-            {"type": "tube", "name": "Holborn", "line": "Central, Piccadilly", "distance": "5 min walk"},
-            {"type": "tube", "name": "Tottenham Court Road", "line": "Central, Northern", "distance": "5 min walk"},
-            {"type": "bus", "name": "Great Russell Street", "routes": ["1", "8", "19", "25", "38"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "The Museum Tavern", "type": "Pub", "cuisine": "British", "distance": "1 min walk", "price_range": "££", "address": "49 Great Russell St", "latitude": 51.5188, "longitude": -0.1265},
-            {"name": "Cafe in the Great Court", "type": "Cafe", "cuisine": "International", "distance": "Inside museum", "price_range": "££", "address": "British Museum", "latitude": 51.5194, "longitude": -0.1269},
-            {"name": "Plum + Spilt Milk", "type": "Restaurant", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Great Northern Hotel", "latitude": 51.5180, "longitude": -0.1240},
-            {"name": "Wasabi", "type": "Restaurant", "cuisine": "Japanese", "distance": "3 min walk", "price_range": "£", "address": "58 Great Russell St", "latitude": 51.5191, "longitude": -0.1272},
-            {"name": "Snog", "type": "Cafe", "cuisine": "Desserts", "distance": "2 min walk", "price_range": "£", "address": "90 Southampton Row", "latitude": 51.5199, "longitude": -0.1253},
-            {"name": "Tas Restaurant", "type": "Restaurant", "cuisine": "Turkish", "distance": "5 min walk", "price_range": "££", "address": "22 Bloomsbury St", "latitude": 51.5175, "longitude": -0.1290},
-            {"name": "North Sea Fish Restaurant", "type": "Restaurant", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "7-8 Leigh St", "latitude": 51.5220, "longitude": -0.1230},
-            {"name": "The Perseverance", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "63 Lamb's Conduit St", "latitude": 51.5211, "longitude": -0.1193},
-            {"name": "Hare & Tortoise", "type": "Restaurant", "cuisine": "Asian", "distance": "4 min walk", "price_range": "££", "address": "11-13 Brunswick Centre", "latitude": 51.5234, "longitude": -0.1216},
-            {"name": "Wagamama", "type": "Restaurant", "cuisine": "Japanese", "distance": "5 min walk", "price_range": "££", "address": "4A Streatham St", "latitude": 51.5205, "longitude": -0.1295}
-        ],
-        "featured": True,
-        "rating": 4.8
-    },
-    {
-        "id": "2",
-        "name": "Natural History Museum",
-        "description": "The Natural History Museum is home to life and earth science specimens comprising some 80 million items within five main collections. The museum is particularly famous for its dinosaur skeletons, including a Diplodocus cast named Dippy, and the dramatic blue whale skeleton in Hintze Hall. The stunning Romanesque architecture makes it one of London's most beautiful buildings.",
-        "short_description": "Iconic museum featuring dinosaurs, wildlife, and natural wonders",
-        "address": "Cromwell Road, South Kensington, London SW7 5BD",
-        "latitude": 51.4967,
-        "longitude": -0.1764,
-        "image_url": "https://upload.wikimedia.org/wikipedia/commons/thumb/c/c1/Natural_History_Museum_London_Jan_2006.jpg/800px-Natural_History_Museum_London_Jan_2006.jpg",
-        "category": "Science",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-17:50",
-        "website": "https://www.nhm.ac.uk",
-        "phone": "+44 20 7942 5000",
-        "transport": [
-            {"type": "tube", "name": "South Kensington", "line": "Circle, District, Piccadilly", "distance": "5 min walk"},
-            {"type": "bus", "name": "Cromwell Road", "routes": ["14", "49", "70", "74", "345", "414", "C1"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "The Central Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Natural History Museum", "latitude": 51.4967, "longitude": -0.1764},
-            {"name": "Comptoir Libanais", "type": "Restaurant", "cuisine": "Lebanese", "distance": "3 min walk", "price_range": "££", "address": "1 Exhibition Rd", "latitude": 51.4955, "longitude": -0.1740},
-            {"name": "Muriel's Kitchen", "type": "Cafe", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "36 Old Brompton Rd", "latitude": 51.4942, "longitude": -0.1755},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "6 min walk", "price_range": "£", "address": "Near Natural History Museum", "latitude": 51.4944, "longitude": -0.1758},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Natural History Museum", "latitude": 51.4979, "longitude": -0.1738},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Natural History Museum", "latitude": 51.4973, "longitude": -0.1747},
-            {"name": "Busaba Eathai", "type": "Restaurant", "cuisine": "Thai", "distance": "6 min walk", "price_range": "££", "address": "Near Natural History Museum", "latitude": 51.4939, "longitude": -0.1743},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Natural History Museum", "latitude": 51.4944, "longitude": -0.1745},
-            {"name": "Bill's Restaurant", "type": "Restaurant", "cuisine": "British", "distance": "8 min walk", "price_range": "££", "address": "Kensington High Street", "latitude": 51.4995, "longitude": -0.1920},
-            {"name": "Zizzi", "type": "Restaurant", "cuisine": "Italian", "distance": "3 min walk", "price_range": "££", "address": "Near Natural History Museum", "latitude": 51.4995, "longitude": -0.1748}],
-        "featured": True,
-        "rating": 4.7
-    },
-    {
-        "id": "3",
-        "name": "Victoria and Albert Museum",
-        "description": "The V&A is the world's largest museum of applied and decorative arts and design, housing a permanent collection of over 2.3 million objects. The collection spans 5,000 years of art from ancient times to the present day, including ceramics, furniture, fashion, glass, jewelry, metalwork, photographs, sculpture, textiles, and paintings.",
-        "short_description": "World's leading museum of art, design, and performance",
-        "address": "Cromwell Road, London SW7 2RL",
-        "latitude": 51.4966,
-        "longitude": -0.1722,
-        "image_url": "https://customer-assets.emergentagent.com/job_london-museums-app/artifacts/w0zwio3k_1312x.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-17:45, Fri until 22:00",
-        "website": "https://www.vam.ac.uk",
-        "phone": "+44 20 7942 2000",
-        "transport": [
-            {"type": "tube", "name": "South Kensington", "line": "Circle, District, Piccadilly", "distance": "5 min walk"},
-            {"type": "bus", "name": "Cromwell Road", "routes": ["14", "49", "70", "74", "345", "414", "C1"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "V&A Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "V&A Museum", "latitude": 51.4966, "longitude": -0.1722},
-            {"name": "Fernandez & Wells", "type": "Cafe", "cuisine": "European", "distance": "4 min walk", "price_range": "££", "address": "8 Exhibition Rd", "latitude": 51.4950, "longitude": -0.1742},
-            {"name": "Daquise", "type": "Restaurant", "cuisine": "Polish", "distance": "3 min walk", "price_range": "££", "address": "20 Thurloe St", "latitude": 51.4948, "longitude": -0.1735},
-            {"name": "Byron", "type": "Restaurant", "cuisine": "American", "distance": "6 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4977, "longitude": -0.1697},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4946, "longitude": -0.1722},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4996, "longitude": -0.1712},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "5 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4959, "longitude": -0.1724},
-            {"name": "Caffè Nero", "type": "Cafe", "cuisine": "Coffee", "distance": "6 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4941, "longitude": -0.1746},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4959, "longitude": -0.1723},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Victoria and Albert Museum", "latitude": 51.4942, "longitude": -0.1693}],
-        "featured": True,
-        "rating": 4.7
-    },
-    {
-        "id": "4",
-        "name": "Science Museum",
-        "description": "The Science Museum is a major museum showcasing the development of science and technology. With over 15,000 objects on display, including the first jet engine, Stephenson's Rocket, and the Apollo 10 command module, the museum brings science to life through interactive galleries and IMAX shows.",
-        "short_description": "Interactive science and technology museum for all ages",
-        "address": "Exhibition Road, South Kensington, London SW7 2DD",
-        "latitude": 51.4978,
-        "longitude": -0.1745,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/lqwikzag_Front_of_Science_Museum_with_full__Science__logo_and_people_walking_past-1600x1066.jpg",
-        "category": "Science",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.sciencemuseum.org.uk",
-        "phone": "+44 20 7942 4000",
-        "transport": [
-            {"type": "tube", "name": "South Kensington", "line": "Circle, District, Piccadilly", "distance": "5 min walk"},
-            {"type": "bus", "name": "Exhibition Road", "routes": ["14", "49", "70", "74", "345", "414", "C1"], "distance": "3 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Deep Blue Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Science Museum", "latitude": 51.4978, "longitude": -0.1745},
-            {"name": "Cacciari's", "type": "Restaurant", "cuisine": "Italian", "distance": "4 min walk", "price_range": "££", "address": "18 Exhibition Rd", "latitude": 51.4960, "longitude": -0.1740},
-            {"name": "The Anglesea Arms", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "15 Selwood Terrace", "latitude": 51.4920, "longitude": -0.1755},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "2 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.4965, "longitude": -0.1747},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.4966, "longitude": -0.1734},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "American", "distance": "2 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.4972, "longitude": -0.1717},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.5001, "longitude": -0.1717},
-            {"name": "Byron", "type": "Restaurant", "cuisine": "American", "distance": "2 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.4986, "longitude": -0.1716},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.4975, "longitude": -0.174},
-            {"name": "Ask Italian", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Science Museum", "latitude": 51.5002, "longitude": -0.1721}],
-        "featured": True,
-        "rating": 4.6
-    },
-    {
-        "id": "5",
-        "name": "Tate Modern",
-        "description": "Housed in the former Bankside Power Station, Tate Modern is one of the world's largest museums of modern and contemporary art. The collection includes works by Picasso, Dalí, Warhol, and many contemporary artists. The Turbine Hall hosts spectacular large-scale installations.",
-        "short_description": "Britain's national gallery of international modern art",
-        "address": "Bankside, London SE1 9TG",
-        "latitude": 51.5076,
-        "longitude": -0.0994,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/akty6zrp_tate-modern-main-1.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Sun-Thu 10:00-18:00, Fri-Sat until 21:00",
-        "website": "https://www.tate.org.uk/visit/tate-modern/",
-        "phone": "+44 20 7887 8888",
-        "transport": [
-            {"type": "tube", "name": "Southwark", "line": "Jubilee", "distance": "5 min walk"},
-            {"type": "tube", "name": "Blackfriars", "line": "Circle, District", "distance": "5 min walk"},
-            {"type": "bus", "name": "Southwark Street", "routes": ["45", "63", "100", "381"], "distance": "3 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Tate Modern Restaurant", "type": "Restaurant", "cuisine": "British", "distance": "Inside museum", "price_range": "£££", "address": "Tate Modern, Level 6", "latitude": 51.5076, "longitude": -0.0994},
-            {"name": "The Anchor Bankside", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "34 Park St", "latitude": 51.5082, "longitude": -0.0932},
-            {"name": "Swan at The Globe", "type": "Restaurant", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "21 New Globe Walk", "latitude": 51.5078, "longitude": -0.0970},
-            {"name": "Ask Italian", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Tate Modern", "latitude": 51.5081, "longitude": -0.1009},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Tate Modern", "latitude": 51.5079, "longitude": -0.0971},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Tate Modern", "latitude": 51.5095, "longitude": -0.101},
-            {"name": "Côte Brasserie", "type": "Restaurant", "cuisine": "French", "distance": "3 min walk", "price_range": "££", "address": "Near Tate Modern", "latitude": 51.5092, "longitude": -0.098},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "3 min walk", "price_range": "££", "address": "Near Tate Modern", "latitude": 51.5056, "longitude": -0.1019},
-            {"name": "Greggs", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "£", "address": "Near Tate Modern", "latitude": 51.5051, "longitude": -0.0989},
-            {"name": "Zizzi", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Tate Modern", "latitude": 51.5093, "longitude": -0.0966}],
-        "featured": True,
-        "rating": 4.5
-    },
-    {
-        "id": "6",
-        "name": "National Gallery",
-        "description": "The National Gallery houses one of the greatest collections of Western European paintings from the 13th to 19th centuries. Masterpieces include works by Leonardo da Vinci, Van Gogh, Monet, Rembrandt, and Turner. Located in the heart of Trafalgar Square, it's one of London's most visited attractions.",
-        "short_description": "World-renowned collection of Western European paintings",
-        "address": "Trafalgar Square, London WC2N 5DN",
-        "latitude": 51.5089,
-        "longitude": -0.1283,
-        "image_url": "https://images.pexels.com/photos/7930261/pexels-photo-7930261.jpeg?auto=compress&cs=tinysrgb&w=800",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00, Fri until 21:00",
-        "website": "https://www.nationalgallery.org.uk",
-        "phone": "+44 20 7747 2885",
-        "transport": [
-            {"type": "tube", "name": "Charing Cross", "line": "Bakerloo, Northern", "distance": "2 min walk"},
-            {"type": "tube", "name": "Leicester Square", "line": "Northern, Piccadilly", "distance": "4 min walk"},
-            {"type": "bus", "name": "Trafalgar Square", "routes": ["3", "6", "9", "11", "13", "15", "23", "24", "87", "91"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "National Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside gallery", "price_range": "££", "address": "National Gallery", "latitude": 51.5089, "longitude": -0.1283},
-            {"name": "Cafe in the Crypt", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "St Martin-in-the-Fields", "latitude": 51.5091, "longitude": -0.1263},
-            {"name": "The Chandos", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "29 St Martin's Lane", "latitude": 51.5105, "longitude": -0.1270},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near National Gallery", "latitude": 51.5114, "longitude": -0.1299},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near National Gallery", "latitude": 51.5108, "longitude": -0.127},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near National Gallery", "latitude": 51.5103, "longitude": -0.1269},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "6 min walk", "price_range": "££", "address": "Near National Gallery", "latitude": 51.5117, "longitude": -0.1263},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "5 min walk", "price_range": "£", "address": "Near National Gallery", "latitude": 51.5109, "longitude": -0.1282},
-            {"name": "Franco Manca", "type": "Restaurant", "cuisine": "Italian", "distance": "2 min walk", "price_range": "££", "address": "Near National Gallery", "latitude": 51.5116, "longitude": -0.1311},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near National Gallery", "latitude": 51.5103, "longitude": -0.126}],
-        "featured": True,
-        "rating": 4.8
-    },
-    {
-        "id": "7",
-        "name": "Tower of London",
-        "description": "A historic castle and World Heritage Site, the Tower of London has served as royal residence, prison, and fortress for over 900 years. Home to the Crown Jewels, the Yeoman Warders (Beefeaters), and the famous ravens. Explore the medieval palace, armour collection, and learn about the tower's dark history.",
-        "short_description": "Historic royal palace with Crown Jewels and 900 years of history",
-        "address": "St Katharine's & Wapping, London EC3N 4AB",
-        "latitude": 51.5081,
-        "longitude": -0.0759,
-        "image_url": "https://images.unsplash.com/photo-1633894914370-6935b23ccbce?w=800&q=80",
-        "category": "History",
-        "free_entry": False,
-        "opening_hours": "Tue-Sat 09:00-17:00, Sun-Mon 10:00-17:00",
-        "website": "https://www.hrp.org.uk/tower-of-london",
-        "phone": "+44 20 3166 6000",
-        "transport": [
-            {"type": "tube", "name": "Tower Hill", "line": "Circle, District", "distance": "2 min walk"},
-            {"type": "train", "name": "Fenchurch Street", "line": "National Rail", "distance": "5 min walk"},
-            {"type": "bus", "name": "Tower of London", "routes": ["15", "42", "78", "100", "RV1"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "The New Armouries Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside tower", "price_range": "££", "address": "Tower of London", "latitude": 51.5081, "longitude": -0.0759},
-            {"name": "Perkin Reveller", "type": "Restaurant", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "The Wharf", "latitude": 51.5075, "longitude": -0.0770},
-            {"name": "All Bar One", "type": "Bar", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Tower Hill", "latitude": 51.5095, "longitude": -0.0760},
-            {"name": "Crussh", "type": "Cafe", "cuisine": "Healthy", "distance": "5 min walk", "price_range": "££", "address": "Near Tower of London", "latitude": 51.5064, "longitude": -0.0732},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Tower of London", "latitude": 51.5079, "longitude": -0.0741},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Near Tower of London", "latitude": 51.5051, "longitude": -0.0745},
-            {"name": "Greggs", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Near Tower of London", "latitude": 51.5081, "longitude": -0.0783},
-            {"name": "Caffè Nero", "type": "Cafe", "cuisine": "Coffee", "distance": "5 min walk", "price_range": "££", "address": "Near Tower of London", "latitude": 51.5053, "longitude": -0.0769},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Tower of London", "latitude": 51.5108, "longitude": -0.0761},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Tower of London", "latitude": 51.5088, "longitude": -0.0761}],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "8",
-        "name": "Imperial War Museum",
-        "description": "The Imperial War Museum explores the causes and consequences of modern conflict, from World War I to present day. The museum features a suspended Spitfire, V-2 rocket, and powerful Holocaust Exhibition. Interactive displays and personal stories bring history to life.",
-        "short_description": "Powerful museum exploring conflict from WWI to today",
-        "address": "Lambeth Road, London SE1 6HZ",
-        "latitude": 51.4958,
-        "longitude": -0.1086,
-        "image_url": "https://images.unsplash.com/photo-1629625368143-30acca615def?w=800&q=80",
-        "category": "Military",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.iwm.org.uk",
-        "phone": "+44 20 7416 5000",
-        "transport": [
-            {"type": "tube", "name": "Lambeth North", "line": "Bakerloo", "distance": "5 min walk"},
-            {"type": "tube", "name": "Elephant & Castle", "line": "Bakerloo, Northern", "distance": "5 min walk"},
-            {"type": "bus", "name": "Lambeth Road", "routes": ["12", "53", "148", "171", "344"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "IWM Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Imperial War Museum", "latitude": 51.4958, "longitude": -0.1086},
-            {"name": "The Old Vic Tunnels Cafe", "type": "Cafe", "cuisine": "British", "distance": "4 min walk", "price_range": "£", "address": "Lambeth Rd", "latitude": 51.4985, "longitude": -0.1095},
-            {"name": "Kennington Tandoori", "type": "Restaurant", "cuisine": "Indian", "distance": "5 min walk", "price_range": "££", "address": "313 Kennington Rd", "latitude": 51.4930, "longitude": -0.1100},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Imperial War Museum", "latitude": 51.4938, "longitude": -0.1081},
-            {"name": "Wagamama", "type": "Restaurant", "cuisine": "Japanese", "distance": "2 min walk", "price_range": "££", "address": "Near Imperial War Museum", "latitude": 51.4965, "longitude": -0.1071},
-            {"name": "Wagamama", "type": "Restaurant", "cuisine": "Japanese", "distance": "5 min walk", "price_range": "££", "address": "Near Imperial War Museum", "latitude": 51.4947, "longitude": -0.1069},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "6 min walk", "price_range": "£", "address": "Near Imperial War Museum", "latitude": 51.4928, "longitude": -0.1105},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "£", "address": "Near Imperial War Museum", "latitude": 51.4955, "longitude": -0.1116},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "2 min walk", "price_range": "££", "address": "Near Imperial War Museum", "latitude": 51.4928, "longitude": -0.1102},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Imperial War Museum", "latitude": 51.4932, "longitude": -0.1097}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "9",
-        "name": "Museum of London",
-        "description": "Discover the story of London and its people from prehistoric times to the present day. The museum features the Lord Mayor's State Coach, Victorian streets, and the story of the Great Fire. Temporary exhibitions explore contemporary London life.",
-        "short_description": "Explore London's fascinating story from prehistory to today",
-        "address": "150 London Wall, London EC2Y 5HN",
-        "latitude": 51.5176,
-        "longitude": -0.0967,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/159nivlf_Museum-of-London-4266.jpg",
-        "category": "History",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.museumoflondon.org.uk",
-        "phone": "+44 20 7001 9844",
-        "transport": [
-            {"type": "tube", "name": "Barbican", "line": "Circle, Hammersmith & City, Metropolitan", "distance": "4 min walk"},
-            {"type": "tube", "name": "St Paul's", "line": "Central", "distance": "5 min walk"},
-            {"type": "bus", "name": "London Wall", "routes": ["4", "8", "25", "56", "100", "172", "521"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Museum Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Museum of London", "latitude": 51.5176, "longitude": -0.0967},
-            {"name": "The Jugged Hare", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "49 Chiswell St", "latitude": 51.5195, "longitude": -0.0920},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "Sandwiches", "distance": "3 min walk", "price_range": "£", "address": "1 Ropemaker St", "latitude": 51.5190, "longitude": -0.0945},
-            {"name": "Greggs", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "£", "address": "Near Museum of London", "latitude": 51.5159, "longitude": -0.0989},
-            {"name": "Dishoom", "type": "Restaurant", "cuisine": "Indian", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of London", "latitude": 51.5202, "longitude": -0.0968},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Museum of London", "latitude": 51.5175, "longitude": -0.0993},
-            {"name": "Dishoom", "type": "Restaurant", "cuisine": "Indian", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of London", "latitude": 51.5174, "longitude": -0.0962},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of London", "latitude": 51.5179, "longitude": -0.0976},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Museum of London", "latitude": 51.5148, "longitude": -0.0952},
-            {"name": "Byron", "type": "Restaurant", "cuisine": "American", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of London", "latitude": 51.5158, "longitude": -0.0971}],
-        "featured": False,
-        "rating": 4.4
-    },
-    {
-        "id": "10",
-        "name": "National Portrait Gallery",
-        "description": "The National Portrait Gallery houses the world's largest collection of portraits, featuring famous British faces from Tudor monarchs to contemporary celebrities. Recent renovations have transformed the gallery with new spaces and improved displays.",
-        "short_description": "World's largest collection of portraits of famous Britons",
-        "address": "St Martin's Place, London WC2H 0HE",
-        "latitude": 51.5094,
-        "longitude": -0.1281,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/9sar874z_reynolds_1.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:30-18:00, Fri until 21:00",
-        "website": "https://www.npg.org.uk",
-        "phone": "+44 20 7306 0055",
-        "transport": [
-            {"type": "tube", "name": "Leicester Square", "line": "Northern, Piccadilly", "distance": "2 min walk"},
-            {"type": "tube", "name": "Charing Cross", "line": "Bakerloo, Northern", "distance": "3 min walk"},
-            {"type": "bus", "name": "Trafalgar Square", "routes": ["24", "29", "176"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Portrait Restaurant", "type": "Restaurant", "cuisine": "British", "distance": "Inside gallery", "price_range": "£££", "address": "National Portrait Gallery", "latitude": 51.5094, "longitude": -0.1281},
-            {"name": "Gordon's Wine Bar", "type": "Wine Bar", "cuisine": "European", "distance": "4 min walk", "price_range": "££", "address": "47 Villiers St", "latitude": 51.5078, "longitude": -0.1240},
-            {"name": "The Chandos", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "£", "address": "29 St Martin's Lane", "latitude": 51.5105, "longitude": -0.1270},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near National Portrait Gallery", "latitude": 51.5092, "longitude": -0.1263},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near National Portrait Gallery", "latitude": 51.5106, "longitude": -0.128},
-            {"name": "Wagamama", "type": "Restaurant", "cuisine": "Japanese", "distance": "5 min walk", "price_range": "££", "address": "Near National Portrait Gallery", "latitude": 51.5111, "longitude": -0.1308},
-            {"name": "Caffè Nero", "type": "Cafe", "cuisine": "Coffee", "distance": "2 min walk", "price_range": "££", "address": "Near National Portrait Gallery", "latitude": 51.5073, "longitude": -0.1288},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "2 min walk", "price_range": "££", "address": "Near National Portrait Gallery", "latitude": 51.5123, "longitude": -0.1289},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near National Portrait Gallery", "latitude": 51.5095, "longitude": -0.126},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "5 min walk", "price_range": "£", "address": "Near National Portrait Gallery", "latitude": 51.5066, "longitude": -0.1299}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "11",
-        "name": "Sir John Soane's Museum",
-        "description": "One of London's hidden gems, this unique museum is the former home of architect Sir John Soane, preserved exactly as he left it. Packed with antiquities, paintings, and architectural curiosities including the sarcophagus of Seti I and works by Hogarth.",
-        "short_description": "Quirky museum in the former home of architect Sir John Soane",
-        "address": "13 Lincoln's Inn Fields, London WC2A 3BP",
-        "latitude": 51.5170,
-        "longitude": -0.1177,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/j8l4bv5m_Sir_John_Soane_Museum_%2813952611347%29.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Wed-Sun 10:00-17:00",
-        "website": "https://www.soane.org",
-        "phone": "+44 20 7405 2107",
-        "transport": [
-            {"type": "tube", "name": "Holborn", "line": "Central, Piccadilly", "distance": "5 min walk"},
-            {"type": "bus", "name": "Kingsway", "routes": ["1", "59", "68", "91", "168", "171", "188"], "distance": "3 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "The Seven Stars", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "53-54 Carey St", "latitude": 51.5155, "longitude": -0.1150},
-            {"name": "Terroirs", "type": "Wine Bar", "cuisine": "French", "distance": "4 min walk", "price_range": "££", "address": "5 William IV St", "latitude": 51.5112, "longitude": -0.1265},
-            {"name": "Flat Iron", "type": "Restaurant", "cuisine": "Steak", "distance": "5 min walk", "price_range": "££", "address": "17-18 Henrietta St", "latitude": 51.5115, "longitude": -0.1233},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "American", "distance": "5 min walk", "price_range": "££", "address": "Near Sir John Soane's Museum", "latitude": 51.515, "longitude": -0.1184},
-            {"name": "Prezzo", "type": "Restaurant", "cuisine": "Italian", "distance": "4 min walk", "price_range": "££", "address": "Near Sir John Soane's Museum", "latitude": 51.5195, "longitude": -0.1202},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Sir John Soane's Museum", "latitude": 51.5164, "longitude": -0.1193},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "6 min walk", "price_range": "££", "address": "Near Sir John Soane's Museum", "latitude": 51.5153, "longitude": -0.1168},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "2 min walk", "price_range": "££", "address": "Near Sir John Soane's Museum", "latitude": 51.5188, "longitude": -0.1184},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Sir John Soane's Museum", "latitude": 51.5181, "longitude": -0.1157},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "6 min walk", "price_range": "£", "address": "Near Sir John Soane's Museum", "latitude": 51.5184, "longitude": -0.1169}],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "12",
-        "name": "Design Museum",
-        "description": "The Design Museum is dedicated to contemporary design in all its forms. Located in a stunning former Commonwealth Institute building, the museum showcases innovation in fashion, architecture, graphics, digital, and product design through changing exhibitions.",
-        "short_description": "Contemporary design museum in stunning Kensington building",
-        "address": "224-238 Kensington High Street, London W8 6AG",
-        "latitude": 51.4995,
-        "longitude": -0.1989,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/zu3ot9lm_design-museum.png",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.designmuseum.org",
-        "phone": "+44 20 3862 5900",
-        "transport": [
-            {"type": "tube", "name": "High Street Kensington", "line": "Circle, District", "distance": "5 min walk"},
-            {"type": "bus", "name": "Kensington High Street", "routes": ["9", "10", "27", "28", "49", "328", "C1"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Parabola", "type": "Restaurant", "cuisine": "Mediterranean", "distance": "Inside museum", "price_range": "£££", "address": "Design Museum", "latitude": 51.4995, "longitude": -0.1989},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "Burgers", "distance": "4 min walk", "price_range": "££", "address": "194 Kensington High St", "latitude": 51.5005, "longitude": -0.1942},
-            {"name": "Wagamama", "type": "Restaurant", "cuisine": "Japanese", "distance": "5 min walk", "price_range": "££", "address": "26 Kensington High St", "latitude": 51.5010, "longitude": -0.1920},
-            {"name": "Greggs", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "£", "address": "Near Design Museum", "latitude": 51.4995, "longitude": -0.2008},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "2 min walk", "price_range": "£", "address": "Near Design Museum", "latitude": 51.4993, "longitude": -0.1988},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Design Museum", "latitude": 51.5003, "longitude": -0.1999},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Design Museum", "latitude": 51.502, "longitude": -0.1989},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Design Museum", "latitude": 51.4969, "longitude": -0.1979},
-            {"name": "Prezzo", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Design Museum", "latitude": 51.5, "longitude": -0.2},
-            {"name": "Busaba Eathai", "type": "Restaurant", "cuisine": "Thai", "distance": "5 min walk", "price_range": "££", "address": "Near Design Museum", "latitude": 51.4977, "longitude": -0.1983}],
-        "featured": False,
-        "rating": 4.4
-    },
-    {
-        "id": "13",
-        "name": "Wallace Collection",
-        "description": "A hidden treasure in a beautiful Georgian townhouse, the Wallace Collection contains one of the finest collections of arms and armour, French 18th-century paintings, porcelain, and furniture in the world. The stunning Great Gallery features works by Titian, Rembrandt, and Velázquez.",
-        "short_description": "Exquisite collection of fine and decorative arts",
-        "address": "Hertford House, Manchester Square, London W1U 3BN",
-        "latitude": 51.5177,
-        "longitude": -0.1530,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/2jlbht61_Wallace-Collection-Image-by-Chrispictures-Shutterstock-scaled.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-17:00",
-        "website": "https://www.wallacecollection.org",
-        "phone": "+44 20 7563 9500",
-        "transport": [
-            {"type": "tube", "name": "Bond Street", "line": "Central, Jubilee", "distance": "5 min walk"},
-            {"type": "tube", "name": "Baker Street", "line": "Bakerloo, Circle, Hammersmith & City, Jubilee, Metropolitan", "distance": "5 min walk"},
-            {"type": "bus", "name": "Wigmore Street", "routes": ["2", "13", "30", "74", "82", "113", "274"], "distance": "3 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Wallace Restaurant", "type": "Restaurant", "cuisine": "French", "distance": "Inside museum", "price_range": "£££", "address": "Wallace Collection", "latitude": 51.5177, "longitude": -0.1530},
-            {"name": "Paul", "type": "Cafe", "cuisine": "French", "distance": "4 min walk", "price_range": "££", "address": "115 Marylebone High St", "latitude": 51.5200, "longitude": -0.1520},
-            {"name": "The Grazing Goat", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "6 New Quebec St", "latitude": 51.5175, "longitude": -0.1600},
-            {"name": "Bella Italia", "type": "Restaurant", "cuisine": "Italian", "distance": "3 min walk", "price_range": "££", "address": "Near Wallace Collection", "latitude": 51.5173, "longitude": -0.1506},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "2 min walk", "price_range": "£", "address": "Near Wallace Collection", "latitude": 51.5164, "longitude": -0.1535},
-            {"name": "Bella Italia", "type": "Restaurant", "cuisine": "Italian", "distance": "4 min walk", "price_range": "££", "address": "Near Wallace Collection", "latitude": 51.5197, "longitude": -0.1513},
-            {"name": "Greggs", "type": "Cafe", "cuisine": "British", "distance": "5 min walk", "price_range": "£", "address": "Near Wallace Collection", "latitude": 51.5185, "longitude": -0.1545},
-            {"name": "Busaba Eathai", "type": "Restaurant", "cuisine": "Thai", "distance": "5 min walk", "price_range": "££", "address": "Near Wallace Collection", "latitude": 51.5183, "longitude": -0.1556},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Wallace Collection", "latitude": 51.5177, "longitude": -0.1539},
-            {"name": "Caffè Nero", "type": "Cafe", "cuisine": "Coffee", "distance": "6 min walk", "price_range": "££", "address": "Near Wallace Collection", "latitude": 51.5163, "longitude": -0.1522}],
-        "featured": False,
-        "rating": 4.7
-    },
-    {
-        "id": "14",
-        "name": "Tate Britain",
-        "description": "Tate Britain is the world's largest collection of British art from 1500 to the present day. The gallery houses masterpieces by Turner, Constable, the Pre-Raphaelites, and contemporary British artists. The Turner Bequest alone contains over 300 oil paintings.",
-        "short_description": "World's greatest collection of British art",
-        "address": "Millbank, London SW1P 4RG",
-        "latitude": 51.4910,
-        "longitude": -0.1277,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/8ghdlujr_Tate_Britain_%285822081512%29_%282%29.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.tate.org.uk/visit/tate-britain",
-        "phone": "+44 20 7887 8888",
-        "transport": [
-            {"type": "tube", "name": "Pimlico", "line": "Victoria", "distance": "5 min walk"},
-            {"type": "bus", "name": "Millbank", "routes": ["2", "36", "87", "88", "185", "C10"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Tate Britain Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside gallery", "price_range": "££", "address": "Tate Britain", "latitude": 51.4910, "longitude": -0.1277},
-            {"name": "Regency Cafe", "type": "Cafe", "cuisine": "British", "distance": "4 min walk", "price_range": "£", "address": "17-19 Regency St", "latitude": 51.4928, "longitude": -0.1325},
-            {"name": "Page Street Cafe", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Page St", "latitude": 51.4922, "longitude": -0.1290},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "2 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.4918, "longitude": -0.1267},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.4904, "longitude": -0.1272},
-            {"name": "Starbucks", "type": "Cafe", "cuisine": "Coffee", "distance": "3 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.4895, "longitude": -0.1277},
-            {"name": "Dishoom", "type": "Restaurant", "cuisine": "Indian", "distance": "6 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.494, "longitude": -0.13},
-            {"name": "Dishoom", "type": "Restaurant", "cuisine": "Indian", "distance": "2 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.491, "longitude": -0.128},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.4913, "longitude": -0.1253},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "2 min walk", "price_range": "££", "address": "Near Tate Britain", "latitude": 51.4901, "longitude": -0.1267}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "15",
-        "name": "Royal Academy of Arts",
-        "description": "Britain's first art school, the Royal Academy hosts major exhibitions throughout the year and the famous Summer Exhibition. The recently expanded galleries showcase the RA's permanent collection and temporary shows featuring world-renowned artists.",
-        "short_description": "Historic institution with major art exhibitions",
-        "address": "Burlington House, Piccadilly, London W1J 0BD",
-        "latitude": 51.5093,
-        "longitude": -0.1395,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/xkyjl1hh_yult10i6tluuvubukgku.jpg",
-        "category": "Art",
-        "free_entry": False,
-        "opening_hours": "Sat-Thu 10:00-18:00, Fri until 21:00",
-        "website": "https://www.royalacademy.org.uk",
-        "phone": "+44 20 7300 8000",
-        "transport": [
-            {"type": "tube", "name": "Piccadilly Circus", "line": "Bakerloo, Piccadilly", "distance": "3 min walk"},
-            {"type": "tube", "name": "Green Park", "line": "Jubilee, Piccadilly, Victoria", "distance": "4 min walk"},
-            {"type": "bus", "name": "Piccadilly", "routes": ["9", "14", "19", "22", "38"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "RA Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Royal Academy", "latitude": 51.5093, "longitude": -0.1395},
-            {"name": "Fortnum's Tea Salon", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "£££", "address": "181 Piccadilly", "latitude": 51.5085, "longitude": -0.1385},
-            {"name": "Brasserie Zedel", "type": "Restaurant", "cuisine": "French", "distance": "4 min walk", "price_range": "££", "address": "20 Sherwood St", "latitude": 51.5102, "longitude": -0.1355},
-            {"name": "Nando's", "type": "Restaurant", "cuisine": "Portuguese", "distance": "5 min walk", "price_range": "££", "address": "Near Royal Academy of Arts", "latitude": 51.5072, "longitude": -0.1381},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "5 min walk", "price_range": "£", "address": "Near Royal Academy of Arts", "latitude": 51.5088, "longitude": -0.142},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Royal Academy of Arts", "latitude": 51.5076, "longitude": -0.1416},
-            {"name": "Pizza Express", "type": "Restaurant", "cuisine": "Italian", "distance": "2 min walk", "price_range": "££", "address": "Near Royal Academy of Arts", "latitude": 51.5099, "longitude": -0.1414},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Royal Academy of Arts", "latitude": 51.5078, "longitude": -0.1423},
-            {"name": "Côte Brasserie", "type": "Restaurant", "cuisine": "French", "distance": "3 min walk", "price_range": "££", "address": "Near Royal Academy of Arts", "latitude": 51.5107, "longitude": -0.1424},
-            {"name": "Prezzo", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Royal Academy of Arts", "latitude": 51.5093, "longitude": -0.141}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "16",
-        "name": "Horniman Museum",
-        "description": "The Horniman Museum in Forest Hill offers a unique blend of natural history, anthropology, and music. Famous for its overstuffed walrus and extensive musical instrument collection, the museum also features beautiful gardens with stunning views of London.",
-        "short_description": "Quirky museum of natural history, world cultures, and music",
-        "address": "100 London Road, Forest Hill, London SE23 3PQ",
-        "latitude": 51.4413,
-        "longitude": -0.0600,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/u0668h6y_Horniman-Andrew-Lee-not-to-be-used-for-commercial-purposes.jpg",
-        "category": "Culture",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-17:30",
-        "website": "https://www.horniman.ac.uk",
-        "phone": "+44 20 8699 1872",
-        "transport": [
-            {"type": "train", "name": "Forest Hill", "line": "London Overground", "distance": "5 min walk"},
-            {"type": "bus", "name": "Horniman Museum", "routes": ["176", "185", "197", "356", "P4"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Horniman Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "£", "address": "Horniman Museum", "latitude": 51.4413, "longitude": -0.0600},
-            {"name": "The Hill Station", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "5 Dartmouth Rd", "latitude": 51.4420, "longitude": -0.0580},
-            {"name": "Brown & Green", "type": "Cafe", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "20 London Rd", "latitude": 51.4400, "longitude": -0.0585},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "6 min walk", "price_range": "££", "address": "Near Horniman Museum", "latitude": 51.4424, "longitude": -0.0596},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Near Horniman Museum", "latitude": 51.4419, "longitude": -0.0609},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Horniman Museum", "latitude": 51.4399, "longitude": -0.0574},
-            {"name": "Busaba Eathai", "type": "Restaurant", "cuisine": "Thai", "distance": "3 min walk", "price_range": "££", "address": "Near Horniman Museum", "latitude": 51.4388, "longitude": -0.0579},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Horniman Museum", "latitude": 51.4413, "longitude": -0.0614},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Horniman Museum", "latitude": 51.4402, "longitude": -0.0601},
-            {"name": "Bella Italia", "type": "Restaurant", "cuisine": "Italian", "distance": "6 min walk", "price_range": "££", "address": "Near Horniman Museum", "latitude": 51.442, "longitude": -0.0575}],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "17",
-        "name": "London Transport Museum",
-        "description": "Explore the history of London's transport from horse-drawn buses to the Elizabeth line. Interactive exhibits let you drive a tube train simulator, and the collection includes vintage buses, trams, and tube trains. Perfect for families.",
-        "short_description": "Interactive museum of London's iconic transport history",
-        "address": "Covent Garden Piazza, London WC2E 7BB",
-        "latitude": 51.5117,
-        "longitude": -0.1217,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/79ngn0zg_330px-London_Transport_Museum_%2842206944281%29.jpg",
-        "category": "Transport",
-        "free_entry": False,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.ltmuseum.co.uk",
-        "phone": "+44 20 7379 6344",
-        "transport": [
-            {"type": "tube", "name": "Covent Garden", "line": "Piccadilly", "distance": "2 min walk"},
-            {"type": "tube", "name": "Leicester Square", "line": "Northern, Piccadilly", "distance": "4 min walk"},
-            {"type": "bus", "name": "Aldwych", "routes": ["6", "9", "11", "13", "15", "23", "87", "91"], "distance": "3 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Upper Deck Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "£", "address": "London Transport Museum", "latitude": 51.5117, "longitude": -0.1217},
-            {"name": "Hawksmoor Seven Dials", "type": "Restaurant", "cuisine": "Steak", "distance": "8 min walk", "price_range": "£££", "address": "11 Langley St", "latitude": 51.5145, "longitude": -0.1265},
-            {"name": "Shake Shack", "type": "Restaurant", "cuisine": "American", "distance": "3 min walk", "price_range": "££", "address": "24 Market Building", "latitude": 51.5120, "longitude": -0.1230},
-            {"name": "Côte Brasserie", "type": "Restaurant", "cuisine": "French", "distance": "3 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5128, "longitude": -0.1208},
-            {"name": "Crussh", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5131, "longitude": -0.1215},
-            {"name": "Nando's", "type": "Restaurant", "cuisine": "Portuguese", "distance": "3 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5089, "longitude": -0.1206},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5125, "longitude": -0.1211},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5097, "longitude": -0.1219},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5107, "longitude": -0.1198},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near London Transport Museum", "latitude": 51.5133, "longitude": -0.1224}],
-        "featured": False,
-        "rating": 4.4
-    },
-    {
-        "id": "18",
-        "name": "Churchill War Rooms",
-        "description": "Step back in time to the secret underground headquarters where Winston Churchill and his war cabinet directed WWII. The original rooms remain exactly as they were in 1945, with maps, telephones, and the famous Map Room frozen in time.",
-        "short_description": "Churchill's secret WWII underground headquarters",
-        "address": "Clive Steps, King Charles Street, London SW1A 2AQ",
-        "latitude": 51.5021,
-        "longitude": -0.1290,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/vnp437cu_df%20%281%29.jpg",
-        "category": "Military",
-        "free_entry": False,
-        "opening_hours": "Daily 09:30-18:00",
-        "website": "https://www.iwm.org.uk/visits/churchill-war-rooms",
-        "phone": "+44 20 7416 5000",
-        "transport": [
-            {"type": "tube", "name": "Westminster", "line": "Circle, District, Jubilee", "distance": "4 min walk"},
-            {"type": "tube", "name": "St James's Park", "line": "Circle, District", "distance": "5 min walk"},
-            {"type": "bus", "name": "Parliament Street", "routes": ["3", "11", "12", "24", "87", "88", "159"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Switch House Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Churchill War Rooms", "latitude": 51.5021, "longitude": -0.1290},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "48 Parliament St", "latitude": 51.5015, "longitude": -0.1260},
-            {"name": "Westminster Arms", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "9 Storey's Gate", "latitude": 51.5000, "longitude": -0.1290},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5046, "longitude": -0.1294},
-            {"name": "Côte Brasserie", "type": "Restaurant", "cuisine": "French", "distance": "4 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5045, "longitude": -0.1278},
-            {"name": "Caffè Nero", "type": "Cafe", "cuisine": "Coffee", "distance": "5 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5012, "longitude": -0.1281},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5007, "longitude": -0.1295},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5012, "longitude": -0.1268},
-            {"name": "Starbucks", "type": "Cafe", "cuisine": "Coffee", "distance": "3 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5007, "longitude": -0.1264},
-            {"name": "Wagamama", "type": "Restaurant", "cuisine": "Japanese", "distance": "5 min walk", "price_range": "££", "address": "Near Churchill War Rooms", "latitude": 51.5046, "longitude": -0.1291}],
-        "featured": False,
-        "rating": 4.7
-    },
-    {
-        "id": "19",
-        "name": "Museum of the Home",
-        "description": "Explore 400 years of British home life through a series of period rooms from 1600 to the present day. The museum showcases how living spaces, furniture, and domestic life have evolved through the centuries.",
-        "short_description": "Discover 400 years of British home life and interiors",
-        "address": "136 Kingsland Road, London E2 8EA",
-        "latitude": 51.5318,
-        "longitude": -0.0765,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/b20isvaj_MotH_2021_Redevelopment-by-WrightWright_Credit-HuftonCrow_003-scaled%20%281%29.jpg",
-        "category": "History",
-        "free_entry": True,
-        "opening_hours": "Tue-Sun 10:00-17:00",
-        "website": "https://www.museumofthehome.org.uk",
-        "phone": "+44 20 7739 9893",
-        "transport": [
-            {"type": "tube", "name": "Hoxton", "line": "London Overground", "distance": "5 min walk"},
-            {"type": "bus", "name": "Kingsland Road", "routes": ["67", "149", "242", "243"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Museum Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "£", "address": "Museum of the Home", "latitude": 51.5318, "longitude": -0.0765},
-            {"name": "Song Que", "type": "Restaurant", "cuisine": "Vietnamese", "distance": "2 min walk", "price_range": "£", "address": "134 Kingsland Rd", "latitude": 51.5320, "longitude": -0.0760},
-            {"name": "The Owl & Pussycat", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "34 Redchurch St", "latitude": 51.5240, "longitude": -0.0750},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5334, "longitude": -0.0759},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "6 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5344, "longitude": -0.0791},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5291, "longitude": -0.0766},
-            {"name": "Crussh", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5301, "longitude": -0.0789},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5319, "longitude": -0.0769},
-            {"name": "Bella Italia", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5317, "longitude": -0.0771},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "4 min walk", "price_range": "££", "address": "Near Museum of the Home", "latitude": 51.5299, "longitude": -0.0777}],
-        "featured": False,
-        "rating": 4.3
-    },
-    {
-        "id": "20",
-        "name": "Wellcome Collection",
-        "description": "A free museum exploring health, life, and our place in the world. Combining medicine, science, art, and life, the Wellcome Collection features thought-provoking exhibitions that challenge our understanding of what it means to be human.",
-        "short_description": "Free museum exploring health, medicine, and human experience",
-        "address": "183 Euston Road, London NW1 2BE",
-        "latitude": 51.5258,
-        "longitude": -0.1338,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/ndh1cv98_wellcome-collection_exterior-wellcome-collection-photo-kathleen-arundell-image-courtesy-of-wellcome-collection_2e5e75571d5bb7ea58847a1db647752b.jpg",
-        "category": "Science",
-        "free_entry": True,
-        "opening_hours": "Tue-Sun 10:00-18:00, Thu until 21:00",
-        "website": "https://www.wellcomecollection.org",
-        "phone": "+44 20 7611 2222",
-        "transport": [
-            {"type": "tube", "name": "Euston", "line": "Northern, Victoria", "distance": "3 min walk"},
-            {"type": "tube", "name": "Euston Square", "line": "Circle, Hammersmith & City, Metropolitan", "distance": "4 min walk"},
-            {"type": "bus", "name": "Euston Road", "routes": ["10", "18", "30", "73", "205", "390"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Wellcome Kitchen", "type": "Restaurant", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Wellcome Collection", "latitude": 51.5258, "longitude": -0.1338},
-            {"name": "Caravan", "type": "Restaurant", "cuisine": "International", "distance": "4 min walk", "price_range": "££", "address": "1 Granary Square", "latitude": 51.5355, "longitude": -0.1260},
-            {"name": "The Euston Tap", "type": "Pub", "cuisine": "Craft Beer", "distance": "3 min walk", "price_range": "££", "address": "190 Euston Rd", "latitude": 51.5275, "longitude": -0.1320},
-            {"name": "Byron", "type": "Restaurant", "cuisine": "American", "distance": "3 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5262, "longitude": -0.1338},
-            {"name": "The Kings Arms", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5255, "longitude": -0.1335},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "5 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5261, "longitude": -0.1342},
-            {"name": "Pizza Express", "type": "Restaurant", "cuisine": "Italian", "distance": "3 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5253, "longitude": -0.1317},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5279, "longitude": -0.1365},
-            {"name": "The Old Crown", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5283, "longitude": -0.1319},
-            {"name": "Ask Italian", "type": "Restaurant", "cuisine": "Italian", "distance": "2 min walk", "price_range": "££", "address": "Near Wellcome Collection", "latitude": 51.5234, "longitude": -0.1356}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "21",
-        "name": "The Postal Museum",
-        "description": "The Postal Museum tells the story of 500 years of British postal history, from the first stamp to the present day. The highlight is Mail Rail, a unique underground railway ride through the original tunnels that once transported millions of letters beneath London's streets. Interactive galleries explore communication, technology, and the social history of the postal service.",
-        "short_description": "Discover 500 years of postal history and ride the Mail Rail underground",
-        "address": "15-20 Phoenix Place, London WC1X 0DA",
-        "latitude": 51.5278,
-        "longitude": -0.1099,
-        "image_url": "https://upload.wikimedia.org/wikipedia/commons/2/22/Postal_Museum%2C_Phoenix_Place_-_geograph.org.uk_-_7206605.jpg",
-        "category": "Transport",
-        "free_entry": False,
-        "opening_hours": "Tue-Sun 10:00-17:00",
-        "website": "https://www.postalmuseum.org",
-        "phone": "+44 20 7239 2570",
-        "transport": [
-            {"type": "tube", "name": "Farringdon", "line": "Circle, Hammersmith & City, Metropolitan, Elizabeth", "distance": "5 min walk"},
-            {"type": "tube", "name": "Chancery Lane", "line": "Central", "distance": "7 min walk"},
-            {"type": "bus", "name": "Mount Pleasant", "routes": ["19", "38", "55", "243"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "The Postal Museum Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "£", "address": "The Postal Museum", "latitude": 51.5278, "longitude": -0.1099},
-            {"name": "The Betsey Trotwood", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "56 Farringdon Rd", "latitude": 51.5245, "longitude": -0.1090},
-            {"name": "Exmouth Market Food Stalls", "type": "Market", "cuisine": "International", "distance": "5 min walk", "price_range": "£", "address": "Exmouth Market", "latitude": 51.5265, "longitude": -0.1120},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "3 min walk", "price_range": "£", "address": "Near The Postal Museum", "latitude": 51.5272, "longitude": -0.1099},
-            {"name": "Pizza Express", "type": "Restaurant", "cuisine": "Italian", "distance": "2 min walk", "price_range": "££", "address": "Near The Postal Museum", "latitude": 51.5304, "longitude": -0.1082},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "6 min walk", "price_range": "£", "address": "Near The Postal Museum", "latitude": 51.5291, "longitude": -0.1129},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near The Postal Museum", "latitude": 51.5262, "longitude": -0.1106},
-            {"name": "Dishoom", "type": "Restaurant", "cuisine": "Indian", "distance": "2 min walk", "price_range": "££", "address": "Near The Postal Museum", "latitude": 51.5304, "longitude": -0.1125},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near The Postal Museum", "latitude": 51.5304, "longitude": -0.1106},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "5 min walk", "price_range": "£", "address": "Near The Postal Museum", "latitude": 51.526, "longitude": -0.1093}],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "22",
-        "name": "National Maritime Museum",
-        "description": "The National Maritime Museum in Greenwich is the world's largest maritime museum, exploring Britain's seafaring history and its impact on the world. The collection includes navigational instruments, ship models, and Nelson's uniform from the Battle of Trafalgar. The museum is part of Royal Museums Greenwich, alongside the Royal Observatory and Queen's House.",
-        "short_description": "World's largest maritime museum in historic Greenwich",
-        "address": "Romney Road, Greenwich, London SE10 9NF",
-        "latitude": 51.4810,
-        "longitude": -0.0052,
-        "image_url": "https://images.unsplash.com/photo-1730076784818-ba681289fd58?w=800&q=80",
-        "category": "History",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-17:00",
-        "website": "https://www.rmg.co.uk/national-maritime-museum",
-        "phone": "+44 20 8312 6608",
-        "transport": [
-            {"type": "dlr", "name": "Cutty Sark", "line": "DLR", "distance": "5 min walk"},
-            {"type": "train", "name": "Greenwich", "line": "Southeastern", "distance": "8 min walk"},
-            {"type": "river", "name": "Greenwich Pier", "line": "Thames Clipper", "distance": "10 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Pavilion Tea House", "type": "Cafe", "cuisine": "British", "distance": "Inside Greenwich Park", "price_range": "££", "address": "Greenwich Park", "latitude": 51.4778, "longitude": -0.0019},
-            {"name": "Old Brewery", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Old Royal Naval College", "latitude": 51.4826, "longitude": -0.0098},
-            {"name": "Goddards at Greenwich", "type": "Restaurant", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "22 King William Walk", "latitude": 51.4830, "longitude": -0.0092},
-            {"name": "Wahaca", "type": "Restaurant", "cuisine": "Mexican", "distance": "2 min walk", "price_range": "££", "address": "Near National Maritime Museum", "latitude": 51.4813, "longitude": -0.0075},
-            {"name": "Crussh", "type": "Cafe", "cuisine": "Healthy", "distance": "2 min walk", "price_range": "££", "address": "Near National Maritime Museum", "latitude": 51.4834, "longitude": -0.0073},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "American", "distance": "2 min walk", "price_range": "££", "address": "Near National Maritime Museum", "latitude": 51.4811, "longitude": -0.0034},
-            {"name": "Greggs", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Near National Maritime Museum", "latitude": 51.4823, "longitude": -0.0058},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "5 min walk", "price_range": "££", "address": "Near National Maritime Museum", "latitude": 51.4815, "longitude": -0.0073},
-            {"name": "Wahaca", "type": "Restaurant", "cuisine": "Mexican", "distance": "4 min walk", "price_range": "££", "address": "Near National Maritime Museum", "latitude": 51.4786, "longitude": -0.0064},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near National Maritime Museum", "latitude": 51.4813, "longitude": -0.0045}],
-        "featured": False,
-        "rating": 4.7
-    },
-    {
-        "id": "23",
-        "name": "Courtauld Gallery",
-        "description": "The Courtauld Gallery at Somerset House houses one of the greatest collections of Impressionist and Post-Impressionist paintings in the world. Highlights include masterpieces by Manet, Monet, Renoir, Cézanne, Van Gogh, and Gauguin. The gallery underwent a major transformation and reopened in 2021 with enhanced displays.",
-        "short_description": "World-renowned collection of Impressionist masterpieces",
-        "address": "Somerset House, Strand, London WC2R 0RN",
-        "latitude": 51.5111,
-        "longitude": -0.1175,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/mt9t7nn5_Courtauld-exterior_new_small.jpg",
-        "category": "Art",
-        "free_entry": False,
-        "opening_hours": "Daily 10:00-18:00, last entry 17:15",
-        "website": "https://www.courtauld.ac.uk/gallery",
-        "phone": "+44 20 7848 2526",
-        "transport": [
-            {"type": "tube", "name": "Temple", "line": "Circle, District", "distance": "3 min walk"},
-            {"type": "tube", "name": "Covent Garden", "line": "Piccadilly", "distance": "8 min walk"},
-            {"type": "tube", "name": "Embankment", "line": "Bakerloo, Circle, District, Northern", "distance": "6 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Spring Restaurant", "type": "Restaurant", "cuisine": "Modern British", "distance": "Inside Somerset House", "price_range": "£££", "address": "Somerset House", "latitude": 51.5111, "longitude": -0.1175},
-            {"name": "Fernandez & Wells", "type": "Cafe", "cuisine": "European", "distance": "Inside Somerset House", "price_range": "££", "address": "Somerset House", "latitude": 51.5111, "longitude": -0.1175},
-            {"name": "Gordon's Wine Bar", "type": "Bar", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "47 Villiers St", "latitude": 51.5078, "longitude": -0.1227},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5134, "longitude": -0.1193},
-            {"name": "The George", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5114, "longitude": -0.1167},
-            {"name": "Starbucks", "type": "Cafe", "cuisine": "Coffee", "distance": "5 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5135, "longitude": -0.1188},
-            {"name": "Joe & The Juice", "type": "Cafe", "cuisine": "Healthy", "distance": "2 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5105, "longitude": -0.1155},
-            {"name": "Prezzo", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5094, "longitude": -0.1186},
-            {"name": "Crussh", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5138, "longitude": -0.1159},
-            {"name": "Starbucks", "type": "Cafe", "cuisine": "Coffee", "distance": "4 min walk", "price_range": "££", "address": "Near Courtauld Gallery", "latitude": 51.5085, "longitude": -0.1163}],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "24",
-        "name": "Saatchi Gallery",
-        "description": "The Saatchi Gallery is a leading contemporary art gallery showcasing cutting-edge work by emerging and established international artists. Housed in the Duke of York's Headquarters in Chelsea, the gallery is known for championing new artists and presenting thought-provoking exhibitions that often spark public debate.",
-        "short_description": "Contemporary art gallery showcasing emerging artists",
-        "address": "Duke of York's HQ, King's Road, London SW3 4RY",
-        "latitude": 51.4908,
-        "longitude": -0.1631,
-        "image_url": "https://images.unsplash.com/photo-1563095292-77c321bb8a35?w=800&q=80",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Daily 10:00-18:00",
-        "website": "https://www.saatchigallery.com",
-        "phone": "+44 20 7811 3070",
-        "transport": [
-            {"type": "tube", "name": "Sloane Square", "line": "Circle, District", "distance": "5 min walk"},
-            {"type": "bus", "name": "King's Road", "routes": ["11", "19", "22", "211", "319"], "distance": "2 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Saatchi Gallery Cafe", "type": "Cafe", "cuisine": "Modern European", "distance": "Inside gallery", "price_range": "££", "address": "Saatchi Gallery", "latitude": 51.4908, "longitude": -0.1631},
-            {"name": "Bluebird Chelsea", "type": "Restaurant", "cuisine": "British", "distance": "3 min walk", "price_range": "£££", "address": "350 King's Road", "latitude": 51.4883, "longitude": -0.1650},
-            {"name": "Megan's on the King's Road", "type": "Restaurant", "cuisine": "Mediterranean", "distance": "4 min walk", "price_range": "££", "address": "571 King's Road", "latitude": 51.4781, "longitude": -0.1735},
-            {"name": "Dishoom", "type": "Restaurant", "cuisine": "Indian", "distance": "3 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4912, "longitude": -0.1633},
-            {"name": "Franco Manca", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4908, "longitude": -0.166},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "American", "distance": "2 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4896, "longitude": -0.1649},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4913, "longitude": -0.1604},
-            {"name": "Crussh", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4922, "longitude": -0.1643},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4917, "longitude": -0.1651},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Saatchi Gallery", "latitude": 51.4898, "longitude": -0.1632}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "25",
-        "name": "Serpentine Galleries",
-        "description": "The Serpentine Galleries comprise two exhibition spaces in Kensington Gardens: Serpentine South and Serpentine North. Known for presenting pioneering contemporary art exhibitions and the annual Serpentine Pavilion commission by leading architects, the galleries offer free access to world-class contemporary art in a beautiful park setting.",
-        "short_description": "Contemporary art galleries in Kensington Gardens",
-        "address": "Kensington Gardens, London W2 3XA",
-        "latitude": 51.5050,
-        "longitude": -0.1732,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/tylbte1l_Serpentine__2018__MG_8820.jpg",
-        "category": "Art",
-        "free_entry": True,
-        "opening_hours": "Tue-Fri 10:00-18:00, Sat-Sun 10:00-19:00, Mon 12:00-18:00",
-        "website": "https://www.serpentinegalleries.org",
-        "phone": "+44 20 7402 6075",
-        "transport": [
-            {"type": "tube", "name": "Lancaster Gate", "line": "Central", "distance": "8 min walk"},
-            {"type": "tube", "name": "South Kensington", "line": "Circle, District, Piccadilly", "distance": "15 min walk"},
-            {"type": "bus", "name": "Bayswater Road", "routes": ["9", "10", "49", "52", "70"], "distance": "5 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Serpentine Bar & Kitchen", "type": "Restaurant", "cuisine": "British", "distance": "Inside gallery", "price_range": "££", "address": "Serpentine Galleries", "latitude": 51.5050, "longitude": -0.1732},
-            {"name": "The Magazine Restaurant", "type": "Restaurant", "cuisine": "Modern British", "distance": "5 min walk", "price_range": "£££", "address": "Serpentine Sackler Gallery", "latitude": 51.5078, "longitude": -0.1775},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "American", "distance": "10 min walk", "price_range": "££", "address": "Queensway", "latitude": 51.5104, "longitude": -0.1875},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "5 min walk", "price_range": "£", "address": "Near Serpentine Galleries", "latitude": 51.5034, "longitude": -0.1762},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Serpentine Galleries", "latitude": 51.5044, "longitude": -0.1756},
-            {"name": "Yo! Sushi", "type": "Restaurant", "cuisine": "Japanese", "distance": "6 min walk", "price_range": "££", "address": "Near Serpentine Galleries", "latitude": 51.5063, "longitude": -0.1737},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "2 min walk", "price_range": "£", "address": "Near Serpentine Galleries", "latitude": 51.5057, "longitude": -0.1732},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "5 min walk", "price_range": "£", "address": "Near Serpentine Galleries", "latitude": 51.5038, "longitude": -0.1716},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Serpentine Galleries", "latitude": 51.5078, "longitude": -0.1718},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Near Serpentine Galleries", "latitude": 51.5075, "longitude": -0.1725}],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "26",
-        "name": "Museum of Brands",
-        "description": "The Museum of Brands in Notting Hill tells the story of consumer culture through over 12,000 original items of packaging, advertising, and branded products. The 'time tunnel' exhibition takes visitors on a journey from Victorian times to the present day, exploring how brands have shaped our lives and society.",
-        "short_description": "Journey through 150 years of British consumer culture",
-        "address": "111-117 Lancaster Road, London W11 1QT",
-        "latitude": 51.5171,
-        "longitude": -0.2027,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/q5wmkfc9_8b1df1_939e66f1e55843b3826685141d784408~mv2.jpg",
-        "category": "History",
-        "free_entry": False,
-        "opening_hours": "Mon-Sat 10:00-18:00, Sun 11:00-17:00",
-        "website": "https://www.museumofbrands.com",
-        "phone": "+44 20 7243 9611",
-        "transport": [
-            {"type": "tube", "name": "Ladbroke Grove", "line": "Circle, Hammersmith & City", "distance": "3 min walk"},
-            {"type": "tube", "name": "Notting Hill Gate", "line": "Central, Circle, District", "distance": "12 min walk"},
-            {"type": "bus", "name": "Lancaster Road", "routes": ["7", "23", "70"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Museum Cafe", "type": "Cafe", "cuisine": "British", "distance": "Inside museum", "price_range": "££", "address": "Museum of Brands", "latitude": 51.5171, "longitude": -0.2027},
-            {"name": "Granger & Co", "type": "Restaurant", "cuisine": "Australian", "distance": "8 min walk", "price_range": "££", "address": "175 Westbourne Grove", "latitude": 51.5163, "longitude": -0.1970},
-            {"name": "The Cock & Bottle", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "17 Needham Rd", "latitude": 51.5193, "longitude": -0.2053},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5191, "longitude": -0.1999},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5174, "longitude": -0.2054},
-            {"name": "The Swan", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5166, "longitude": -0.2},
-            {"name": "Honest Burgers", "type": "Restaurant", "cuisine": "American", "distance": "3 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5142, "longitude": -0.2044},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "3 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5175, "longitude": -0.2052},
-            {"name": "Ask Italian", "type": "Restaurant", "cuisine": "Italian", "distance": "2 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5163, "longitude": -0.2028},
-            {"name": "Pizza Express", "type": "Restaurant", "cuisine": "Italian", "distance": "5 min walk", "price_range": "££", "address": "Near Museum of Brands", "latitude": 51.5158, "longitude": -0.2036}],
-        "featured": False,
-        "rating": 4.5
-    },
-    {
-        "id": "27",
-        "name": "Grant Museum of Zoology",
-        "description": "The Grant Museum of Zoology at UCL is one of the oldest and most important natural history collections in Britain, with over 68,000 specimens. Founded in 1828, the museum features rare and extinct species including skeletons, mounted animals, and specimens preserved in fluid, offering a unique window into biodiversity past and present.",
-        "short_description": "UCL's historic zoology collection with rare specimens",
-        "address": "Rockefeller Building, 21 University Street, London WC1E 6DE",
-        "latitude": 51.5246,
-        "longitude": -0.1340,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/bezb6bj8_GRANT_MUSEUM_2_lbrivn.jpg",
-        "category": "Science",
-        "free_entry": True,
-        "opening_hours": "Tue-Fri 13:00-17:00, Sat 11:00-17:00",
-        "website": "https://www.ucl.ac.uk/culture/grant-museum-zoology",
-        "phone": "+44 20 3108 2052",
-        "transport": [
-            {"type": "tube", "name": "Euston Square", "line": "Circle, Hammersmith & City, Metropolitan", "distance": "3 min walk"},
-            {"type": "tube", "name": "Warren Street", "line": "Northern, Victoria", "distance": "5 min walk"},
-            {"type": "tube", "name": "Goodge Street", "line": "Northern", "distance": "7 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "2 min walk", "price_range": "£", "address": "Gower Street", "latitude": 51.5241, "longitude": -0.1335},
-            {"name": "Dalloway Terrace", "type": "Restaurant", "cuisine": "British", "distance": "8 min walk", "price_range": "£££", "address": "16-22 Great Russell St", "latitude": 51.5185, "longitude": -0.1278},
-            {"name": "The Bloomsbury Tavern", "type": "Pub", "cuisine": "British", "distance": "5 min walk", "price_range": "££", "address": "236 Shaftesbury Ave", "latitude": 51.5196, "longitude": -0.1296},
-            {"name": "Franco Manca", "type": "Restaurant", "cuisine": "Italian", "distance": "2 min walk", "price_range": "££", "address": "Near Grant Museum of Zoology", "latitude": 51.5216, "longitude": -0.136},
-            {"name": "Zizzi", "type": "Restaurant", "cuisine": "Italian", "distance": "6 min walk", "price_range": "££", "address": "Near Grant Museum of Zoology", "latitude": 51.5226, "longitude": -0.134},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "6 min walk", "price_range": "££", "address": "Near Grant Museum of Zoology", "latitude": 51.5233, "longitude": -0.136},
-            {"name": "The White Hart", "type": "Pub", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "Near Grant Museum of Zoology", "latitude": 51.5245, "longitude": -0.1369},
-            {"name": "Leon", "type": "Cafe", "cuisine": "Healthy", "distance": "4 min walk", "price_range": "££", "address": "Near Grant Museum of Zoology", "latitude": 51.5269, "longitude": -0.1364},
-            {"name": "The Red Lion", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Near Grant Museum of Zoology", "latitude": 51.5218, "longitude": -0.1313},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "4 min walk", "price_range": "£", "address": "Near Grant Museum of Zoology", "latitude": 51.523, "longitude": -0.1366}],
-        "featured": False,
-        "rating": 4.7
-    },
-    {
-        "id": "28",
-        "name": "Paradox Museum",
-        "description": "The Paradox Museum is an immersive experience featuring over 50 paradox-based exhibits that challenge perception and reality. Visitors encounter mind-bending optical illusions, impossible objects, and interactive installations that blur the line between what's real and what's not. Perfect for all ages, the museum offers a unique journey through brain-teasing puzzles, gravity-defying rooms, and Instagram-worthy photo opportunities that will make you question everything you see.",
-        "short_description": "Mind-bending museum of optical illusions and paradoxes",
-        "address": "215-217 Brompton Road, London SW3 2EJ",
-        "latitude": 51.4944,
-        "longitude": -0.1699,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/arma0wp4_download.jpeg",
-        "category": "Science",
-        "free_entry": False,
-        "opening_hours": "Daily 10:00-20:00",
-        "website": "https://www.paradoxmuseumlo.com",
-        "phone": "+44 20 3096 1173",
-        "transport": [
-            {"type": "tube", "name": "South Kensington", "line": "Circle, District, Piccadilly", "distance": "5 min walk"},
-            {"type": "tube", "name": "Knightsbridge", "line": "Piccadilly", "distance": "7 min walk"},
-            {"type": "bus", "name": "Brompton Road", "routes": ["14", "49", "70", "74", "345", "C1"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Zaika", "type": "Restaurant", "cuisine": "Indian", "distance": "9 min walk", "price_range": "£££", "address": "1 Kensington High St", "latitude": 51.4990, "longitude": -0.1780},
-            {"name": "Muriel's Kitchen", "type": "Cafe", "cuisine": "British", "distance": "4 min walk", "price_range": "££", "address": "36 Old Brompton Rd", "latitude": 51.4942, "longitude": -0.1755},
-            {"name": "Zizzi", "type": "Restaurant", "cuisine": "Italian", "distance": "3 min walk", "price_range": "££", "address": "Brompton Road", "latitude": 51.4938, "longitude": -0.1705},
-            {"name": "The Brompton", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "Brompton Road", "latitude": 51.4948, "longitude": -0.1692},
-            {"name": "Costa Coffee", "type": "Cafe", "cuisine": "Coffee", "distance": "2 min walk", "price_range": "£", "address": "Brompton Road", "latitude": 51.4951, "longitude": -0.1688},
-            {"name": "Pret A Manger", "type": "Cafe", "cuisine": "British", "distance": "3 min walk", "price_range": "£", "address": "Brompton Road", "latitude": 51.4941, "longitude": -0.1715},
-            {"name": "Wasabi", "type": "Restaurant", "cuisine": "Japanese", "distance": "4 min walk", "price_range": "£", "address": "Brompton Road", "latitude": 51.4936, "longitude": -0.1721},
-            {"name": "Byron", "type": "Restaurant", "cuisine": "American", "distance": "5 min walk", "price_range": "££", "address": "Brompton Road", "latitude": 51.4933, "longitude": -0.1728},
-            {"name": "Nando's", "type": "Restaurant", "cuisine": "Portuguese", "distance": "6 min walk", "price_range": "££", "address": "Old Brompton Road", "latitude": 51.4930, "longitude": -0.1738},
-            {"name": "Caffè Nero", "type": "Cafe", "cuisine": "Coffee", "distance": "3 min walk", "price_range": "£", "address": "Brompton Road", "latitude": 51.4946, "longitude": -0.1696}
-        ],
-        "featured": False,
-        "rating": 4.6
-    },
-    {
-        "id": "29",
-        "name": "London Film Museum",
-        "description": "The London Film Museum is dedicated to preserving and showcasing British film history and the art of filmmaking. The museum features iconic props, costumes, and memorabilia from beloved films and TV shows. Visitors can explore the magic of cinema through interactive exhibits, behind-the-scenes insights, and rare artifacts from classic and contemporary productions. The museum celebrates the UK's rich contribution to the global film industry with rotating exhibitions and permanent collections.",
-        "short_description": "Museum celebrating British film history and cinema",
-        "address": "45 Wellington Street, Covent Garden, London WC2E 7BN",
-        "latitude": 51.5115,
-        "longitude": -0.1218,
-        "image_url": "https://customer-assets.emergentagent.com/job_culture-compass-6/artifacts/is10pqem_London-Film-Museum-scaled.webp",
-        "category": "Culture",
-        "free_entry": False,
-        "opening_hours": "Mon-Sun 10:00-18:00",
-        "website": "https://www.londonfilmmuseum.com",
-        "phone": "+44 20 7202 7040",
-        "transport": [
-            {"type": "tube", "name": "Covent Garden", "line": "Piccadilly", "distance": "3 min walk"},
-            {"type": "tube", "name": "Temple", "line": "Circle, District", "distance": "5 min walk"},
-            {"type": "tube", "name": "Charing Cross", "line": "Bakerloo, Northern", "distance": "7 min walk"},
-            {"type": "bus", "name": "Wellington Street", "routes": ["6", "9", "11", "13", "15", "23", "87", "91"], "distance": "1 min walk"}
-        ],
-        "nearby_eateries": [
-            {"name": "Flat Iron", "type": "Restaurant", "cuisine": "Steak", "distance": "2 min walk", "price_range": "££", "address": "17 Henrietta St", "latitude": 51.5115, "longitude": -0.1233},
-            {"name": "Hoppers", "type": "Restaurant", "cuisine": "Sri Lankan", "distance": "7 min walk", "price_range": "££", "address": "49 Frith St", "latitude": 51.5135, "longitude": -0.1320},
-            {"name": "Dishoom Covent Garden", "type": "Restaurant", "cuisine": "Indian", "distance": "4 min walk", "price_range": "££", "address": "12 Upper St Martin's Lane", "latitude": 51.5127, "longitude": -0.1268},
-            {"name": "The Ivy Market Grill", "type": "Restaurant", "cuisine": "British", "distance": "3 min walk", "price_range": "£££", "address": "1 Henrietta St", "latitude": 51.5110, "longitude": -0.1240},
-            {"name": "Balthazar", "type": "Restaurant", "cuisine": "French", "distance": "2 min walk", "price_range": "£££", "address": "4-6 Russell St", "latitude": 51.5118, "longitude": -0.1225},
-            {"name": "Bill's Covent Garden", "type": "Restaurant", "cuisine": "British", "distance": "3 min walk", "price_range": "££", "address": "36-44 Floral St", "latitude": 51.5122, "longitude": -0.1238},
-            {"name": "Wagamama Covent Garden", "type": "Restaurant", "cuisine": "Japanese", "distance": "4 min walk", "price_range": "££", "address": "1 Tavistock St", "latitude": 51.5108, "longitude": -0.1210},
-            {"name": "The Crusting Pipe", "type": "Pub", "cuisine": "British", "distance": "2 min walk", "price_range": "££", "address": "27 The Piazza", "latitude": 51.5120, "longitude": -0.1223},
-            {"name": "Café Rouge", "type": "Restaurant", "cuisine": "French", "distance": "3 min walk", "price_range": "££", "address": "34 Wellington St", "latitude": 51.5112, "longitude": -0.1215},
-            {"name": "Five Guys", "type": "Restaurant", "cuisine": "American", "distance": "4 min walk", "price_range": "££", "address": "Covent Garden", "latitude": 51.5125, "longitude": -0.1235}
-        ],
-        "featured": False,
-        "rating": 4.4
-    }
-]
+class FavoritesCheck(BaseModel):
+    museum_ids: List[str]
+
+# Pre-populated museum data for London - with front entrance photos and nearby eateries within 1/4 mile.
+# Edited as JSON in data/london_museums.json; workers load it from a compiled binary snapshot in one read
+DATA_DIR = ROOT_DIR / "data"
+LONDON_MUSEUMS_SOURCE = DATA_DIR / "london_museums.json"
+LONDON_MUSEUMS_SNAPSHOT = DATA_DIR / "london_museums.snapshot"
+SNAPSHOT_MAGIC = b"LMCSNAP1"
+
+def intern_strings(value):
+    """Share one object per repeated short string ("Cafe", "tube", "5 min walk") so the snapshot stores it once"""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= 64 else value
+    if isinstance(value, list):
+        return [intern_strings(v) for v in value]
+    if isinstance(value, dict):
+        return {sys.intern(k): intern_strings(v) for k, v in value.items()}
+    return value
+
+def snapshot_header(source: Path) -> bytes:
+    """Magic plus the source file's mtime and size; a snapshot with any other header is stale"""
+    stat = source.stat()
+    return SNAPSHOT_MAGIC + struct.pack("<qq", stat.st_mtime_ns, stat.st_size)
+
+def compile_catalog_snapshot(source: Path, snapshot: Path) -> List[dict]:
+    """Parse the JSON source and write it out as header + sha256 + pickled records"""
+    records = intern_strings(json.loads(source.read_bytes()))
+    payload = pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(snapshot_header(source) + hashlib.sha256(payload).digest() + payload)
+        os.replace(tmp, snapshot)  # atomic, so concurrently booting workers never read half a file
+    except OSError as exc:
+        logging.getLogger(__name__).warning("Could not write catalog snapshot %s: %s", snapshot, exc)
+    return records
+
+def load_catalog_snapshot(source: Path, snapshot: Path) -> List[dict]:
+    """The records in `source`, from its snapshot when that is current and intact, else recompiled"""
+    header = snapshot_header(source)
+    try:
+        data = snapshot.read_bytes()
+    except FileNotFoundError:
+        data = b""
+    if data.startswith(header):
+        digest_end = len(header) + hashlib.sha256().digest_size
+        payload = memoryview(data)[digest_end:]
+        if hashlib.sha256(payload).digest() == data[len(header):digest_end]:
+            # Nothing in the payload can form a cycle; don't let the collector rescan every new dict
+            gc.disable()
+            try:
+                return pickle.loads(payload)
+            finally:
+                gc.enable()
+    return compile_catalog_snapshot(source, snapshot)
+
+LONDON_MUSEUMS = load_catalog_snapshot(LONDON_MUSEUMS_SOURCE, LONDON_MUSEUMS_SNAPSHOT)
+
+# Catalog store - museums indexed by id, with secondary indexes kept in step on every write
+class CatalogStore:
+    """In-memory museum catalog with O(1) lookups by id, category, featured and free entry.
+
+    Records are validated against `Museum` once, when they enter the store, and kept both as
+    the validated model (for responses) and as its plain-dict dump (for indexes and projections).
+    """
+
+    def __init__(self, records=()):
+        self._by_id = {}
+        self._models = {}
+        self._position = {}
+        self._next_position = 0
+        self._by_category = {}
+        self._featured = set()
+        self._free_entry = set()
+        self._max_numeric_id = 0
+        self.version = 0
+        self._loaded_at = datetime.utcnow()
+        self._subscribers = []
+        for record in records:
+            self.add(record)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, museum_id):
+        return museum_id in self._by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def get(self, museum_id: str) -> Optional[dict]:
+        return self._by_id.get(museum_id)
+
+    def ids(self) -> List[str]:
+        return list(self._by_id)
+
+    def model(self, museum_id: str) -> Museum:
+        return self._models[museum_id]
+
+    def models(self, records: List[dict]) -> List[Museum]:
+        """The validated Museum for each record, without re-validating anything"""
+        return [self._models[m["id"]] for m in records]
+
+    def get_many(self, museum_ids: List[str]) -> List[dict]:
+        """Records for the given ids in the given order, skipping unknown and repeated ids"""
+        return [self._by_id[mid] for mid in dict.fromkeys(museum_ids) if mid in self._by_id]
+
+    def categories(self) -> List[str]:
+        return sorted(self._by_category)
+
+    def featured(self) -> List[dict]:
+        return self._ordered(self._featured)
+
+    def select(self, category: Optional[str] = None, free_only: bool = False) -> List[dict]:
+        """Records whose category contains `category` and/or with free entry, in catalog order"""
+        if not category and not free_only:
+            return list(self._by_id.values())
+        ids = None
+        if category:
+            category_lower = category.lower()
+            ids = set()
+            for name, members in self._by_category.items():
+                if category_lower in name.lower():
+                    ids |= members
+        if free_only:
+            ids = self._free_entry if ids is None else ids & self._free_entry
+        return self._ordered(ids)
+
+    def copy(self):
+        """A store with the same records and models, not re-validated, that can change independently"""
+        clone = object.__new__(type(self))
+        clone._by_id = dict(self._by_id)
+        clone._models = dict(self._models)
+        clone._position = dict(self._position)
+        clone._next_position = self._next_position
+        clone._by_category = {name: set(members) for name, members in self._by_category.items()}
+        clone._featured = set(self._featured)
+        clone._free_entry = set(self._free_entry)
+        clone._max_numeric_id = self._max_numeric_id
+        clone.version = self.version
+        clone._loaded_at = self._loaded_at
+        clone._subscribers = []
+        return clone
+
+    def subscribe(self, index):
+        """Keep a derived index (anything with add(record)/remove(record)) in step with the catalog"""
+        for record in self._by_id.values():
+            index.add(record)
+        self._subscribers.append(index)
+
+    def next_id(self) -> str:
+        """Next numeric museum id; ids are never reused after a delete"""
+        return str(self._max_numeric_id + 1) if self._max_numeric_id else "21"
+
+    @staticmethod
+    def _validated(record, created_at: datetime) -> Museum:
+        """The record as a model; a Museum is taken as already validated and used as it is"""
+        if isinstance(record, Museum):
+            return record
+        if "created_at" not in record:
+            record = {**record, "created_at": created_at}
+        return Museum.model_validate(record)
+
+    def add(self, record):
+        # Built-in records carry no timestamp; pin one so responses (and their ETags) are stable
+        model = self._validated(record, self._loaded_at)
+        museum_id = model.id
+        if museum_id in self._by_id:
+            raise KeyError(f"Museum ID {museum_id} already exists")
+        record = model.model_dump()
+        self._by_id[museum_id] = record
+        self._models[museum_id] = model
+        self._position[museum_id] = self._next_position
+        self._next_position += 1
+        if museum_id.isdigit():
+            self._max_numeric_id = max(self._max_numeric_id, int(museum_id))
+        self._index(record)
+        for index in self._subscribers:
+            index.add(record)
+        self.version += 1
+
+    def replace(self, museum_id: str, record):
+        """Swap in a new record for an existing id, keeping its place in the catalog order"""
+        previous = self._by_id[museum_id]
+        model = self._validated(record, previous["created_at"])
+        record = model.model_dump()
+        self._unindex(previous)
+        self._by_id[museum_id] = record
+        self._models[museum_id] = model
+        self._index(record)
+        for index in self._subscribers:
+            index.remove(previous)
+            index.add(record)
+        self.version += 1
+
+    def remove(self, museum_id: str) -> Optional[dict]:
+        record = self._by_id.pop(museum_id, None)
+        if record is not None:
+            del self._models[museum_id]
+            del self._position[museum_id]
+            self._unindex(record)
+            for index in self._subscribers:
+                index.remove(record)
+            self.version += 1
+        return record
+
+    def _ordered(self, ids) -> List[dict]:
+        return [self._by_id[mid] for mid in sorted(ids, key=self._position.__getitem__)]
+
+    def _index(self, record: dict):
+        museum_id = record["id"]
+        self._by_category.setdefault(record["category"], set()).add(museum_id)
+        if record.get("featured"):
+            self._featured.add(museum_id)
+        if record.get("free_entry"):
+            self._free_entry.add(museum_id)
+
+    def _unindex(self, record: dict):
+        museum_id = record["id"]
+        members = self._by_category.get(record["category"])
+        if members is not None:
+            members.discard(museum_id)
+            if not members:
+                del self._by_category[record["category"]]
+        self._featured.discard(museum_id)
+        self._free_entry.discard(museum_id)
+
+# Copy-on-write maps - let a new catalog snapshot clone an index in O(keys) and pay only for what it changes
+class CopyOnWriteMap(dict):
+    """A dict of mutable containers (dicts or sets) whose copy() shares them until one is written.
+
+    Writers go through `writable(key)`, which hands back a container this map owns, copying the
+    shared one first if need be. Reads are plain dict reads. A map that was never copied owns
+    everything; the map it was copied from must not change afterwards, which holds for published
+    snapshots.
+    """
+
+    __slots__ = ("_owned",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._owned = None  # keys whose container this map owns; None means all of them
+
+    def copy(self) -> "CopyOnWriteMap":
+        clone = CopyOnWriteMap(self)
+        clone._owned = set()
+        return clone
+
+    def writable(self, key, factory=dict):
+        container = self.get(key)
+        if container is None:
+            container = self[key] = factory()
+        elif self._owned is None or key in self._owned:
+            return container
+        else:
+            container = self[key] = container.copy()
+        if self._owned is not None:
+            self._owned.add(key)
+        return container
+
+# Full-text search - inverted index with BM25 ranking
+SEARCH_FIELD_WEIGHTS = {
+    "name": 3.0,
+    "category": 2.0,
+    "short_description": 1.5,
+    "description": 1.0,
+    "address": 1.0,
+}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, accent-folded alphanumeric tokens ("St Paul's Café" -> st, pauls, cafe)"""
+    folded = unicodedata.normalize("NFKD", text.replace("'", "").replace("\u2019", ""))
+    return TOKEN_PATTERN.findall(folded.encode("ascii", "ignore").decode("ascii").lower())
+
+class SearchIndex:
+    """Inverted index over museum text fields, ranked with BM25 and updated one record at a time"""
+
+    K1 = 1.2
+    B = 0.75
+    MAX_PREFIX_EXPANSION = 64
+
+    def __init__(self, field_weights=SEARCH_FIELD_WEIGHTS):
+        self._field_weights = field_weights
+        self._postings = CopyOnWriteMap()  # term -> {museum_id: weighted term frequency}
+        self._doc_terms = {}  # museum_id -> terms, for removal
+        self._doc_length = {}
+        self._total_length = 0.0
+        self._sorted_terms = None
+
+    def copy(self) -> "SearchIndex":
+        """An index with the same documents that can change without touching this one"""
+        clone = object.__new__(SearchIndex)
+        clone._field_weights = self._field_weights
+        clone._postings = self._postings.copy()
+        clone._doc_terms = dict(self._doc_terms)
+        clone._doc_length = dict(self._doc_length)
+        clone._total_length = self._total_length
+        clone._sorted_terms = self._sorted_terms  # replaced, never edited in place
+        return clone
+
+    def add(self, record: dict):
+        frequencies = {}
+        for field, weight in self._field_weights.items():
+            for term in tokenize(record.get(field) or ""):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+        museum_id = record["id"]
+        for term, frequency in frequencies.items():
+            if term not in self._postings:
+                self._sorted_terms = None
+            self._postings.writable(term)[museum_id] = frequency
+        self._doc_terms[museum_id] = list(frequencies)
+        length = sum(frequencies.values())
+        self._doc_length[museum_id] = length
+        self._total_length += length
+
+    def remove(self, record: dict):
+        museum_id = record["id"]
+        for term in self._doc_terms.pop(museum_id, ()):
+            postings = self._postings.writable(term)
+            del postings[museum_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        self._total_length -= self._doc_length.pop(museum_id, 0.0)
+
+    def search(self, query: str, match_all: bool = True) -> List[str]:
+        """Museum ids ranked by BM25; the last query term also matches as a prefix while typing"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._doc_length:
+            return []
+        expand_last = not query[-1].isspace()
+        groups = [[term] for term in terms[:-1]]
+        groups.append(self._expand(terms[-1]) if expand_last else [terms[-1]])
+
+        group_scores = [self._score_group(group) for group in groups]
+        if match_all:
+            group_scores.sort(key=len)
+            candidates = set(group_scores[0])
+            for scores in group_scores[1:]:
+                candidates.intersection_update(scores)
+        else:
+            candidates = set().union(*group_scores)
+        totals = {mid: sum(scores.get(mid, 0.0) for scores in group_scores) for mid in candidates}
+        return sorted(totals, key=totals.__getitem__, reverse=True)
+
+    def _expand(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect_left(self._sorted_terms, prefix)
+        expansions = []
+        for term in self._sorted_terms[start:start + self.MAX_PREFIX_EXPANSION]:
+            if not term.startswith(prefix):
+                break
+            expansions.append(term)
+        return expansions
+
+    def _score_group(self, terms: List[str]) -> dict:
+        """Best BM25 contribution per museum over a group of alternative terms"""
+        doc_count = len(self._doc_length)
+        average_length = self._total_length / doc_count
+        scores = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for museum_id, frequency in postings.items():
+                norm = self.K1 * (1 - self.B + self.B * self._doc_length[museum_id] / average_length)
+                score = idf * frequency * (self.K1 + 1) / (frequency + norm)
+                if score > scores.get(museum_id, 0.0):
+                    scores[museum_id] = score
+        return scores
+
+# Typeahead - sorted label keys searched by prefix with bisect
+SUGGESTION_TYPES = ("museum", "category", "station", "eatery")
+
+class SuggestIndex:
+    """Prefix index over museum, category, station and eatery names for the search box.
+
+    Each distinct label is stored once under its full normalized text and once under every
+    later word, so "hist" finds "Natural History Museum". Keys live in sorted lists and a
+    lookup is a bisect plus a short scan.
+    """
+
+    MAX_SCAN = 256
+
+    def __init__(self):
+        self._labels = {}  # (type, key) -> label as first seen
+        self._label_museums = CopyOnWriteMap()  # (type, key) -> {museum_id: None}
+        self._label_keys = []  # sorted (key, type rank, key)
+        self._word_keys = []  # sorted (key suffix from a later word, type rank, full key)
+
+    def copy(self) -> "SuggestIndex":
+        clone = object.__new__(SuggestIndex)
+        clone._labels = dict(self._labels)
+        clone._label_museums = self._label_museums.copy()
+        clone._label_keys = list(self._label_keys)
+        clone._word_keys = list(self._word_keys)
+        return clone
+
+    @staticmethod
+    def _labels_for(record: dict):
+        yield "museum", record["name"]
+        yield "category", record["category"]
+        for link in record.get("transport") or ():
+            if link.get("type") != "bus":
+                yield "station", link["name"]
+        for eatery in record.get("nearby_eateries") or ():
+            yield "eatery", eatery["name"]
+
+    def add(self, record: dict):
+        for kind, label in self._labels_for(record):
+            tokens = tokenize(label)
+            if not tokens:
+                continue
+            key = " ".join(tokens)
+            if (kind, key) not in self._labels:
+                self._labels[(kind, key)] = label
+                rank = SUGGESTION_TYPES.index(kind)
+                insort(self._label_keys, (key, rank, key))
+                for i in range(1, len(tokens)):
+                    insort(self._word_keys, (" ".join(tokens[i:]), rank, key))
+            self._label_museums.writable((kind, key))[record["id"]] = None
+
+    def remove(self, record: dict):
+        for kind, label in self._labels_for(record):
+            tokens = tokenize(label)
+            key = " ".join(tokens)
+            if (kind, key) not in self._labels:
+                continue
+            museum_ids = self._label_museums.writable((kind, key))
+            museum_ids.pop(record["id"], None)
+            if museum_ids:
+                continue
+            del self._labels[(kind, key)]
+            del self._label_museums[(kind, key)]
+            rank = SUGGESTION_TYPES.index(kind)
+            self._discard(self._label_keys, (key, rank, key))
+            for i in range(1, len(tokens)):
+                self._discard(self._word_keys, (" ".join(tokens[i:]), rank, key))
+
+    @staticmethod
+    def _discard(keys: list, item: tuple):
+        i = bisect_left(keys, item)
+        if i < len(keys) and keys[i] == item:
+            del keys[i]
+
+    def suggest(self, query: str, limit: int = 8) -> List[dict]:
+        """Labels starting with the query, then labels with a later word starting with it"""
+        prefix = " ".join(tokenize(query))
+        if not prefix:
+            return []
+        suggestions = []
+        seen = set()
+        for keys in (self._label_keys, self._word_keys):
+            start = bisect_left(keys, (prefix,))
+            matches = []
+            for item in keys[start:start + self.MAX_SCAN]:
+                if not item[0].startswith(prefix):
+                    break
+                matches.append(item)
+            # Museums before categories, stations and eateries; shorter labels first within a type
+            matches.sort(key=lambda item: (item[1], len(item[2]), item[2]))
+            for _, rank, key in matches:
+                kind = SUGGESTION_TYPES[rank]
+                if (kind, key) in seen:
+                    continue
+                seen.add((kind, key))
+                museum_ids = [] if kind == "category" else list(self._label_museums[(kind, key)])
+                suggestions.append({"type": kind, "label": self._labels[(kind, key)], "museum_ids": museum_ids})
+                if len(suggestions) == limit:
+                    return suggestions
+        return suggestions
+
+# Fuzzy search - trigram index over the words of museum and eatery names
+def trigrams(word: str) -> frozenset:
+    """Trigrams of a word padded the way pg_trgm does ("  w" ... "d ")"""
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+class TrigramIndex:
+    """Typo-tolerant name search: query words are matched to catalog words by trigram similarity.
+
+    Candidate words come only from the postings of a query word's rarest trigrams (prefix
+    filtering), so a word is never compared unless it could reach the similarity threshold.
+    """
+
+    EATERY_WEIGHT = 0.5
+
+    def __init__(self, threshold: float = 0.3):
+        self.threshold = threshold
+        self._word_grams = {}  # word -> trigrams
+        self._gram_words = CopyOnWriteMap()  # trigram -> words containing it
+        self._word_docs = CopyOnWriteMap()  # word -> {museum_id: weight}
+        self._doc_words = {}  # museum_id -> words, for removal
+
+    def copy(self) -> "TrigramIndex":
+        clone = object.__new__(TrigramIndex)
+        clone.threshold = self.threshold
+        clone._word_grams = dict(self._word_grams)
+        clone._gram_words = self._gram_words.copy()
+        clone._word_docs = self._word_docs.copy()
+        clone._doc_words = dict(self._doc_words)
+        return clone
+
+    def add(self, record: dict):
+        weights = {}
+        for eatery in record.get("nearby_eateries") or ():
+            for word in tokenize(eatery["name"]):
+                weights[word] = self.EATERY_WEIGHT
+        for word in tokenize(record["name"]):
+            weights[word] = 1.0
+        museum_id = record["id"]
+        for word, weight in weights.items():
+            if word not in self._word_docs:
+                grams = self._word_grams[word] = trigrams(word)
+                for gram in grams:
+                    self._gram_words.writable(gram, set).add(word)
+            self._word_docs.writable(word)[museum_id] = weight
+        self._doc_words[museum_id] = list(weights)
+
+    def remove(self, record: dict):
+        museum_id = record["id"]
+        for word in self._doc_words.pop(museum_id, ()):
+            docs = self._word_docs.writable(word)
+            del docs[museum_id]
+            if docs:
+                continue
+            del self._word_docs[word]
+            for gram in self._word_grams.pop(word):
+                words = self._gram_words.writable(gram, set)
+                words.discard(word)
+                if not words:
+                    del self._gram_words[gram]
+
+    def similar_words(self, word: str) -> dict:
+        """Catalog words whose trigram Jaccard similarity to `word` reaches the threshold"""
+        grams = trigrams(word)
+        # Jaccard >= t needs at least ceil(t * |grams|) shared trigrams, so any match must
+        # contain one of the |grams| - required + 1 rarest query trigrams
+        required = max(1, math.ceil(self.threshold * len(grams)))
+        rarest = sorted(grams, key=lambda gram: len(self._gram_words.get(gram, ())))
+        candidates = set()
+        for gram in rarest[:len(grams) - required + 1]:
+            candidates.update(self._gram_words.get(gram, ()))
+        matches = {}
+        for candidate in candidates:
+            candidate_grams = self._word_grams[candidate]
+            shared = len(grams & candidate_grams)
+            similarity = shared / (len(grams) + len(candidate_grams) - shared)
+            if similarity >= self.threshold:
+                matches[candidate] = similarity
+        return matches
+
+    def search(self, query: str, match_all: bool = True) -> List[str]:
+        """Museum ids ranked by summed best-word similarity over the query words"""
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return []
+        word_scores = []
+        for word in words:
+            scores = {}
+            for candidate, similarity in self.similar_words(word).items():
+                for museum_id, weight in self._word_docs[candidate].items():
+                    score = similarity * weight
+                    if score > scores.get(museum_id, 0.0):
+                        scores[museum_id] = score
+            word_scores.append(scores)
+        if match_all:
+            word_scores.sort(key=len)
+            candidates = set(word_scores[0])
+            for scores in word_scores[1:]:
+                candidates.intersection_update(scores)
+        else:
+            candidates = set().union(*word_scores)
+        totals = {mid: sum(scores.get(mid, 0.0) for scores in word_scores) for mid in candidates}
+        return sorted(totals, key=totals.__getitem__, reverse=True)
+
+# Spatial index - museum coordinates hashed into a lat/lon grid, refined with haversine
+EARTH_RADIUS_M = 6_371_008.8
+METRES_PER_DEGREE_LAT = 111_320.0
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in metres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+class GridIndex:
+    """Grid hash of museum locations answering radius and k-nearest queries.
+
+    Cells are `cell_deg` degrees square (about 1.1 km x 0.7 km at London's latitude), so a
+    query only visits the cells around the point and never scans the whole catalog.
+    """
+
+    def __init__(self, cell_deg: float = 0.01):
+        self._cell_deg = cell_deg
+        self._cells = CopyOnWriteMap()  # (row, col) -> {museum_id: (lat, lon)}
+        self._points = {}  # museum_id -> (lat, lon)
+
+    def copy(self) -> "GridIndex":
+        clone = object.__new__(GridIndex)
+        clone._cell_deg = self._cell_deg
+        clone._cells = self._cells.copy()
+        clone._points = dict(self._points)
+        return clone
+
+    def _cell(self, lat: float, lon: float):
+        return math.floor(lat / self._cell_deg), math.floor(lon / self._cell_deg)
+
+    def add(self, record: dict):
+        point = (record["latitude"], record["longitude"])
+        self._points[record["id"]] = point
+        self._cells.writable(self._cell(*point))[record["id"]] = point
+
+    def remove(self, record: dict):
+        point = self._points.pop(record["id"], None)
+        if point is None:
+            return
+        cell = self._cell(*point)
+        members = self._cells.writable(cell)
+        del members[record["id"]]
+        if not members:
+            del self._cells[cell]
+
+    def within(self, lat: float, lon: float, radius_m: float) -> List[tuple]:
+        """(distance_m, museum_id) pairs within `radius_m`, nearest first"""
+        dlat = radius_m / METRES_PER_DEGREE_LAT
+        dlon = radius_m / (METRES_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        row_lo, col_lo = self._cell(lat - dlat, lon - dlon)
+        row_hi, col_hi = self._cell(lat + dlat, lon + dlon)
+        if (row_hi - row_lo + 1) * (col_hi - col_lo + 1) > len(self._cells):
+            cells = [members for (row, col), members in self._cells.items()
+                     if row_lo <= row <= row_hi and col_lo <= col <= col_hi]
+        else:
+            cells = [self._cells[(row, col)]
+                     for row in range(row_lo, row_hi + 1)
+                     for col in range(col_lo, col_hi + 1)
+                     if (row, col) in self._cells]
+        hits = []
+        for members in cells:
+            for museum_id, (plat, plon) in members.items():
+                distance = haversine_m(lat, lon, plat, plon)
+                if distance <= radius_m:
+                    hits.append((distance, museum_id))
+        hits.sort()
+        return hits
+
+    def nearest(self, lat: float, lon: float, k: int, radius_m: Optional[float] = None) -> List[tuple]:
+        """The `k` nearest (distance_m, museum_id) pairs, optionally capped at `radius_m`"""
+        if radius_m is not None:
+            return self.within(lat, lon, radius_m)[:k]
+        row0, col0 = self._cell(lat, lon)
+        # Any point outside ring r is at least r cells away along its shorter side
+        cell_m = self._cell_deg * METRES_PER_DEGREE_LAT * min(1.0, max(math.cos(math.radians(lat)), 1e-6))
+        best = []  # max-heap of (-distance, museum_id)
+
+        def consider(members):
+            for museum_id, (plat, plon) in members.items():
+                item = (-haversine_m(lat, lon, plat, plon), museum_id)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+
+        seen = 0
+        ring = 0
+        while seen < len(self._points):
+            if 8 * ring > len(self._cells):
+                # The ring is now bigger than the occupied grid (a point far from every
+                # museum): finish with one pass over the remaining cells instead
+                for (row, col), members in self._cells.items():
+                    if max(abs(row - row0), abs(col - col0)) >= ring:
+                        consider(members)
+                break
+            for row in range(row0 - ring, row0 + ring + 1):
+                step = 1 if abs(row - row0) == ring else 2 * ring
+                for col in range(col0 - ring, col0 + ring + 1, step or 1):
+                    members = self._cells.get((row, col))
+                    if members:
+                        seen += len(members)
+                        consider(members)
+            if len(best) == k and -best[0][0] <= ring * cell_m:
+                break
+            ring += 1
+        return sorted((-distance, museum_id) for distance, museum_id in best)
+
+# Eatery index - every museum's nearby eateries in flat NumPy arrays for vectorized distance filters
+PRICE_RANGES = ("£", "££", "£££")
+
+class EateryIndex:
+    """Catalog-wide, de-duplicated eatery table; rebuilt lazily once per catalog version.
+
+    Eateries shared by several museums (same name and address) appear once, listing all of
+    those museums. Eateries without coordinates are left out.
+    """
+
+    def __init__(self, store: CatalogStore):
+        self._store = store
+        self._version = None
+
+    def _build(self):
+        eateries, museum_ids, positions = [], [], {}
+        for record in self._store:
+            for eatery in record.get("nearby_eateries") or ():
+                if eatery.get("latitude") is None or eatery.get("longitude") is None:
+                    continue
+                key = (eatery["name"].lower(), (eatery.get("address") or "").lower())
+                if key not in positions:
+                    positions[key] = len(eateries)
+                    eateries.append(eatery)
+                    museum_ids.append([])
+                museum_ids[positions[key]].append(record["id"])
+        self._eateries = eateries
+        self._museum_ids = museum_ids
+        self._lat = np.radians(np.array([e["latitude"] for e in eateries], dtype=np.float64))
+        self._lon = np.radians(np.array([e["longitude"] for e in eateries], dtype=np.float64))
+        self._cos_lat = np.cos(self._lat)
+        self._cuisine_codes = {}
+        self._cuisine = np.array(
+            [self._cuisine_codes.setdefault((e.get("cuisine") or "").lower(), len(self._cuisine_codes)) for e in eateries],
+            dtype=np.int32,
+        )
+        self._price = np.array([PRICE_RANGES.index(e["price_range"]) if e["price_range"] in PRICE_RANGES else -1
+                                for e in eateries], dtype=np.int8)
+        self._version = self._store.version
+
+    def near(self, lat: float, lon: float, max_m: float, cuisine: Optional[str] = None,
+             price_range: Optional[str] = None, k: int = 20) -> List[dict]:
+        """Eateries within `max_m` of a point, nearest first, as NearbyEatery dicts plus distance"""
+        if self._version != self._store.version:
+            self._build()
+        candidates = np.arange(len(self._eateries))
+        if cuisine:
+            code = self._cuisine_codes.get(cuisine.lower())
+            if code is None:
+                return []
+            candidates = candidates[self._cuisine[candidates] == code]
+        if price_range:
+            candidates = candidates[self._price[candidates] == PRICE_RANGES.index(price_range)]
+
+        phi, lam = math.radians(lat), math.radians(lon)
+        a = (np.sin((self._lat[candidates] - phi) / 2) ** 2
+             + math.cos(phi) * self._cos_lat[candidates] * np.sin((self._lon[candidates] - lam) / 2) ** 2)
+        distances = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+        within = distances <= max_m
+        candidates, distances = candidates[within], distances[within]
+        if len(candidates) > k:
+            top = np.argpartition(distances, k - 1)[:k]
+            candidates, distances = candidates[top], distances[top]
+        order = np.argsort(distances, kind="stable")
+        # The stored `distance` ("4 min walk") is from the first museum listing the eatery, not the query point
+        return [
+            {**{k: v for k, v in self._eateries[i].items() if k != "distance"},
+             "distance_m": round(float(d), 1), "museum_ids": self._museum_ids[i]}
+            for i, d in zip(candidates[order], distances[order])
+        ]
+
+JSON_ENCODER = TypeAdapter(Any)
+
+def encode_json(content) -> bytes:
+    """Encode a response body with pydantic's compiled serializer.
+
+    Models inside `content` are dumped as they are, never re-validated, so this is the
+    trusted path for catalog data that was validated when it entered the store. The output
+    matches FastAPI's default JSONResponse (compact separators, UTF-8, ISO datetimes).
+    """
+    return JSON_ENCODER.dump_json(content)
+
+# Catalog snapshots - copy-on-write versions of the store and its indexes, published by one swap
+CHANGE_LOG_TOMBSTONES = 1000
+SNAPSHOT_DIGEST_MODULUS = 1 << 128
+
+class ChangeLog:
+    """The sync position (seq) of the last write to every museum changed since the built-in catalog.
+
+    Only each id's latest seq is kept, which compacts the log by key: a client catching up from N
+    needs the newest state of each museum changed after N, not its history. Tombstones are the one
+    part that only grows, so past CHANGE_LOG_TOMBSTONES the oldest are dropped and `floor` rises to
+    their seq; a cursor below the floor can no longer be caught up and the client has to reset.
+    """
+
+    def __init__(self):
+        self.upserts = {}
+        self.tombstones = {}
+        self.floor = 0
+
+    def copy(self) -> "ChangeLog":
+        clone = ChangeLog()
+        clone.upserts = dict(self.upserts)
+        clone.tombstones = dict(self.tombstones)
+        clone.floor = self.floor
+        return clone
+
+    def record(self, museum_id: str, seq: int, deleted: bool):
+        if deleted:
+            self.upserts.pop(museum_id, None)
+            self.tombstones[museum_id] = seq
+        else:
+            self.tombstones.pop(museum_id, None)
+            self.upserts[museum_id] = seq
+
+    def compact(self):
+        excess = len(self.tombstones) - CHANGE_LOG_TOMBSTONES
+        if excess > 0:
+            for museum_id, seq in heapq.nsmallest(excess, self.tombstones.items(), key=lambda item: item[1]):
+                del self.tombstones[museum_id]
+                self.floor = max(self.floor, seq)
+
+    def since(self, seq: int) -> tuple:
+        """(upserted ids, deleted ids) written after `seq`, each oldest first"""
+        def after(entries: dict) -> List[str]:
+            return [museum_id for museum_id, _ in sorted(
+                ((museum_id, at) for museum_id, at in entries.items() if at > seq), key=lambda item: item[1]
+            )]
+        return after(self.upserts), after(self.tombstones)
+
+class CatalogSnapshot(CatalogStore):
+    """One published version of the catalog together with every index derived from it.
+
+    A snapshot is never modified once published. Writes copy it, indexes included, and apply their
+    changes to the copy off to the side: the indexes are cloned copy-on-write, so a write costs
+    its own add/remove deltas plus a shallow copy, not a rebuild. A request that took a snapshot
+    therefore reads one consistent version from start to finish, across awaits, without any lock.
+
+    `seq` is the database sync position the snapshot reflects, or None when it holds writes the
+    sync has not confirmed yet (or has not hydrated at all). `changelog` records the seq of every
+    change applied since the built-in records, for clients syncing by delta.
+
+    `digest` identifies the content: the sum of a hash of every museum's encoded JSON, kept up
+    to date per change. Two snapshots with equal digests serve identical bodies, whatever their
+    seq or version, which is what lets workers share encoded bodies with each other.
+    """
+
+    def __init__(self, records=()):
+        super().__init__(records)
+        self.seq = None
+        self.changelog = ChangeLog()
+        self.digest = sum(self._record_digest(museum_id) for museum_id in self._by_id) % SNAPSHOT_DIGEST_MODULUS
+        self._derive()
+
+    def copy(self):
+        clone = super().copy()
+        clone.changelog = self.changelog.copy()
+        clone.search_index = self.search_index.copy()
+        clone.suggest_index = self.suggest_index.copy()
+        clone.trigram_index = self.trigram_index.copy()
+        clone.grid_index = self.grid_index.copy()
+        # Already holding every record, so attached without replaying them through subscribe()
+        clone._subscribers = [clone.search_index, clone.suggest_index, clone.trigram_index, clone.grid_index]
+        clone.eatery_index = EateryIndex(clone)
+        return clone
+
+    def _record_digest(self, museum_id: str) -> int:
+        return int.from_bytes(hashlib.sha1(encode_json(self.model(museum_id))).digest()[:16], "big")
+
+    def _derive(self):
+        self.search_index = SearchIndex()
+        self.suggest_index = SuggestIndex()
+        self.trigram_index = TrigramIndex()
+        self.grid_index = GridIndex()
+        for index in (self.search_index, self.suggest_index, self.trigram_index, self.grid_index):
+            self.subscribe(index)
+        self.eatery_index = EateryIndex(self)
+
+    def with_changes(self, changes: List[tuple], seq: Optional[int]) -> "CatalogSnapshot":
+        """The next snapshot: (museum_id, record, seq) upserted and (museum_id, None, seq) removed,
+        where each change's seq is the one its database write was stamped with. A record may be
+        a dict or an already validated Museum."""
+        if not changes:
+            # Same content at a new sync position; share everything, including the version
+            snapshot = copy.copy(self)
+        else:
+            snapshot = self.copy()
+            digest = self.digest
+            for museum_id, record, change_seq in changes:
+                if museum_id in snapshot:
+                    digest -= snapshot._record_digest(museum_id)
+                if record is None:
+                    if museum_id in snapshot:
+                        snapshot.remove(museum_id)
+                elif museum_id in snapshot:
+                    snapshot.replace(museum_id, record)
+                else:
+                    snapshot.add(record)
+                if record is not None:
+                    digest += snapshot._record_digest(museum_id)
+                snapshot.changelog.record(museum_id, change_seq, deleted=record is None)
+            snapshot.digest = digest % SNAPSHOT_DIGEST_MODULUS
+            snapshot.changelog.compact()
+            snapshot.version = self.version + 1
+        snapshot.seq = seq
+        return snapshot
+
+class CatalogPublisher:
+    """Holds the current snapshot and turns writes into new ones.
+
+    Readers take `current` and never wait. Writers queue their changes; one builder task drains
+    the queue, so a burst of admin writes or a sync batch costs one snapshot copy, made in a
+    worker thread from the immutable current snapshot, then published by a single reference swap.
+    """
+
+    def __init__(self, snapshot: CatalogSnapshot):
+        self.current = snapshot
+        self._pending = []
+        self._builder = None
+
+    async def apply(self, changes: List[tuple], seq: Optional[int] = None) -> CatalogSnapshot:
+        """Queue changes and return the first published snapshot that contains them.
+        
+        `seq` is the sync position the changes bring the catalog to; writes made here first leave it None.
+        """
+        if not changes and (seq is None or seq == self.current.seq):
+            return self.current
+        done = asyncio.get_running_loop().create_future()
+        self._pending.append((changes, seq, done))
+        if self._builder is None or self._builder.done():
+            self._builder = asyncio.create_task(self._drain())
+        return await done
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch, self._pending = self._pending, []
+            changes = [change for changes, _, _ in batch for change in changes]
+            seqs = [seq for _, seq, _ in batch]
+            seq = None if None in seqs else max(seqs)
+            try:
+                snapshot = await loop.run_in_executor(None, self.current.with_changes, changes, seq)
+            except Exception as exc:
+                for _, _, done in batch:
+                    done.set_exception(exc)
+                continue
+            self.current = snapshot
+            for _, _, done in batch:
+                done.set_result(snapshot)
+
+catalogs = CatalogPublisher(CatalogSnapshot(LONDON_MUSEUMS))
+
+def json_response(content, headers: Optional[dict] = None) -> Response:
+    """Response for already-trusted content, skipping FastAPI's response_model re-validation"""
+    return Response(content=encode_json(content), media_type="application/json", headers=headers)
+
+# Response cache - encoded bodies of catalog reads, valid for one catalog version
+class Page:
+    """One page of a list response; the next-page cursor travels in the X-Next-Cursor header"""
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items: list, next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def headers(self) -> dict:
+        return {"X-Next-Cursor": self.next_cursor} if self.next_cursor else {}
+
+GZIP_MIN_BYTES = 1024
+GZIP_FAST_LEVEL = 1
+GZIP_BEST_LEVEL = 9
+
+class BufferResponse(Response):
+    """A Response whose body may also be a memoryview, such as a slice of the shared snapshot;
+    the ASGI server writes any bytes-like body to the socket as it is, without a copy"""
+
+    def render(self, content: Any) -> bytes:
+        return content if isinstance(content, memoryview) else super().render(content)
+
+class CachedBody:
+    """An encoded response body plus, once asked for, its gzip encoding.
+
+    The first gzip request compresses at a fast level so it is not held up; the best level
+    is then computed once in a worker thread and replaces it. Either way each body is
+    compressed at most twice per catalog version, never once per request. The two levels
+    are different bytes, so each gets its own strong ETag; a client holding the fast one
+    revalidates once more after the swap.
+    """
+    __slots__ = ("body", "etag", "headers", "_gzip")
+
+    def __init__(self, body, etag: str, headers: Optional[dict] = None, gzip_body=None):
+        self.body = body
+        self.etag = etag
+        self.headers = headers or {}
+        # (compression level, bytes), replaced as one so a response never mixes a level's bytes and ETag
+        self._gzip = (GZIP_BEST_LEVEL, gzip_body) if gzip_body is not None else None
+
+    @property
+    def compressible(self) -> bool:
+        return len(self.body) >= GZIP_MIN_BYTES
+
+    def response(self) -> Response:
+        response = BufferResponse(
+            content=self.body,
+            media_type="application/json",
+            headers={"ETag": self.etag, "Vary": "Accept-Encoding", **self.headers},
+        )
+        response.cached_entry = self
+        return response
+
+    def gzip_response(self) -> Response:
+        # A distinct strong ETag per content-coding and compression level, as RFC 7232 requires
+        level, body = self.gzipped()
+        return BufferResponse(
+            content=body,
+            media_type="application/json",
+            headers={
+                "ETag": f'{self.etag[:-1]}-gz{level}"',
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+                **self.headers,
+            },
+        )
+
+    def gzipped(self) -> tuple:
+        """(compression level, gzip bytes) of the body"""
+        if self._gzip is None:
+            self._gzip = (GZIP_FAST_LEVEL, gzip.compress(self.body, compresslevel=GZIP_FAST_LEVEL, mtime=0))
+            try:
+                asyncio.get_running_loop().run_in_executor(None, self._recompress)
+            except RuntimeError:
+                self._recompress()
+        return self._gzip
+
+    def _recompress(self):
+        self._gzip = (GZIP_BEST_LEVEL, gzip.compress(self.body, compresslevel=GZIP_BEST_LEVEL, mtime=0))
+
+class ResponseCache:
+    """LRU of pre-encoded JSON bodies and their ETags for the newest catalog snapshot, emptied when it changes"""
+
+    def __init__(self, max_entries: int = 256):
+        self._version = None
+        self._entries = OrderedDict()
+        self._max_entries = max_entries
+
+    def get_or_build(self, catalog: CatalogStore, key, build) -> CachedBody:
+        if self._version != catalog.version:
+            if self._version is not None and catalog.version < self._version:
+                # A request still reading an older snapshot; answer it without touching the cache
+                return self._encode(build)
+            self._entries.clear()
+            self._version = catalog.version
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        entry = self._encode(build)
+        self._entries[key] = entry
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _encode(build) -> CachedBody:
+        content = build()
+        headers = None
+        if isinstance(content, Page):
+            content, headers = content.items, content.headers
+        body = encode_json(content)
+        return CachedBody(body, make_etag(body), headers)
+
+response_cache = ResponseCache()
+
+def cached_json_response(catalog: CatalogStore, key, build) -> Response:
+    """Serve `build()` from the shared snapshot when it carries `key`, otherwise from the response
+    cache for `catalog`'s version, encoding it only on a miss"""
+    entry = shared_catalog.cached(catalog, key)
+    if entry is None:
+        entry = response_cache.get_or_build(catalog, key, build)
+    return entry.response()
+
+def page_response(page: Page) -> Response:
+    """Uncached counterpart of cached_json_response for a Page"""
+    return json_response(page.items, headers=page.headers)
+
+# Cursor pagination - opaque keyset cursors with heap-based top-k selection
+MUSEUM_SORTS = ("rating", "name", "distance", "created_at")
+
+def encode_cursor(state: dict) -> str:
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(state, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return state
+
+def created_at_timestamp(record: dict) -> float:
+    created_at = record.get("created_at")
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    return created_at.timestamp() if created_at else 0.0
+
+def museum_sort_key(sort: str, lat: Optional[float] = None, lon: Optional[float] = None):
+    """Key giving each sort's natural direction (best rated, A-Z, nearest, newest), tie-broken by id"""
+    if sort == "rating":
+        return lambda m: (-m.get("rating", 4.5), m["id"])
+    if sort == "name":
+        return lambda m: (m["name"].lower(), m["id"])
+    if sort == "created_at":
+        return lambda m: (-created_at_timestamp(m), m["id"])
+    return lambda m: (haversine_m(lat, lon, m["latitude"], m["longitude"]), m["id"])
+
+def same_key_shape(after: list, sample: tuple) -> bool:
+    """Whether a cursor's `after` compares with the sort's keys: same length, numbers where they hold numbers"""
+    if len(after) != len(sample):
+        return False
+    for value, expected in zip(after, sample):
+        if isinstance(expected, str):
+            if not isinstance(value, str):
+                return False
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+    return True
+
+def paginate(records: List[dict], limit: Optional[int], cursor: Optional[str], sort: Optional[str] = None,
+             key=None) -> Page:
+    """A page of `records`; sorted pages select the top `limit` with a heap instead of a full sort"""
+    state = decode_cursor(cursor) if cursor else {}
+    if sort is None:
+        offset = state.get("offset", 0)
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if limit is None:
+            return Page(records[offset:])
+        items = records[offset:offset + limit]
+        more = offset + limit < len(records)
+        return Page(items, encode_cursor({"offset": offset + limit}) if more else None)
+
+    if state and state.get("sort") != sort:
+        raise HTTPException(status_code=400, detail="Cursor belongs to a different sort")
+    keyed = ((key(m), m) for m in records)
+    if state:
+        after = state.get("after")
+        if not isinstance(after, list) or (records and not same_key_shape(after, key(records[0]))):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        after = tuple(after)
+        keyed = (item for item in keyed if item[0] > after)
+    if limit is None:
+        return Page([m for _, m in sorted(keyed, key=lambda item: item[0])])
+    chosen = heapq.nsmallest(limit + 1, keyed, key=lambda item: item[0])
+    next_cursor = None
+    if len(chosen) > limit:
+        chosen = chosen[:limit]
+        next_cursor = encode_cursor({"sort": sort, "after": list(chosen[-1][0])})
+    return Page([m for _, m in chosen], next_cursor)
+
+# Sparse fieldsets - ?fields=a,b,c or ?view=summary on list endpoints
+MUSEUM_SUMMARY_FIELDS = tuple(MuseumSummary.model_fields)
+
+def museum_projection(fields: Optional[str], view: Optional[str]) -> Optional[tuple]:
+    """Fields to return for each museum, or None for the full Museum model"""
+    if view not in (None, "full", "summary"):
+        raise HTTPException(status_code=400, detail="view must be 'full' or 'summary'")
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in Museum.model_fields]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown museum fields: {', '.join(unknown)}")
+        return tuple(dict.fromkeys(["id"] + requested))
+    if view == "summary":
+        return MUSEUM_SUMMARY_FIELDS
+    return None
+
+def render_museums(catalog: CatalogStore, records: List[dict], projection: Optional[tuple]) -> list:
+    """Full Museum models, or plain dicts holding only the projected fields.
+
+    Projected records skip model construction entirely: catalog records were validated when
+    they were loaded or written, so the stored values can be copied out as they are.
+    """
+    if projection is None:
+        return catalog.models(records)
+    defaults = {f: Museum.model_fields[f].get_default(call_default_factory=False) for f in projection}
+    return [{f: m.get(f, defaults[f]) for f in projection} for m in records]
 
 # API Routes
 @api_router.get("/")
 async def root():
     return {"message": "Museums Of London API"}
 
+def museum_list_key(category: Optional[str] = None, free_only: bool = False, search: Optional[str] = None,
+                    match: str = "all", fuzzy: bool = False, projection: Optional[tuple] = None,
+                    sort: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> tuple:
+    """Response cache key of a GET /museums; the defaults are the unfiltered list"""
+    return ("museums", category.lower() if category else None, free_only, search.lower() if search else None, match, fuzzy,
+            projection, sort, limit, cursor)
+
 @api_router.get("/museums", response_model=List[Museum])
-async def get_museums(category: Optional[str] = None, free_only: bool = False, search: Optional[str] = None):
-    """Get all museums with optional filtering"""
-    museums = LONDON_MUSEUMS.copy()
-    
-    if category:
-        museums = [m for m in museums if category.lower() in m["category"].lower()]
+async def get_museums(
+    category: Optional[str] = None,
+    free_only: bool = False,
+    search: Optional[str] = None,
+    match: str = "all",
+    fuzzy: bool = False,
+    fields: Optional[str] = None,
+    view: Optional[str] = None,
+    sort: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    lat: Optional[float] = None,
+    lon: Optional[float] = None,
+):
+    """Get all museums with optional filtering; `search` results are ranked by relevance.
     
-    if free_only:
-        museums = [m for m in museums if m["free_entry"]]
+    match=all requires every search term to appear, match=any accepts any of them.
+    fuzzy=true matches museum and eatery names approximately, so typos still find results.
+    fields=name,rating,... or view=summary return only those fields of each museum.
+    sort=rating|name|distance|created_at orders the list (distance needs lat and lon), and
+    limit pages through it; pass the X-Next-Cursor response header back as `cursor`.
+    """
+    if match not in ("all", "any"):
+        raise HTTPException(status_code=400, detail="match must be 'all' or 'any'")
+    projection = museum_projection(fields, view)
+    if sort is not None and sort not in MUSEUM_SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(MUSEUM_SORTS)}")
+    if sort == "distance" and (lat is None or lon is None):
+        raise HTTPException(status_code=400, detail="sort=distance requires lat and lon")
+    if limit is not None and not 1 <= limit <= 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+    catalog = catalogs.current
     
-    if search:
-        search_lower = search.lower()
-        museums = [m for m in museums if 
-                   search_lower in m["name"].lower() or 
-                   search_lower in m["description"].lower() or
-                   search_lower in m["category"].lower()]
+    def build():
+        museums = catalog.select(category=category, free_only=free_only)
+        
+        if search:
+            index = catalog.trigram_index if fuzzy else catalog.search_index
+            ranked = catalog.get_many(index.search(search, match_all=match == "all"))
+            if category or free_only:
+                allowed = {m["id"] for m in museums}
+                ranked = [m for m in ranked if m["id"] in allowed]
+            museums = ranked
+        
+        if sort is None and limit is None and cursor is None:
+            return render_museums(catalog, museums, projection)
+        page = paginate(museums, limit, cursor, sort=sort, key=museum_sort_key(sort, lat, lon) if sort else None)
+        page.items = render_museums(catalog, page.items, projection)
+        return page
     
-    return [Museum(**m) for m in museums]
+    if sort == "distance":
+        # Keyed on an arbitrary point, so not worth caching
+        return page_response(build())
+    key = museum_list_key(category, free_only, search, match, fuzzy, projection, sort, limit, cursor)
+    return cached_json_response(catalog, key, build)
 
 @api_router.get("/museums/featured", response_model=List[Museum])
-async def get_featured_museums():
+async def get_featured_museums(fields: Optional[str] = None, view: Optional[str] = None):
     """Get featured museums for home page"""
-    featured = [m for m in LONDON_MUSEUMS if m["featured"]]
-    return [Museum(**m) for m in featured]
+    projection = museum_projection(fields, view)
+    catalog = catalogs.current
+    return cached_json_response(catalog, ("featured", projection), lambda: render_museums(catalog, catalog.featured(), projection))
 
 @api_router.get("/museums/categories")
 async def get_categories():
     """Get all unique categories"""
-    categories = list(set(m["category"] for m in LONDON_MUSEUMS))
-    return sorted(categories)
+    catalog = catalogs.current
+    return cached_json_response(catalog, "categories", catalog.categories)
+
+@api_router.get("/museums/suggest", response_model=List[Suggestion])
+async def suggest_museums(q: str = "", limit: int = 8):
+    """Typeahead suggestions (museums, categories, stations, eateries) for the search box"""
+    return catalogs.current.suggest_index.suggest(q, limit=max(1, min(limit, 20)))
+
+@api_router.get("/museums/nearby", response_model=List[NearbyMuseum])
+async def get_nearby_museums(lat: float, lon: float, radius_m: Optional[float] = None, k: int = 10):
+    """Museums nearest to a point, closest first, with their distance in metres"""
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise HTTPException(status_code=400, detail="lat/lon out of range")
+    if radius_m is not None and not (math.isfinite(radius_m) and radius_m > 0):
+        raise HTTPException(status_code=400, detail="radius_m must be a positive number")
+    k = max(1, min(k, 100))
+    catalog = catalogs.current
+    return json_response([
+        {**catalog.get(museum_id), "distance_m": round(distance, 1)}
+        for distance, museum_id in catalog.grid_index.nearest(lat, lon, k, radius_m=radius_m)
+    ])
+
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+async def ndjson_museums(catalog: CatalogStore, since: Optional[datetime]):
+    """One JSON museum per line, flushed in ~64 KB chunks; memory stays bounded by one chunk.
+    
+    The whole export reads the one snapshot it was started with, however long the client takes.
+    """
+    chunk = bytearray()
+    for record in catalog:
+        museum_id = record["id"]
+        if since is not None and record["created_at"] <= since:
+            continue
+        body = shared_catalog.body(catalog, museum_id)
+        chunk += body if body is not None else catalog.model(museum_id).model_dump_json().encode("utf-8")
+        chunk += b"\n"
+        if len(chunk) >= EXPORT_CHUNK_BYTES:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+@api_router.get("/museums/export")
+async def export_museums(format: str = "ndjson", since: Optional[datetime] = None):
+    """Stream the full catalog, embedded eateries and transport included, as NDJSON.
+    
+    since=<ISO datetime> limits the export to museums created after that time.
+    """
+    if format != "ndjson":
+        raise HTTPException(status_code=400, detail="format must be 'ndjson'")
+    if since is not None and since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return StreamingResponse(ndjson_museums(catalogs.current, since), media_type="application/x-ndjson")
+
+class CatalogChanges(BaseModel):
+    seq: int
+    reset: bool
+    upserts: List[Museum]
+    tombstones: List[str]
+
+def catalog_changes(catalog: CatalogSnapshot, since: Optional[int], cursor: int) -> dict:
+    changelog = catalog.changelog
+    if since is None or since < changelog.floor:
+        return {"seq": cursor, "reset": True, "upserts": catalog.models(list(catalog)), "tombstones": []}
+    upserts, tombstones = changelog.since(since)
+    return {"seq": cursor, "reset": False, "upserts": catalog.models(catalog.get_many(upserts)), "tombstones": tombstones}
+
+@api_router.get("/museums/changes", response_model=CatalogChanges)
+async def get_museum_changes(since: Optional[int] = None):
+    """Museums added, edited or deleted since a sync position, for clients that keep the catalog locally.
+    
+    Pass the `seq` from the previous response as since=. `upserts` are full museums to store and
+    `tombstones` the ids to drop. When `reset` is true (no since=, since= older than the compacted
+    change log, or since= past every write the database has allocated) `upserts` is the whole
+    catalog and replaces the local copy. The returned seq stops at the writes this server's sync
+    has confirmed, so an answer may repeat a change; applying it twice is harmless. A since= from
+    a server whose sync is further along gets an empty answer at that same seq until this one
+    catches up.
+    """
+    if not catalog_sync.hydrated:
+        raise HTTPException(status_code=503, detail="Catalog is still loading")
+    catalog = catalogs.current
+    cursor = catalog_sync.applied
+    if since is not None and since > cursor:
+        if since <= await catalog_sync.read_seq(db):
+            # Handed out by another worker; the client already holds everything up to it
+            return json_response({"seq": since, "reset": False, "upserts": [], "tombstones": []})
+        # Never handed out by any worker (a wiped or restored database); the client has to reset
+        since = None
+    return cached_json_response(catalog, ("changes", since, cursor), lambda: catalog_changes(catalog, since, cursor))
 
 @api_router.get("/museums/{museum_id}", response_model=Museum)
 async def get_museum(museum_id: str):
     """Get a specific museum by ID"""
-    museum = next((m for m in LONDON_MUSEUMS if m["id"] == museum_id), None)
+    catalog = catalogs.current
+    museum = catalog.get(museum_id)
     if not museum:
         raise HTTPException(status_code=404, detail="Museum not found")
-    return Museum(**museum)
+    return cached_json_response(catalog, ("museum", museum_id), lambda: catalog.model(museum_id))
+
+@api_router.get("/eateries/near", response_model=List[EateryNearPoint])
+async def get_eateries_near(lat: float, lon: float, max_m: float = 500, cuisine: Optional[str] = None,
+                            price_range: Optional[str] = None, k: int = 20):
+    """Eateries near any point, closest first, optionally filtered by cuisine and price range"""
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise HTTPException(status_code=400, detail="lat/lon out of range")
+    if not (math.isfinite(max_m) and max_m > 0):
+        raise HTTPException(status_code=400, detail="max_m must be a positive number")
+    if price_range and price_range not in PRICE_RANGES:
+        raise HTTPException(status_code=400, detail=f"price_range must be one of {', '.join(PRICE_RANGES)}")
+    return catalogs.current.eatery_index.near(lat, lon, max_m, cuisine=cuisine, price_range=price_range, k=max(1, min(k, 100)))
+
+# User identity - favorites and custom tours belong to the device that made them
+ANONYMOUS_USER = "anonymous"
+USER_ID_PATTERN = re.compile(r"[A-Za-z0-9_.:-]{1,128}")
+
+@user_scoped
+def current_user_id(x_device_id: Optional[str] = Header(None)) -> str:
+    """Owner of the request; clients without an X-Device-Id header share the anonymous list"""
+    if x_device_id is None:
+        return ANONYMOUS_USER
+    if not USER_ID_PATTERN.fullmatch(x_device_id):
+        raise HTTPException(status_code=400, detail="Invalid X-Device-Id header")
+    return x_device_id
 
 # Favorites endpoints (stored in MongoDB)
+MAX_FAVORITES_CHECK = 500
+
+@api_router.post("/favorites/check")
+async def check_favorites(check: FavoritesCheck, user_id: str = Depends(current_user_id)):
+    """Check many museums at once; one indexed $in query answers {museum_id: is_favorite}"""
+    museum_ids = list(dict.fromkeys(check.museum_ids))
+    if len(museum_ids) > MAX_FAVORITES_CHECK:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_FAVORITES_CHECK} museum IDs per check")
+    favorited = set()
+    if museum_ids:
+        cursor = db.favorites.find({"user_id": user_id, "museum_id": {"$in": museum_ids}}, {"museum_id": 1, "_id": 0})
+        favorited = {f["museum_id"] async for f in cursor}
+    return {mid: mid in favorited for mid in museum_ids}
+
 @api_router.post("/favorites/{museum_id}")
-async def add_favorite(museum_id: str):
-    """Add a museum to favorites"""
+async def add_favorite(museum_id: str, user_id: str = Depends(current_user_id)):
+    """Add a museum to favorites; idempotent, `created` tells a new favorite from an existing one.
+    
+    One upsert against the unique (user_id, museum_id) index does the check and the insert,
+    so concurrent adds of the same museum settle on a single document.
+    """
     # Check if museum exists
-    museum = next((m for m in LONDON_MUSEUMS if m["id"] == museum_id), None)
-    if not museum:
+    if museum_id not in catalogs.current:
         raise HTTPException(status_code=404, detail="Museum not found")
     
-    # Check if already favorited
-    existing = await db.favorites.find_one({"museum_id": museum_id})
-    if existing:
-        return {"message": "Already in favorites", "id": existing["id"]}
+    key = {"user_id": user_id, "museum_id": museum_id}
+    favorite = Favorite(**key)
+    try:
+        stored = await db.favorites.find_one_and_update(
+            key,
+            {"$setOnInsert": favorite.dict(exclude=set(key))},
+            projection={"_id": 0, "id": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        # Two upserts raced to insert; the other one won, so read its document
+        stored = await db.favorites.find_one(key, {"_id": 0, "id": 1})
     
-    favorite = Favorite(museum_id=museum_id)
-    await db.favorites.insert_one(favorite.dict())
-    return {"message": "Added to favorites", "id": favorite.id}
+    created = stored["id"] == favorite.id
+    message = "Added to favorites" if created else "Already in favorites"
+    return {"message": message, "id": stored["id"], "created": created}
 
 @api_router.delete("/favorites/{museum_id}")
-async def remove_favorite(museum_id: str):
+async def remove_favorite(museum_id: str, user_id: str = Depends(current_user_id)):
     """Remove a museum from favorites"""
-    result = await db.favorites.delete_one({"museum_id": museum_id})
+    result = await db.favorites.delete_one({"user_id": user_id, "museum_id": museum_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Favorite not found")
     return {"message": "Removed from favorites"}
 
+MAX_FAVORITES_PAGE = 500
+
 @api_router.get("/favorites")
-async def get_favorites():
-    """Get all favorite museums"""
-    favorites = await db.favorites.find().to_list(100)
-    museum_ids = [f["museum_id"] for f in favorites]
+async def get_favorites(fields: Optional[str] = None, view: Optional[str] = None, limit: Optional[int] = None,
+                        cursor: Optional[str] = None, user_id: str = Depends(current_user_id)):
+    """Get favorite museums, oldest first.
+    
+    Without `limit` every favorite is returned; with it, pages follow the X-Next-Cursor header.
+    """
+    projection = museum_projection(fields, view)
+    if limit is not None and not 1 <= limit <= MAX_FAVORITES_PAGE:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_FAVORITES_PAGE}")
     
-    # Get full museum details for favorites
-    favorite_museums = [m for m in LONDON_MUSEUMS if m["id"] in museum_ids]
-    return [Museum(**m) for m in favorite_museums]
+    query = {"user_id": user_id}
+    if cursor:
+        state = decode_cursor(cursor)
+        try:
+            after_created_at, after_id = datetime.fromisoformat(state["created_at"]), state["id"]
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query["$or"] = [
+            {"created_at": {"$gt": after_created_at}},
+            {"created_at": after_created_at, "id": {"$gt": after_id}},
+        ]
+    # Stable (created_at, id) order; only the fields needed for the join and the cursor
+    favorites = db.favorites.find(query, {"_id": 0, "museum_id": 1, "created_at": 1, "id": 1})
+    favorites = favorites.sort([("created_at", 1), ("id", 1)])
+    if limit is not None:
+        favorites = favorites.limit(limit + 1)
+    favorites = [f async for f in favorites]
+    
+    next_cursor = None
+    if limit is not None and len(favorites) > limit:
+        favorites = favorites[:limit]
+        last = favorites[-1]
+        next_cursor = encode_cursor({"created_at": last["created_at"].isoformat(), "id": last["id"]})
+    
+    # Get museum details for favorites
+    catalog = catalogs.current
+    museums = catalog.get_many([f["museum_id"] for f in favorites])
+    return page_response(Page(render_museums(catalog, museums, projection), next_cursor))
 
 @api_router.get("/favorites/check/{museum_id}")
-async def check_favorite(museum_id: str):
+async def check_favorite(museum_id: str, user_id: str = Depends(current_user_id)):
     """Check if a museum is favorited"""
-    existing = await db.favorites.find_one({"museum_id": museum_id})
+    existing = await db.favorites.find_one({"user_id": user_id, "museum_id": museum_id}, {"_id": 1})
     return {"is_favorite": existing is not None}
 
 # Walking Tours - Pre-defined tours
@@ -1183,30 +1743,37 @@ WALKING_TOURS = [
     }
 ]
 
-@api_router.get("/tours")
-async def get_walking_tours():
-    """Get all pre-defined walking tours"""
+WALKING_TOURS_BY_ID = {t["id"]: t for t in WALKING_TOURS}
+
+def render_walking_tours(catalog: CatalogStore, projection: Optional[tuple]) -> list:
     tours_with_museums = []
     for tour in WALKING_TOURS:
         tour_data = tour.copy()
-        tour_data["museums"] = [
-            Museum(**m) for m in LONDON_MUSEUMS if m["id"] in tour["museum_ids"]
-        ]
+        tour_data["museums"] = render_museums(catalog, catalog.get_many(tour["museum_ids"]), projection)
         tours_with_museums.append(tour_data)
     return tours_with_museums
 
+@api_router.get("/tours")
+async def get_walking_tours(fields: Optional[str] = None, view: Optional[str] = None):
+    """Get all pre-defined walking tours"""
+    projection = museum_projection(fields, view)
+    catalog = catalogs.current
+    return cached_json_response(catalog, ("tours", projection), lambda: render_walking_tours(catalog, projection))
+
 @api_router.get("/tours/{tour_id}")
 async def get_tour(tour_id: str):
     """Get a specific tour with museum details"""
-    tour = next((t for t in WALKING_TOURS if t["id"] == tour_id), None)
+    tour = WALKING_TOURS_BY_ID.get(tour_id)
     if not tour:
         raise HTTPException(status_code=404, detail="Tour not found")
+    catalog = catalogs.current
     
-    tour_data = tour.copy()
-    tour_data["museums"] = [
-        Museum(**m) for m in LONDON_MUSEUMS if m["id"] in tour["museum_ids"]
-    ]
-    return tour_data
+    def build():
+        tour_data = tour.copy()
+        tour_data["museums"] = catalog.models(catalog.get_many(tour["museum_ids"]))
+        return tour_data
+    
+    return cached_json_response(catalog, ("tour", tour_id), build)
 
 # Custom tour creation
 class CustomTourCreate(BaseModel):
@@ -1215,48 +1782,226 @@ class CustomTourCreate(BaseModel):
 
 class CustomTour(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
     name: str
     museum_ids: List[str]
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+# Route optimization - visit order for a set of museums over a haversine distance matrix
+WALKING_SPEED_M_PER_MIN = 80.0  # about 4.8 km/h
+WALKING_DETOUR_FACTOR = 1.3  # street distance vs. straight line in central London
+EXACT_ROUTE_MAX_STOPS = 10
+MAX_ROUTE_STOPS = 50  # the heuristic is O(n^3): about 25 ms at 50 stops, over a second at 200
+
+def distance_matrix(points: List[tuple]) -> np.ndarray:
+    """Pairwise haversine distances in metres between (lat, lon) points"""
+    coords = np.radians(np.asarray(points, dtype=np.float64))
+    lat, lon = coords[:, 0:1], coords[:, 1:2]
+    a = np.sin((lat - lat.T) / 2) ** 2 + np.cos(lat) * np.cos(lat.T) * np.sin((lon - lon.T) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def shortest_path_exact(matrix: np.ndarray) -> List[int]:
+    """Held-Karp DP for the shortest open path through every stop (any start, any end)"""
+    n = len(matrix)
+    full = (1 << n) - 1
+    cost = np.full((1 << n, n), np.inf)
+    parent = np.full((1 << n, n), -1, dtype=np.int64)
+    for j in range(n):
+        cost[1 << j, j] = 0.0
+    for mask in range(1, full + 1):
+        row = cost[mask]
+        if not np.isfinite(row).any():
+            continue
+        # Best way to step from any stop in `mask` to each stop k
+        steps = row[:, None] + matrix
+        best_from = steps.argmin(axis=0)
+        best = steps[best_from, np.arange(n)]
+        for k in range(n):
+            if mask & (1 << k):
+                continue
+            next_mask = mask | (1 << k)
+            if best[k] < cost[next_mask, k]:
+                cost[next_mask, k] = best[k]
+                parent[next_mask, k] = best_from[k]
+    last = int(cost[full].argmin())
+    order, mask = [], full
+    while last != -1:
+        order.append(last)
+        last, mask = int(parent[mask, last]), mask & ~(1 << last)
+    return order[::-1]
+
+def path_length(matrix: np.ndarray, order: List[int]) -> float:
+    return float(sum(matrix[a, b] for a, b in zip(order, order[1:])))
+
+def shortest_path_heuristic(matrix: np.ndarray) -> List[int]:
+    """Best nearest-neighbour path over all starts, then 2-opt until no reversal helps"""
+    n = len(matrix)
+    best_order, best_length = None, math.inf
+    for start in range(n):
+        order, unvisited = [start], set(range(n)) - {start}
+        while unvisited:
+            here = order[-1]
+            step = min(unvisited, key=lambda stop: matrix[here, stop])
+            order.append(step)
+            unvisited.remove(step)
+        length = path_length(matrix, order)
+        if length < best_length:
+            best_order, best_length = order, length
+
+    order = best_order
+    improved = True
+    while improved:
+        improved = False
+        for i in range(n - 1):
+            for j in range(i + 1, n):
+                # Reversing order[i..j] only changes the edges entering i and leaving j
+                before = after = 0.0
+                if i > 0:
+                    before += matrix[order[i - 1], order[i]]
+                    after += matrix[order[i - 1], order[j]]
+                if j < n - 1:
+                    before += matrix[order[j], order[j + 1]]
+                    after += matrix[order[i], order[j + 1]]
+                if after < before - 1e-9:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    improved = True
+    return order
+
+def walking_minutes(distance_m: float) -> int:
+    return math.ceil(distance_m * WALKING_DETOUR_FACTOR / WALKING_SPEED_M_PER_MIN)
+
+class RouteOptimizer:
+    """Shortest walking order for a set of museums, cached per id set for the newest catalog snapshot.
+
+    Solving is CPU-bound, so a cache miss is solved in a worker thread rather than on the event loop.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._version = None
+        self._routes = OrderedDict()
+        self._max_entries = max_entries
+
+    async def optimize(self, catalog: CatalogStore, museum_ids: List[str]) -> dict:
+        key = frozenset(museum_ids)
+        if len(key) > MAX_ROUTE_STOPS:
+            raise HTTPException(status_code=400, detail=f"A route can have at most {MAX_ROUTE_STOPS} museums")
+        solve = asyncio.get_running_loop().run_in_executor
+        if self._version != catalog.version:
+            if self._version is not None and catalog.version < self._version:
+                # An older snapshot; don't cache its route
+                return await solve(None, self._solve, catalog, sorted(key))
+            self._routes.clear()
+            self._version = catalog.version
+        route = self._routes.get(key)
+        if route is not None:
+            self._routes.move_to_end(key)
+            return route
+        route = await solve(None, self._solve, catalog, sorted(key))
+        if self._version != catalog.version:
+            return route  # a newer snapshot took over the cache while this one was solving
+        self._routes[key] = route
+        if len(self._routes) > self._max_entries:
+            self._routes.popitem(last=False)
+        return route
+
+    def _solve(self, catalog: CatalogStore, museum_ids: List[str]) -> dict:
+        museums = catalog.get_many(museum_ids)
+        matrix = distance_matrix([(m["latitude"], m["longitude"]) for m in museums])
+        if len(museums) <= 2:
+            order = list(range(len(museums)))
+        elif len(museums) <= EXACT_ROUTE_MAX_STOPS:
+            order = shortest_path_exact(matrix)
+        else:
+            order = shortest_path_heuristic(matrix)
+        legs = [
+            {
+                "from": museums[a]["id"],
+                "to": museums[b]["id"],
+                "distance_m": round(float(matrix[a, b]), 1),
+                "walking_minutes": walking_minutes(float(matrix[a, b])),
+            }
+            for a, b in zip(order, order[1:])
+        ]
+        total = path_length(matrix, order)
+        return {
+            "museum_ids": [museums[i]["id"] for i in order],
+            "legs": legs,
+            "total_distance_m": round(total, 1),
+            "walking_minutes": walking_minutes(total),
+        }
+
+route_optimizer = RouteOptimizer()
+
 @api_router.post("/tours/custom")
-async def create_custom_tour(tour: CustomTourCreate):
-    """Create a custom walking tour"""
+async def create_custom_tour(tour: CustomTourCreate, optimize: bool = False, user_id: str = Depends(current_user_id)):
+    """Create a custom walking tour; optimize=true reorders the museums into the shortest walk"""
+    catalog = catalogs.current
     # Validate all museum IDs exist
-    all_museum_ids = [m["id"] for m in LONDON_MUSEUMS]
     for mid in tour.museum_ids:
-        if mid not in all_museum_ids:
+        if mid not in catalog:
             raise HTTPException(status_code=400, detail=f"Museum ID {mid} not found")
     
-    custom_tour = CustomTour(name=tour.name, museum_ids=tour.museum_ids)
+    museum_ids = tour.museum_ids
+    route = None
+    if optimize and museum_ids:
+        route = await route_optimizer.optimize(catalog, museum_ids)
+        museum_ids = route["museum_ids"]
+    
+    custom_tour = CustomTour(user_id=user_id, name=tour.name, museum_ids=museum_ids)
     await db.custom_tours.insert_one(custom_tour.dict())
     
-    return {
+    result = {
         "id": custom_tour.id,
         "name": custom_tour.name,
         "museum_ids": custom_tour.museum_ids,
-        "museums": [Museum(**m) for m in LONDON_MUSEUMS if m["id"] in tour.museum_ids]
+        "museums": catalog.models(catalog.get_many(museum_ids))
+    }
+    if route is not None:
+        result["route"] = route
+    return result
+
+@api_router.post("/tours/custom/{tour_id}/optimize")
+async def optimize_custom_tour(tour_id: str, user_id: str = Depends(current_user_id)):
+    """Reorder a saved custom tour into the shortest walking route"""
+    tour = await db.custom_tours.find_one({"user_id": user_id, "id": tour_id})
+    if not tour:
+        raise HTTPException(status_code=404, detail="Custom tour not found")
+    
+    catalog = catalogs.current
+    museum_ids = [mid for mid in tour["museum_ids"] if mid in catalog]
+    if not museum_ids:
+        raise HTTPException(status_code=400, detail="Custom tour has no museums to route")
+    route = await route_optimizer.optimize(catalog, museum_ids)
+    await db.custom_tours.update_one({"user_id": user_id, "id": tour_id}, {"$set": {"museum_ids": route["museum_ids"]}})
+    
+    return {
+        "id": tour["id"],
+        "name": tour["name"],
+        "museum_ids": route["museum_ids"],
+        "museums": catalog.models(catalog.get_many(route["museum_ids"])),
+        "route": route,
     }
 
 @api_router.get("/tours/custom/list")
-async def get_custom_tours():
-    """Get all custom tours"""
-    tours = await db.custom_tours.find().to_list(100)
+async def get_custom_tours(user_id: str = Depends(current_user_id)):
+    """Get this user's custom tours, oldest first"""
+    tours = await db.custom_tours.find({"user_id": user_id}, {"_id": 0}).sort("created_at", 1).to_list(100)
+    catalog = catalogs.current
     result = []
     for tour in tours:
         tour_data = {
             "id": tour["id"],
             "name": tour["name"],
             "museum_ids": tour["museum_ids"],
-            "museums": [Museum(**m) for m in LONDON_MUSEUMS if m["id"] in tour["museum_ids"]]
+            "museums": catalog.models(catalog.get_many(tour["museum_ids"]))
         }
         result.append(tour_data)
     return result
 
 @api_router.delete("/tours/custom/{tour_id}")
-async def delete_custom_tour(tour_id: str):
+async def delete_custom_tour(tour_id: str, user_id: str = Depends(current_user_id)):
     """Delete a custom tour"""
-    result = await db.custom_tours.delete_one({"id": tour_id})
+    result = await db.custom_tours.delete_one({"user_id": user_id, "id": tour_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Custom tour not found")
     return {"message": "Custom tour deleted"}
@@ -1290,29 +2035,43 @@ class MuseumCreateAdmin(BaseModel):
     featured: bool = False
     rating: float = 4.5
 
+def validate_museum_record(record: dict) -> Museum:
+    """Reject an admin payload up front (422) instead of storing a record that cannot be served"""
+    try:
+        return Museum.model_validate(record)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=jsonable_encoder(e.errors(include_url=False, include_context=False)))
+
 @api_router.post("/admin/museums")
 async def add_museum(museum: MuseumCreateAdmin, pin: str):
     """Add a new museum (admin only)"""
     if pin != ADMIN_PIN:
         raise HTTPException(status_code=401, detail="Invalid admin PIN")
     
+    if not catalog_sync.hydrated:
+        raise HTTPException(status_code=503, detail="Catalog is still loading")
+    
     # Generate new ID
-    existing_ids = [int(m["id"]) for m in LONDON_MUSEUMS if m["id"].isdigit()]
-    new_id = str(max(existing_ids) + 1) if existing_ids else "21"
+    new_id, = await allocate_museum_ids(db, 1)
     
     new_museum = {
         "id": new_id,
         **museum.dict(),
         "created_at": datetime.utcnow().isoformat()
     }
+    validate_museum_record(new_museum)
     
-    # Store in database
-    await db.museums.insert_one(new_museum)
+    # Store in database; the seq lets other workers pick the new museum up
+    seq = await next_catalog_seq(db)
+    try:
+        await db.museums.insert_one({**new_museum, "seq": seq})
+    finally:
+        await commit_catalog_seq(db, seq)
     
-    # Add to in-memory list
-    LONDON_MUSEUMS.append(new_museum)
+    # Publish a catalog snapshot that includes it
+    catalog = await catalogs.apply([(new_id, new_museum, seq)])
     
-    return {"message": "Museum added successfully", "id": new_id, "museum": Museum(**new_museum)}
+    return {"message": "Museum added successfully", "id": new_id, "museum": catalog.model(new_id)}
 
 @api_router.put("/admin/museums/{museum_id}")
 async def update_museum(museum_id: str, museum: MuseumCreateAdmin, pin: str):
@@ -1320,23 +2079,28 @@ async def update_museum(museum_id: str, museum: MuseumCreateAdmin, pin: str):
     if pin != ADMIN_PIN:
         raise HTTPException(status_code=401, detail="Invalid admin PIN")
     
-    # Find museum index
-    museum_index = next((i for i, m in enumerate(LONDON_MUSEUMS) if m["id"] == museum_id), None)
-    if museum_index is None:
+    if not catalog_sync.hydrated:
+        raise HTTPException(status_code=503, detail="Catalog is still loading")
+    if museum_id not in catalogs.current:
         raise HTTPException(status_code=404, detail="Museum not found")
     
     updated_museum = {
         "id": museum_id,
         **museum.dict()
     }
+    validate_museum_record(updated_museum)
     
     # Update in database
-    await db.museums.update_one({"id": museum_id}, {"$set": updated_museum}, upsert=True)
+    seq = await next_catalog_seq(db)
+    try:
+        await db.museums.update_one({"id": museum_id}, {"$set": {**updated_museum, "seq": seq, "deleted": False, "admin_edited": True}}, upsert=True)
+    finally:
+        await commit_catalog_seq(db, seq)
     
-    # Update in-memory list
-    LONDON_MUSEUMS[museum_index] = updated_museum
+    # Publish a catalog snapshot with the new version
+    catalog = await catalogs.apply([(museum_id, updated_museum, seq)])
     
-    return {"message": "Museum updated successfully", "museum": Museum(**updated_museum)}
+    return {"message": "Museum updated successfully", "museum": catalog.model(museum_id)}
 
 @api_router.delete("/admin/museums/{museum_id}")
 async def delete_museum(museum_id: str, pin: str):
@@ -1344,19 +2108,628 @@ async def delete_museum(museum_id: str, pin: str):
     if pin != ADMIN_PIN:
         raise HTTPException(status_code=401, detail="Invalid admin PIN")
     
-    # Find museum
-    museum_index = next((i for i, m in enumerate(LONDON_MUSEUMS) if m["id"] == museum_id), None)
-    if museum_index is None:
+    if not catalog_sync.hydrated:
+        raise HTTPException(status_code=503, detail="Catalog is still loading")
+    if museum_id not in catalogs.current:
         raise HTTPException(status_code=404, detail="Museum not found")
     
-    # Delete from database
-    await db.museums.delete_one({"id": museum_id})
+    # Delete from database, leaving a tombstone so other workers drop it too
+    seq = await next_catalog_seq(db)
+    try:
+        await db.museums.update_one({"id": museum_id}, {"$set": {"deleted": True, "seq": seq}}, upsert=True)
+    finally:
+        await commit_catalog_seq(db, seq)
     
-    # Remove from in-memory list
-    LONDON_MUSEUMS.pop(museum_index)
+    # Publish a catalog snapshot without it
+    await catalogs.apply([(museum_id, None, seq)])
     
     return {"message": "Museum deleted successfully"}
 
+# Bulk import - a JSON array or CSV file of museums, all validated before any write and written with one bulk_write
+MAX_BULK_MUSEUMS = 5000
+MUSEUM_JSON_COLUMNS = ("transport", "nearby_eateries")
+
+class MuseumImportRow(MuseumCreateAdmin):
+    """A bulk upload row, typed all the way down so its one validation covers every check Museum makes"""
+    transport: List[TransportLink] = []
+    nearby_eateries: List[NearbyEatery] = []
+
+def parse_museum_csv(text: str) -> List[dict]:
+    """One dict per CSV row; blank cells are dropped so defaults apply, list columns hold JSON"""
+    rows = []
+    for row in csv.DictReader(io.StringIO(text)):
+        record = {key.strip(): value.strip() for key, value in row.items()
+                  if key and isinstance(value, str) and value.strip()}
+        for column in MUSEUM_JSON_COLUMNS:
+            if column in record:
+                try:
+                    record[column] = json.loads(record[column])
+                except ValueError:
+                    pass  # left as text so validation reports it against the row
+        rows.append(record)
+    return rows
+
+async def read_bulk_rows(request: Request) -> List[Any]:
+    """Rows from a JSON array body, a text/csv body, or a multipart upload in the "file" field"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    is_csv = content_type in ("text/csv", "application/csv")
+    if content_type == "multipart/form-data":
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Upload the museums as a file field named 'file'")
+        raw = await upload.read()
+        is_csv = (upload.filename or "").lower().endswith(".csv") or upload.content_type in ("text/csv", "application/csv")
+    else:
+        raw = await request.body()
+    try:
+        text = raw.decode("utf-8-sig")
+        rows = parse_museum_csv(text) if is_csv else json.loads(text)
+    except (UnicodeDecodeError, ValueError, csv.Error) as exc:
+        raise HTTPException(status_code=400, detail=f"Could not parse the upload: {exc}")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array or CSV rows of museums")
+    if len(rows) > MAX_BULK_MUSEUMS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_MUSEUMS} museums per upload")
+    return rows
+
+def validate_rows(rows: List[Any], errors: dict) -> dict:
+    """{row: MuseumImportRow} for the rows that pass; each failure's errors are filed under its row"""
+    valid = {}
+    for row, item in enumerate(rows):
+        try:
+            valid[row] = MuseumImportRow.model_validate(item)
+        except ValidationError as exc:
+            errors[row] = exc.errors(include_url=False, include_context=False)
+    return valid
+
+@api_router.post("/admin/museums/bulk")
+async def bulk_add_museums(request: Request, pin: str):
+    """Add many museums at once (admin only).
+    
+    Accepts a JSON array of museum objects, or CSV (as the request body or a multipart "file"
+    upload) with one column per field and the transport / nearby_eateries columns as JSON.
+    Rows are validated independently; the valid ones get ids from one counter reservation, are
+    written with an unordered bulk_write and go live in a single catalog snapshot. Rejected rows
+    are reported by their 0-based position in the upload and the rest are still added.
+    """
+    if pin != ADMIN_PIN:
+        raise HTTPException(status_code=401, detail="Invalid admin PIN")
+    if not catalog_sync.hydrated:
+        raise HTTPException(status_code=503, detail="Catalog is still loading")
+    
+    rows = await read_bulk_rows(request)
+    errors = {}
+    valid = validate_rows(rows, errors)
+    
+    records = {}
+    if valid:
+        # Each row was validated once, against every field type Museum has; the models are built
+        # from it directly and the catalog takes them as they are
+        created_at = datetime.utcnow()
+        ids = await allocate_museum_ids(db, len(valid))
+        records = {row: Museum.model_construct(id=museum_id, created_at=created_at, **dict(valid[row]))
+                   for row, museum_id in zip(valid, ids)}
+        documents = [{**museum.model_dump(), "created_at": created_at.isoformat()} for museum in records.values()]
+        seq = await next_catalog_seq(db)
+        ordered_rows = list(records)
+        try:
+            await db.museums.bulk_write(
+                [InsertOne({**document, "seq": seq}) for document in documents], ordered=False
+            )
+        except BulkWriteError as exc:
+            for write_error in exc.details.get("writeErrors", []):
+                row = ordered_rows[write_error["index"]]
+                errors.setdefault(row, []).append({"loc": [], "msg": write_error.get("errmsg", "Write failed"), "type": "write_error"})
+                del records[row]
+        finally:
+            await commit_catalog_seq(db, seq)
+        
+        # One snapshot, so the derived indexes are copied once for the whole batch
+        await catalogs.apply([(museum.id, museum, seq) for museum in records.values()])
+    
+    return {
+        "message": f"Added {len(records)} of {len(rows)} museums",
+        "created": len(records),
+        "ids": [museum.id for museum in records.values()],
+        "errors": [{"row": row, "errors": jsonable_encoder(errors[row])} for row in sorted(errors)],
+    }
+
+# Catalog sync - db.museums is the source of truth; each worker hydrates its catalog from it at
+# startup and then publishes snapshots with whatever other workers have written since
+CATALOG_SEQ_ID = "catalog_seq"
+MUSEUM_ID_COUNTER = "museum_id"
+CATALOG_POLL_SECONDS = 2.0
+# How long a poll waits for an allocated seq's writer to commit before assuming it died
+CATALOG_GAP_SECONDS = 60.0
+
+def builtin_hash(record: dict) -> str:
+    """Content hash of a built-in museum as the data file defines it (created_at is assigned at load)"""
+    content = {k: v for k, v in record.items() if k != "created_at"}
+    return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+async def next_catalog_seq(database) -> int:
+    """Allocate the sequence number stamped on the next museum write"""
+    counter = await database.counters.find_one_and_update(
+        {"_id": CATALOG_SEQ_ID}, {"$inc": {"value": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+    )
+    return counter["value"]
+
+async def commit_catalog_seq(database, seq: int):
+    """Record that the writes stamped with a seq have finished; polls do not read past a seq until then"""
+    await database.catalog_commits.update_one(
+        {"_id": seq}, {"$setOnInsert": {"committed_at": datetime.now(timezone.utc)}}, upsert=True
+    )
+
+async def allocate_museum_ids(database, count: int) -> List[str]:
+    """Reserve `count` consecutive numeric museum ids with one $inc; no two workers get the same id
+    and ids are never reused after a delete. Hydration raises the counter past every stored id."""
+    counter = await database.counters.find_one_and_update(
+        {"_id": MUSEUM_ID_COUNTER}, {"$inc": {"value": count}}, upsert=True, return_document=ReturnDocument.AFTER
+    )
+    last = counter["value"]
+    return [str(number) for number in range(last - count + 1, last + 1)]
+
+class CatalogSync:
+    """Keeps one worker's catalog snapshots in step with db.museums.
+    
+    Every museum document carries the `seq` of the write that last touched it and deletes leave a
+    `deleted` tombstone, so "what changed since N" is one range over the seq index. Workers poll
+    the counter document (a single _id lookup) and only query museums when it has moved. Change
+    streams would push instead, but they need a replica set and a single mongod is not one.
+    
+    A seq is allocated before its documents are written, and a slow writer can land them any number
+    of polls later. Writers therefore add a db.catalog_commits entry once they are done, and
+    `applied` only advances through a contiguous run of committed seqs: the first uncommitted one
+    stays the lower bound of every poll's read until it commits, or until CATALOG_GAP_SECONDS pass
+    and its writer is taken to have died. Re-applying an unchanged record is a no-op. Each hydrate
+    or poll publishes at most one snapshot.
+    """
+    
+    def __init__(self, publisher: CatalogPublisher):
+        self.catalogs = publisher
+        self.builtin = list(publisher.current)
+        self.applied = 0
+        self.gaps = {}
+        self.hydrated = False
+    
+    async def read_seq(self, database) -> int:
+        counter = await database.counters.find_one({"_id": CATALOG_SEQ_ID})
+        return counter["value"] if counter else 0
+    
+    async def seed(self, database):
+        """Insert the built-in museums the database has never seen and bring in edits to the data file.
+        
+        Each seeded document lists the hashes of every built-in version of it that has been applied.
+        A file record whose hash is not in that list overwrites the document, at a new seq so every
+        worker picks it up, unless the museum was deleted or an admin has edited it since: admin
+        changes win over the file. A hash is applied at most once, so workers still running an older
+        file during a rolling deploy never revert a newer one. Documents seeded before hashes were
+        stored count as admin-edited when their seq shows a write after the seed; otherwise they
+        hold the older file's record, whose hash joins the list with the new one.
+        """
+        hashes = {record["id"]: builtin_hash(record) for record in self.builtin}
+        stored = {doc["id"]: doc async for doc in database.museums.find({"id": {"$in": list(hashes)}}, {"_id": 0})}
+        changed = [
+            record for record in self.builtin
+            if (doc := stored.get(record["id"])) is not None
+            and not doc.get("deleted") and not doc.get("admin_edited")
+            and hashes[record["id"]] not in doc.get("builtin_hashes", ())
+            and ("builtin_hashes" in doc or not doc.get("seq"))
+        ]
+        operations = [
+            UpdateOne({"id": record["id"]},
+                      {"$setOnInsert": {**record, "seq": 0, "builtin_hashes": [hashes[record["id"]]]}}, upsert=True)
+            for record in self.builtin if record["id"] not in stored
+        ]
+        seq = None
+        if changed:
+            seq = await next_catalog_seq(database)
+            # created_at stays as first seeded; the worker-local load time in `record` is not content
+            operations += [
+                UpdateOne(
+                    {"id": record["id"], "deleted": {"$ne": True}, "admin_edited": {"$ne": True},
+                     "builtin_hashes": {"$ne": hashes[record["id"]]}},
+                    {"$set": {**{k: v for k, v in record.items() if k != "created_at"}, "seq": seq},
+                     "$addToSet": {"builtin_hashes": {"$each": self.applied_hashes(stored[record["id"]]) + [hashes[record["id"]]]}}},
+                )
+                for record in changed
+            ]
+            logger.info("Updating %d built-in museums changed in %s", len(changed), LONDON_MUSEUMS_SOURCE.name)
+        try:
+            if operations:
+                await database.museums.bulk_write(operations, ordered=False)
+        finally:
+            if seq is not None:
+                await commit_catalog_seq(database, seq)
+    
+    @staticmethod
+    def applied_hashes(doc: dict) -> List[str]:
+        if "builtin_hashes" in doc:
+            return []
+        try:
+            return [builtin_hash(Museum.model_validate(doc).model_dump())]
+        except ValidationError:
+            return []
+    
+    async def changes(self, cursor) -> List[tuple]:
+        """(museum_id, record or None, seq) for every document that differs from the current snapshot"""
+        catalog = self.catalogs.current
+        changes = []
+        async for doc in cursor:
+            museum_id = doc["id"]
+            seq = doc.get("seq", 0)
+            if doc.get("deleted"):
+                # Tombstones the snapshot does not hold yet still go into its change log
+                tombstones = catalog.changelog.tombstones
+                if museum_id in catalog or museum_id not in tombstones or tombstones[museum_id] < seq:
+                    changes.append((museum_id, None, seq))
+                continue
+            try:
+                record = Museum.model_validate(doc).model_dump()
+            except ValidationError as exc:
+                logger.warning("Skipping invalid museum %s from the database: %s", museum_id, exc)
+                continue
+            if catalog.get(museum_id) != record:
+                changes.append((museum_id, record, seq))
+        return changes
+    
+    async def hydrate(self, database):
+        """Bulk-load every museum, seeding the collection from the built-in catalog first"""
+        await self.seed(database)
+        counter = await self.read_seq(database)
+        # Commits expire, so only seqs above the oldest one still stored can be waiting on a writer
+        oldest = await database.catalog_commits.find_one({"_id": {"$lte": counter}}, sort=[("_id", 1)])
+        seq = await self.settle(database, oldest["_id"] - 1 if oldest else counter, counter)
+        catalog = await self.catalogs.apply(await self.changes(database.museums.find({}, {"_id": 0})), seq)
+        await self.raise_id_floor(database, catalog)
+        self.applied = seq
+        self.hydrated = True
+        logger.info("Catalog hydrated from MongoDB: %d museums at seq %d", len(catalog), seq)
+    
+    async def raise_id_floor(self, database, catalog: CatalogSnapshot):
+        """Lift the museum id counter past every numeric id ever stored, tombstones included"""
+        floor = int(catalog.next_id()) - 1
+        async for doc in database.museums.find({}, {"_id": 0, "id": 1}):
+            if str(doc.get("id", "")).isdigit():
+                floor = max(floor, int(doc["id"]))
+        await database.counters.update_one({"_id": MUSEUM_ID_COUNTER}, {"$max": {"value": floor}}, upsert=True)
+    
+    async def settle(self, database, start: int, counter: int) -> int:
+        """The highest seq up to `counter` with every seq after `start` committed or given up on"""
+        committed = {
+            doc["_id"] async for doc in
+            database.catalog_commits.find({"_id": {"$gt": start, "$lte": counter}}, {"_id": 1})
+        }
+        now = datetime.now(timezone.utc)
+        seq = start
+        while seq < counter and (seq + 1 in committed or self.abandoned(seq + 1, now)):
+            seq += 1
+        self.gaps = {gap: noticed for gap, noticed in self.gaps.items() if gap > seq}
+        return seq
+    
+    def abandoned(self, seq: int, now: datetime) -> bool:
+        noticed = self.gaps.setdefault(seq, now)
+        if (now - noticed).total_seconds() < CATALOG_GAP_SECONDS:
+            return False
+        logger.warning("Catalog seq %d was never committed; moving past it", seq)
+        return True
+    
+    async def poll(self, database):
+        """Publish the museums written since the last poll"""
+        counter = await self.read_seq(database)
+        if counter == self.applied:
+            return
+        seq = await self.settle(database, self.applied, counter)
+        cursor = database.museums.find({"seq": {"$gt": self.applied}}, {"_id": 0}).sort("seq", 1)
+        await self.catalogs.apply(await self.changes(cursor), seq)
+        self.applied = seq
+    
+    async def run(self, database):
+        while not self.hydrated:
+            try:
+                await self.hydrate(database)
+            except Exception as exc:
+                logger.warning("Catalog hydration failed: %s", exc)
+                await asyncio.sleep(CATALOG_POLL_SECONDS)
+        while True:
+            await asyncio.sleep(CATALOG_POLL_SECONDS)
+            try:
+                await self.poll(database)
+            except Exception as exc:
+                logger.warning("Catalog poll failed: %s", exc)
+
+catalog_sync = CatalogSync(catalogs)
+
+# Shared catalog snapshot - one worker writes the encoded JSON of every museum's detail and of the
+# catalog-wide lists the app loads on launch into a file on /dev/shm; all workers map it read-only
+# and serve those responses, and the export, straight from the same memory pages. Only encoded
+# bodies (and their gzip) are shared: each worker still holds its own records, models and indexes,
+# and caches filtered or paged responses itself, so what no longer grows with the worker count is
+# the body cache of the responses nearly every client asks for, not the catalog
+SHARED_SNAPSHOT_MAGIC = b"LMCSHM03"
+SHARED_SNAPSHOT_HEADER = struct.Struct("<8s16sII")  # magic, content digest, entry count, index offset
+SHARED_SNAPSHOT_ENTRY = struct.Struct("<QIQIH")  # body offset/length, gzip offset/length, key length; key bytes follow
+SHARED_SNAPSHOT_PATH = Path(os.environ.get(
+    "CATALOG_SHARED_SNAPSHOT",
+    (Path("/dev/shm") if Path("/dev/shm").is_dir() else DATA_DIR) / f"museums-{os.environ['DB_NAME']}.catalog",
+))
+
+def shared_key(key) -> bytes:
+    """A response cache key as stored in the shared file"""
+    return repr(key).encode("utf-8")
+
+def shared_responses(catalog: CatalogSnapshot):
+    """(response cache key, content) of every body the shared file carries"""
+    for record in catalog:
+        yield ("museum", record["id"]), catalog.model(record["id"])
+    for projection in (None, MUSEUM_SUMMARY_FIELDS):
+        yield museum_list_key(projection=projection), render_museums(catalog, catalog.select(), projection)
+        yield ("featured", projection), render_museums(catalog, catalog.featured(), projection)
+        yield ("tours", projection), render_walking_tours(catalog, projection)
+    yield "categories", catalog.categories()
+
+def write_shared_snapshot(path: Path, catalog: CatalogSnapshot):
+    """Lay the snapshot out as header | bodies | index and publish it with an atomic rename.
+    
+    Bodies big enough to be worth it are stored gzipped as well, so no worker compresses them again.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    index = bytearray()
+    count = 0
+    with open(tmp, "wb") as f:
+        offset = f.write(bytes(SHARED_SNAPSHOT_HEADER.size))
+        for key, content in shared_responses(catalog):
+            body = encode_json(content)
+            body_offset = offset
+            offset += f.write(body)
+            gzip_offset, gzip_length = offset, 0
+            if len(body) >= GZIP_MIN_BYTES:
+                gzip_length = f.write(gzip.compress(body, compresslevel=GZIP_BEST_LEVEL, mtime=0))
+                offset += gzip_length
+            key = shared_key(key)
+            index += SHARED_SNAPSHOT_ENTRY.pack(body_offset, len(body), gzip_offset, gzip_length, len(key))
+            index += key
+            count += 1
+        f.write(index)
+        f.seek(0)
+        f.write(SHARED_SNAPSHOT_HEADER.pack(SHARED_SNAPSHOT_MAGIC, catalog.digest.to_bytes(16, "big"), count, offset))
+    os.replace(tmp, path)
+
+class SharedCatalog:
+    """One worker's view of the shared snapshot, and the writer side for whichever worker holds the lock.
+    
+    Readers map the file read-only, so its pages live once in the page cache however many workers
+    there are. Publishing renames a complete file over the old one: a reader either has the old
+    mapping or the new one, never a mix, and remaps when the file's inode changes. A body is only
+    served for a catalog snapshot with the same content digest as the file, so the shared pages
+    never disagree with the snapshot a request is reading, even when two snapshots share a seq.
+    Each mapping keeps one CachedBody per key, over slices of the pages rather than copies, so a
+    hit neither copies nor hashes the body again.
+    """
+    
+    def __init__(self, path: Path, publisher: CatalogPublisher):
+        self.path = path
+        self.catalogs = publisher
+        self._lock = None
+        self._published = None
+        self._file_id = None
+        self._view = None  # (digest, memoryview of the mapping, {key: index entry}, {key: CachedBody})
+    
+    def acquire_writer(self) -> bool:
+        lock = open(self.path.with_name(self.path.name + ".lock"), "wb")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            return False
+        self._lock = lock  # held until the process exits; then another worker takes over
+        return True
+    
+    async def publish(self):
+        catalog = self.catalogs.current
+        if catalog.digest == self._published:
+            return
+        # Encoding and compressing read only the immutable snapshot, so all of it runs in a thread
+        await asyncio.get_running_loop().run_in_executor(None, write_shared_snapshot, self.path, catalog)
+        self._published = catalog.digest
+    
+    def refresh(self):
+        """Map the current file if it has been replaced since the last look"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if (stat.st_ino, stat.st_mtime_ns) == self._file_id:
+            return
+        # Remembered before parsing, so a truncated or foreign file is reported once, not every tick
+        self._file_id = (stat.st_ino, stat.st_mtime_ns)
+        if stat.st_size < SHARED_SNAPSHOT_HEADER.size:
+            return
+        with open(self.path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, digest, count, position = SHARED_SNAPSHOT_HEADER.unpack_from(mapping, 0)
+        if magic != SHARED_SNAPSHOT_MAGIC:
+            return
+        index = {}
+        for _ in range(count):
+            entry = SHARED_SNAPSHOT_ENTRY.unpack_from(mapping, position)
+            position += SHARED_SNAPSHOT_ENTRY.size
+            key_length = entry[4]
+            index[mapping[position:position + key_length]] = entry[:4]
+            position += key_length
+        # One reference swap; the old mapping stays valid for anyone still slicing it
+        self._view = (int.from_bytes(digest, "big"), memoryview(mapping), index, {})
+    
+    async def tick(self):
+        if self._lock is not None or self.acquire_writer():
+            await self.publish()
+        self.refresh()
+    
+    def cached(self, catalog: CatalogSnapshot, key) -> Optional[CachedBody]:
+        """The shared body for a response cache key, or None when this worker must encode it"""
+        view = self._view
+        if view is None or view[0] != catalog.digest:
+            return None
+        _, pages, index, bodies = view
+        key = shared_key(key)
+        cached = bodies.get(key)
+        if cached is None:
+            entry = index.get(key)
+            if entry is None:
+                return None
+            offset, length, gzip_offset, gzip_length = entry
+            body = pages[offset:offset + length]
+            gzip_body = pages[gzip_offset:gzip_offset + gzip_length] if gzip_length else None
+            # Same ETag as the locally encoded body would get, so 304s hold whichever path serves it
+            cached = bodies[key] = CachedBody(body, make_etag(body), gzip_body=gzip_body)
+        return cached
+    
+    def body(self, catalog: CatalogSnapshot, museum_id: str) -> Optional[memoryview]:
+        """The museum's encoded JSON from the shared pages, or None when this worker must encode it"""
+        cached = self.cached(catalog, ("museum", museum_id))
+        return None if cached is None else cached.body
+    
+    async def run(self):
+        while True:
+            try:
+                await self.tick()
+            except (OSError, ValueError, struct.error) as exc:
+                logger.warning("Shared catalog snapshot unavailable: %s", exc)
+            await asyncio.sleep(CATALOG_POLL_SECONDS)
+
+shared_catalog = SharedCatalog(SHARED_SNAPSHOT_PATH, catalogs)
+
+# Index provisioning - every query above is answered from one of these; built at startup
+# and the app reports not ready until all of them exist
+COLLECTION_INDEXES = {
+    # Per-user collections lead with user_id, so each operation is one range over a compound
+    # index however many users there are
+    "favorites": [
+        ([("user_id", 1), ("museum_id", 1)], {"unique": True}),
+        ([("user_id", 1), ("created_at", 1), ("id", 1)], {}),
+    ],
+    "custom_tours": [
+        ([("user_id", 1), ("id", 1)], {"unique": True}),
+        ([("user_id", 1), ("created_at", 1)], {}),
+    ],
+    "museums": [
+        ([("id", 1)], {"unique": True}),
+        ([("seq", 1)], {}),
+    ],
+    # Only seqs still being written matter to the sync, so commits expire after a day
+    "catalog_commits": [
+        ([("committed_at", 1)], {"expireAfterSeconds": 86400}),
+    ],
+}
+INDEX_RETRY_SECONDS = 5.0
+DUPLICATE_KEY_CODE = 11000
+
+def index_name(keys: List[tuple]) -> str:
+    """MongoDB's default name for an index, e.g. user_id_1_museum_id_1"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+class IndexProvisioner:
+    """Builds the declared indexes and tracks each one as pending, building, ready or failed.
+    
+    Failed builds (mongod not up yet, say) are retried until they succeed. Indexes that already exist
+    are left alone. When a unique build fails on duplicate keys, the documents that violate it are
+    removed, keeping the oldest per key, and the build is retried: older find-then-insert writes
+    could store a favorite twice, and those rows would otherwise fail the build forever.
+    """
+    
+    def __init__(self, declared: dict):
+        self.declared = declared
+        self.status = {
+            f"{collection}.{index_name(keys)}": {"state": "pending"}
+            for collection, indexes in declared.items() for keys, _ in indexes
+        }
+    
+    @property
+    def ready(self) -> bool:
+        return all(entry["state"] == "ready" for entry in self.status.values())
+    
+    async def migrate(self, database):
+        """Give favorites and custom tours from before per-user storage an owner"""
+        for collection in ("favorites", "custom_tours"):
+            await database[collection].update_many(
+                {"user_id": {"$exists": False}}, {"$set": {"user_id": ANONYMOUS_USER}}
+            )
+    
+    async def dedupe(self, database, collection: str, keys: list) -> int:
+        """Delete all but the oldest document for each value of a unique index's keys"""
+        duplicates = database[collection].aggregate([
+            {"$sort": {"created_at": 1, "_id": 1}},
+            {"$group": {"_id": {field: f"${field}" for field, _ in keys}, "ids": {"$push": "$_id"}}},
+            {"$match": {"ids.1": {"$exists": True}}},
+        ], allowDiskUse=True)
+        extra = [doc_id async for group in duplicates for doc_id in group["ids"][1:]]
+        if not extra:
+            return 0
+        result = await database[collection].delete_many({"_id": {"$in": extra}})
+        logger.warning("Removed %d duplicate %s documents before building %s",
+                       result.deleted_count, collection, index_name(keys))
+        return result.deleted_count
+    
+    async def build(self, database, collection: str, keys: list, options: dict) -> str:
+        try:
+            return await database[collection].create_index(keys, **options)
+        except OperationFailure as exc:
+            if not options.get("unique") or exc.code != DUPLICATE_KEY_CODE:
+                raise
+        await self.dedupe(database, collection, keys)
+        return await database[collection].create_index(keys, **options)
+    
+    async def ensure(self, database):
+        """One pass over the declared indexes, building only the ones the collection does not list"""
+        await self.migrate(database)
+        for collection, indexes in self.declared.items():
+            for keys, options in indexes:
+                entry = self.status[f"{collection}.{index_name(keys)}"]
+                if entry["state"] == "ready":
+                    continue
+                entry.update(state="building", error=None)
+                started = datetime.now(timezone.utc)
+                try:
+                    name = index_name(keys)
+                    if name not in await database[collection].index_information():
+                        name = await self.build(database, collection, keys, options)
+                        if name not in await database[collection].index_information():
+                            raise RuntimeError(f"index {name} missing after build")
+                except Exception as exc:
+                    entry.update(state="failed", error=str(exc))
+                    logger.warning("Index %s.%s failed: %s", collection, index_name(keys), exc)
+                    continue
+                elapsed = datetime.now(timezone.utc) - started
+                entry.update(state="ready", build_ms=round(elapsed.total_seconds() * 1000, 1))
+    
+    async def run(self, database):
+        while True:
+            try:
+                await self.ensure(database)
+            except Exception as exc:
+                logger.warning("Index provisioning failed: %s", exc)
+            if self.ready:
+                logger.info("All %d indexes ready", len(self.status))
+                return
+            await asyncio.sleep(INDEX_RETRY_SECONDS)
+
+index_provisioner = IndexProvisioner(COLLECTION_INDEXES)
+
+@api_router.get("/health/ready")
+async def readiness():
+    """Readiness probe: 503 until every declared index is built and the catalog is hydrated"""
+    ready = index_provisioner.ready and catalog_sync.hydrated
+    return Response(
+        content=encode_json({
+            "ready": ready,
+            "indexes": index_provisioner.status,
+            "catalog": {"hydrated": catalog_sync.hydrated, "seq": catalog_sync.applied, "museums": len(catalogs.current)},
+        }),
+        status_code=200 if ready else 503,
+        media_type="application/json",
+    )
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -1366,6 +2739,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # Configure logging
@@ -1375,6 +2749,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_background_tasks():
+    app.state.index_task = asyncio.create_task(index_provisioner.run(db))
+    app.state.catalog_task = asyncio.create_task(catalog_sync.run(db))
+    app.state.shared_catalog_task = asyncio.create_task(shared_catalog.run())
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    app.state.index_task.cancel()
+    app.state.catalog_task.cancel()
+    app.state.shared_catalog_task.cancel()
     client.close()
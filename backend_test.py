@@ -10,6 +10,7 @@ import json
 import sys
 from typing import List, Dict, Any
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Backend URL from environment
 BACKEND_URL = "https://london-museums.preview.emergentagent.com/api"
@@ -280,6 +281,38 @@ class MuseumAPITester:
             self.log_test("Favorites Endpoints", False, f"Error: {str(e)}")
             return False
     
+    def test_concurrent_favorite_adds(self, adds: int = 200):
+        """Fire many simultaneous adds of one museum; exactly one favorite may be created"""
+        test_museum_id = "1"  # British Museum
+        headers = {"X-Device-Id": f"concurrency-test-{int(time.time() * 1000)}"}
+        
+        def add_favorite(_):
+            response = requests.post(f"{self.base_url}/favorites/{test_museum_id}", headers=headers, timeout=30)
+            response.raise_for_status()
+            return response.json()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=adds) as pool:
+                results = list(pool.map(add_favorite, range(adds)))
+            
+            created = sum(1 for r in results if r.get('created'))
+            ids = {r.get('id') for r in results}
+            if created == 1 and len(ids) == 1:
+                self.log_test("Concurrent Favorite Adds", True, f"{adds} adds, 1 created, all returned the same id")
+            else:
+                self.log_test("Concurrent Favorite Adds", False, f"{adds} adds, {created} created, {len(ids)} distinct ids")
+            
+            response = self.session.get(f"{self.base_url}/favorites", headers=headers)
+            stored = len(response.json()) if response.status_code == 200 else None
+            self.log_test("No Duplicate Favorites", stored == 1, f"{stored} favorites stored")
+            
+            self.session.delete(f"{self.base_url}/favorites/{test_museum_id}", headers=headers)
+            return created == 1 and stored == 1
+            
+        except Exception as e:
+            self.log_test("Concurrent Favorite Adds", False, f"Error: {str(e)}")
+            return False
+    
     def run_all_tests(self):
         """Run all tests and return summary"""
         print("🏛️  Museums of London Backend API Testing")
@@ -326,6 +359,7 @@ class MuseumAPITester:
         # Test favorites
         print(f"\n❤️  Testing Favorites Functionality...")
         self.test_favorites_endpoints()
+        self.test_concurrent_favorite_adds()
         
         # Summary
         print(f"\n" + "=" * 50)
@@ -13,6 +13,7 @@ import { StatusBar } from 'expo-status-bar';
 import { Ionicons } from '@expo/vector-icons';
 import { useSafeAreaInsets } from 'react-native-safe-area-context';
 import { useRouter, useFocusEffect } from 'expo-router';
+import { getDeviceHeaders } from '../utils/device';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL || '';
 
@@ -36,7 +37,9 @@ export default function FavoritesScreen() {
 
   const fetchFavorites = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/favorites`);
+      const response = await fetch(`${BACKEND_URL}/api/favorites`, {
+        headers: await getDeviceHeaders(),
+      });
       const data = await response.json();
       setFavorites(data);
     } catch (error) {
@@ -62,6 +65,7 @@ export default function FavoritesScreen() {
     try {
       await fetch(`${BACKEND_URL}/api/favorites/${museumId}`, {
         method: 'DELETE',
+        headers: await getDeviceHeaders(),
       });
       setFavorites(favorites.filter((m) => m.id !== museumId));
     } catch (error) {
@@ -16,6 +16,7 @@ import { StatusBar } from 'expo-status-bar';
 import { Ionicons } from '@expo/vector-icons';
 import { useSafeAreaInsets } from 'react-native-safe-area-context';
 import { useRouter, useLocalSearchParams, useFocusEffect } from 'expo-router';
+import { getDeviceHeaders } from '../../utils/device';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL || '';
 
@@ -79,7 +80,9 @@ export default function MuseumDetailScreen() {
 
   const checkFavorite = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/favorites/check/${id}`);
+      const response = await fetch(`${BACKEND_URL}/api/favorites/check/${id}`, {
+        headers: await getDeviceHeaders(),
+      });
       const data = await response.json();
       setIsFavorite(data.is_favorite);
     } catch (error) {
@@ -96,10 +99,11 @@ export default function MuseumDetailScreen() {
 
   const toggleFavorite = async () => {
     try {
+      const headers = await getDeviceHeaders();
       if (isFavorite) {
-        await fetch(`${BACKEND_URL}/api/favorites/${id}`, { method: 'DELETE' });
+        await fetch(`${BACKEND_URL}/api/favorites/${id}`, { method: 'DELETE', headers });
       } else {
-        await fetch(`${BACKEND_URL}/api/favorites/${id}`, { method: 'POST' });
+        await fetch(`${BACKEND_URL}/api/favorites/${id}`, { method: 'POST', headers });
       }
       setIsFavorite(!isFavorite);
     } catch (error) {
@@ -17,6 +17,7 @@ import { Ionicons } from '@expo/vector-icons';
 import { useSafeAreaInsets } from 'react-native-safe-area-context';
 import { useRouter, useFocusEffect } from 'expo-router';
 import { LinearGradient } from 'expo-linear-gradient';
+import { getDeviceHeaders } from '../utils/device';
 
 const { width } = Dimensions.get('window');
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL || '';
@@ -56,9 +57,10 @@ export default function ToursScreen() {
 
   const fetchTours = async () => {
     try {
+      const headers = await getDeviceHeaders();
       const [toursRes, customRes] = await Promise.all([
         fetch(`${BACKEND_URL}/api/tours`),
-        fetch(`${BACKEND_URL}/api/tours/custom/list`)
+        fetch(`${BACKEND_URL}/api/tours/custom/list`, { headers })
       ]);
       const toursData = await toursRes.json();
       const customData = await customRes.json();
@@ -103,7 +105,10 @@ export default function ToursScreen() {
 
   const deleteCustomTour = async (tourId: string) => {
     try {
-      await fetch(`${BACKEND_URL}/api/tours/custom/${tourId}`, { method: 'DELETE' });
+      await fetch(`${BACKEND_URL}/api/tours/custom/${tourId}`, {
+        method: 'DELETE',
+        headers: await getDeviceHeaders(),
+      });
       setCustomTours(customTours.filter(t => t.id !== tourId));
     } catch (error) {
       console.error('Error deleting tour:', error);
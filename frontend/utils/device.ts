@@ -0,0 +1,20 @@
+import AsyncStorage from '@react-native-async-storage/async-storage';
+
+const DEVICE_ID_KEY = 'device_id';
+
+let deviceId: Promise<string> | null = null;
+
+// Favorites and custom tours are stored per device on the backend.
+// The id is generated once and kept in AsyncStorage.
+const loadDeviceId = async (): Promise<string> => {
+  const stored = await AsyncStorage.getItem(DEVICE_ID_KEY);
+  if (stored) return stored;
+  const created = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 12)}`;
+  await AsyncStorage.setItem(DEVICE_ID_KEY, created);
+  return created;
+};
+
+export const getDeviceHeaders = async (): Promise<Record<string, string>> => {
+  if (!deviceId) deviceId = loadDeviceId();
+  return { 'X-Device-Id': await deviceId };
+};
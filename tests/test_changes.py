@@ -0,0 +1,189 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+client = TestClient(server.app)
+
+
+def edited(catalog, museum_id, name):
+    return {**catalog.get(museum_id), "name": name}
+
+
+@pytest.fixture
+def builtin():
+    return server.CatalogSnapshot(server.LONDON_MUSEUMS)
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Serve /museums/changes from a given snapshot, confirmed up to a given seq of the database's counter"""
+    def install(catalog, applied, counter=None):
+        async def read_seq(database):
+            return applied if counter is None else counter
+        monkeypatch.setattr(server.catalogs, "current", catalog)
+        monkeypatch.setattr(server.catalog_sync, "hydrated", True)
+        monkeypatch.setattr(server.catalog_sync, "applied", applied)
+        monkeypatch.setattr(server.catalog_sync, "read_seq", read_seq)
+        monkeypatch.setattr(server, "response_cache", server.ResponseCache())
+    return install
+
+
+class Commits:
+    """Just enough of db.catalog_commits for CatalogSync.settle"""
+    def __init__(self, seqs):
+        self.seqs = set(seqs)
+
+    async def _find(self, bounds):
+        for seq in sorted(self.seqs):
+            if bounds["$gt"] < seq <= bounds["$lte"]:
+                yield {"_id": seq}
+
+    def find(self, query, projection):
+        return self._find(query["_id"])
+
+
+class Database:
+    def __init__(self, seqs):
+        self.catalog_commits = Commits(seqs)
+
+
+def test_log_keeps_latest_seq_per_museum():
+    log = server.ChangeLog()
+    log.record("1", 1, deleted=False)
+    log.record("2", 2, deleted=False)
+    log.record("1", 3, deleted=False)
+    log.record("2", 4, deleted=True)
+    assert log.upserts == {"1": 3}
+    assert log.tombstones == {"2": 4}
+    assert log.since(0) == (["1"], ["2"])
+    assert log.since(3) == ([], ["2"])
+    assert log.since(4) == ([], [])
+
+
+def test_readding_a_deleted_museum_clears_its_tombstone():
+    log = server.ChangeLog()
+    log.record("7", 1, deleted=True)
+    log.record("7", 2, deleted=False)
+    assert log.since(0) == (["7"], [])
+
+
+def test_since_lists_changes_oldest_first():
+    log = server.ChangeLog()
+    for seq, museum_id in ((5, "c"), (2, "a"), (9, "b")):
+        log.record(museum_id, seq, deleted=False)
+    assert log.since(1) == (["a", "c", "b"], [])
+
+
+def test_compaction_drops_oldest_tombstones_and_raises_floor(monkeypatch):
+    monkeypatch.setattr(server, "CHANGE_LOG_TOMBSTONES", 2)
+    log = server.ChangeLog()
+    for seq in (1, 2, 3, 4):
+        log.record(str(seq), seq, deleted=True)
+    log.compact()
+    assert log.tombstones == {"3": 3, "4": 4}
+    assert log.floor == 2
+
+
+def test_log_copy_is_independent():
+    log = server.ChangeLog()
+    log.record("1", 1, deleted=False)
+    clone = log.copy()
+    clone.record("1", 2, deleted=True)
+    assert log.upserts == {"1": 1} and log.tombstones == {}
+
+
+def test_snapshot_records_changes_without_touching_its_parent(builtin):
+    after = builtin.with_changes([("1", edited(builtin, "1", "Renamed"), 5), ("2", None, 6)], 6)
+    assert after.changelog.since(0) == (["1"], ["2"])
+    assert builtin.changelog.since(0) == ([], [])
+    assert "2" in builtin and "2" not in after
+
+
+def test_tombstone_for_unknown_museum_is_still_logged(builtin):
+    after = builtin.with_changes([("999", None, 3)], 3)
+    assert after.changelog.tombstones == {"999": 3}
+    assert len(after) == len(builtin)
+
+
+def test_snapshot_compaction_turns_old_cursors_into_resets(builtin, monkeypatch):
+    monkeypatch.setattr(server, "CHANGE_LOG_TOMBSTONES", 1)
+    after = builtin.with_changes([("1", None, 1), ("2", None, 2), ("3", None, 3)], 3)
+    assert after.changelog.floor == 2
+    assert server.catalog_changes(after, 1, 3)["reset"] is True
+    delta = server.catalog_changes(after, 2, 3)
+    assert delta["reset"] is False and delta["tombstones"] == ["3"]
+
+
+def test_endpoint_returns_delta_since_cursor(builtin, serve):
+    catalog = builtin.with_changes([("4", edited(builtin, "4", "Delta Museum"), 7), ("5", None, 8)], 8)
+    serve(catalog, 8)
+    body = client.get("/api/museums/changes", params={"since": 6}).json()
+    assert body["reset"] is False
+    assert body["seq"] == 8
+    assert [m["name"] for m in body["upserts"]] == ["Delta Museum"]
+    assert body["tombstones"] == ["5"]
+
+    caught_up = client.get("/api/museums/changes", params={"since": 8})
+    assert caught_up.json() == {"seq": 8, "reset": False, "upserts": [], "tombstones": []}
+    assert len(caught_up.content) < 100
+
+
+def test_endpoint_resets_without_cursor(builtin, serve):
+    serve(builtin, 0)
+    body = client.get("/api/museums/changes").json()
+    assert body["reset"] is True
+    assert len(body["upserts"]) == len(builtin)
+    assert body["seq"] == 0
+
+
+def test_endpoint_resets_cursor_ahead_of_server(builtin, serve):
+    catalog = builtin.with_changes([("4", edited(builtin, "4", "Delta Museum"), 3)], 3)
+    serve(catalog, 3)
+    body = client.get("/api/museums/changes", params={"since": 50}).json()
+    assert body["reset"] is True
+    assert body["seq"] == 3
+    assert len(body["upserts"]) == len(catalog)
+
+
+def test_endpoint_waits_for_cursor_from_a_worker_further_along(builtin, serve):
+    catalog = builtin.with_changes([("4", edited(builtin, "4", "Delta Museum"), 3)], 3)
+    serve(catalog, 3, counter=7)
+    body = client.get("/api/museums/changes", params={"since": 5}).json()
+    assert body == {"seq": 5, "reset": False, "upserts": [], "tombstones": []}
+
+
+def test_endpoint_cursor_never_passes_unconfirmed_writes(builtin, serve):
+    # A write applied locally at seq 9 while the sync has only confirmed seq 6
+    catalog = builtin.with_changes([("4", edited(builtin, "4", "Local Write"), 9)], None)
+    serve(catalog, 6)
+    body = client.get("/api/museums/changes", params={"since": 6}).json()
+    assert body["seq"] == 6
+    assert [m["id"] for m in body["upserts"]] == ["4"]
+
+
+def test_endpoint_waits_for_hydration(monkeypatch):
+    monkeypatch.setattr(server.catalog_sync, "hydrated", False)
+    assert client.get("/api/museums/changes").status_code == 503
+
+
+def test_sync_waits_for_a_late_commit():
+    sync = server.CatalogSync(server.CatalogPublisher(server.CatalogSnapshot(server.LONDON_MUSEUMS)))
+    database = Database([2, 3])
+    # Seq 1 is allocated but its writer has not committed, however many polls go by
+    for _ in range(3):
+        assert asyncio.run(sync.settle(database, 0, 3)) == 0
+    database.catalog_commits.seqs.add(1)
+    assert asyncio.run(sync.settle(database, 0, 3)) == 3
+    assert sync.gaps == {}
+
+
+def test_sync_moves_past_an_abandoned_seq():
+    sync = server.CatalogSync(server.CatalogPublisher(server.CatalogSnapshot(server.LONDON_MUSEUMS)))
+    database = Database([1, 3])
+    assert asyncio.run(sync.settle(database, 0, 3)) == 1
+    sync.gaps[2] -= timedelta(seconds=server.CATALOG_GAP_SECONDS)
+    assert asyncio.run(sync.settle(database, 1, 3)) == 3
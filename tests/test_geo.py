@@ -0,0 +1,58 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+client = TestClient(server.app)
+
+FAR_POINTS = [
+    (40.71, -74.0),  # New York
+    (-33.87, 151.21),  # Sydney
+    (89.99, 179.99),
+    (-89.99, -179.99),
+    (0.0, 0.0),
+    (51.5, 179.0),
+]
+
+
+def brute_nearest(points, lat, lon, k, radius_m=None):
+    hits = sorted((server.haversine_m(lat, lon, plat, plon), museum_id) for museum_id, (plat, plon) in points.items())
+    if radius_m is not None:
+        hits = [hit for hit in hits if hit[0] <= radius_m]
+    return hits[:k]
+
+
+@pytest.fixture(scope="module")
+def grid():
+    index = server.GridIndex()
+    for record in server.LONDON_MUSEUMS:
+        index.add(record)
+    return index
+
+
+def query_points():
+    rng = random.Random(7)
+    london = [(rng.uniform(51.3, 51.7), rng.uniform(-0.5, 0.3)) for _ in range(200)]
+    return london + FAR_POINTS
+
+
+@pytest.mark.parametrize("k", [1, 5, len(server.LONDON_MUSEUMS), 100])
+def test_nearest_matches_brute_force(grid, k):
+    points = {record["id"]: (record["latitude"], record["longitude"]) for record in server.LONDON_MUSEUMS}
+    for lat, lon in query_points():
+        assert grid.nearest(lat, lon, k) == brute_nearest(points, lat, lon, k), (lat, lon)
+
+
+@pytest.mark.parametrize("radius_m", [250, 1500, 10000])
+def test_nearest_within_radius_matches_brute_force(grid, radius_m):
+    points = {record["id"]: (record["latitude"], record["longitude"]) for record in server.LONDON_MUSEUMS}
+    for lat, lon in query_points():
+        assert grid.nearest(lat, lon, 10, radius_m=radius_m) == brute_nearest(points, lat, lon, 10, radius_m), (lat, lon)
+
+
+@pytest.mark.parametrize("radius_m", ["nan", "inf", "-inf", "0", "-5"])
+def test_nearby_rejects_bad_radius(radius_m):
+    response = client.get("/api/museums/nearby", params={"lat": 51.5, "lon": -0.12, "radius_m": radius_m})
+    assert response.status_code == 400
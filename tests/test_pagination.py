@@ -0,0 +1,103 @@
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import server
+
+client = TestClient(server.app)
+
+
+def raw_cursor(state) -> str:
+    return base64.urlsafe_b64encode(json.dumps(state).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def all_pages(records, limit, sort=None, key=None):
+    pages, cursor = [], None
+    while True:
+        page = server.paginate(records, limit, cursor, sort=sort, key=key)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort", ["rating", "name", "created_at"])
+def test_sorted_cursor_round_trip(sort):
+    records = list(server.catalogs.current)
+    key = server.museum_sort_key(sort)
+    pages = all_pages(records, 4, sort=sort, key=key)
+    assert all(len(page) == 4 for page in pages[:-1])
+    assert [m["id"] for page in pages for m in page] == [m["id"] for m in sorted(records, key=key)]
+
+
+def test_distance_cursor_round_trip():
+    records = list(server.catalogs.current)
+    key = server.museum_sort_key("distance", 51.5194, -0.1270)
+    pages = all_pages(records, 5, sort="distance", key=key)
+    assert [m["id"] for page in pages for m in page] == [m["id"] for m in sorted(records, key=key)]
+
+
+def test_offset_cursor_round_trip():
+    records = list(server.catalogs.current)
+    pages = all_pages(records, 7)
+    assert [m["id"] for page in pages for m in page] == [m["id"] for m in records]
+
+
+def test_endpoint_follows_next_cursor_header():
+    seen, cursor = [], None
+    while True:
+        params = {"sort": "rating", "limit": 6, "view": "summary"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/museums", params=params)
+        assert response.status_code == 200
+        seen += [m["id"] for m in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == len(server.catalogs.current)
+
+
+@pytest.mark.parametrize("state", [
+    {"sort": "rating", "after": ["x", None]},
+    {"sort": "rating", "after": [-4.5]},
+    {"sort": "rating", "after": [-4.5, "1", "2"]},
+    {"sort": "rating", "after": [True, "1"]},
+    {"sort": "rating", "after": "-4.5,1"},
+    {"sort": "rating", "after": {"rating": 4.5}},
+    {"sort": "rating"},
+    {"sort": "name", "after": [1, "2"]},
+    {"sort": "created_at", "after": ["2024-01-01", "1"]},
+])
+def test_malformed_sorted_cursor_is_rejected(state):
+    sort = state["sort"]
+    with pytest.raises(HTTPException) as error:
+        server.paginate(list(server.catalogs.current), 5, raw_cursor(state), sort=sort, key=server.museum_sort_key(sort))
+    assert error.value.status_code == 400
+    response = client.get("/api/museums", params={"sort": sort, "limit": 5, "cursor": raw_cursor(state)})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("cursor", [
+    raw_cursor({"offset": True}),
+    raw_cursor({"offset": -1}),
+    raw_cursor({"offset": "3"}),
+    raw_cursor({"offset": 2.5}),
+    raw_cursor([1, 2]),
+    "not base64 at all!",
+    base64.urlsafe_b64encode(b"\xff\xfe").decode("ascii"),
+])
+def test_malformed_offset_cursor_is_rejected(cursor):
+    response = client.get("/api/museums", params={"limit": 5, "cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_cursor_from_another_sort_is_rejected():
+    page = server.paginate(list(server.catalogs.current), 3, None, sort="name", key=server.museum_sort_key("name"))
+    response = client.get("/api/museums", params={"sort": "rating", "limit": 3, "cursor": page.next_cursor})
+    assert response.status_code == 400
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+import server
+
+QUERIES = ("museum", "art gallery", "science", "history", "natural")
+POINTS = ((51.5, -0.12), (51.52, -0.17), (51.48, 0.0))
+
+
+def answers(catalog):
+    """Everything a request can read from a snapshot, with ties that carry no meaning put in order"""
+    return {
+        "records": list(catalog),
+        "digest": catalog.digest,
+        "categories": catalog.categories(),
+        "search": {q: sorted(catalog.search_index.search(q, match_all=False)) for q in QUERIES},
+        "fuzzy": {q: sorted(catalog.trigram_index.search(q, match_all=False)) for q in QUERIES},
+        "suggest": {q[:4]: sorted((s["type"], s["label"], tuple(sorted(s["museum_ids"])))
+                                  for s in catalog.suggest_index.suggest(q[:4], limit=20))
+                    for q in QUERIES},
+        "nearest": {p: catalog.grid_index.nearest(*p, k=5) for p in POINTS},
+        "within": {p: catalog.grid_index.within(*p, radius_m=2000) for p in POINTS},
+    }
+
+
+@pytest.fixture
+def builtin():
+    return server.CatalogSnapshot(server.LONDON_MUSEUMS)
+
+
+def changes(catalog):
+    added = {**catalog.get("4"), "id": "900", "name": "Zzyzx Science Gallery", "latitude": 51.53, "longitude": -0.08}
+    moved = {**catalog.get("6"), "name": "Relocated Art House", "category": "Design", "latitude": 51.49, "longitude": -0.2}
+    return [("900", added, 1), ("6", moved, 2), ("5", None, 3)]
+
+
+def test_child_leaves_parent_untouched(builtin):
+    before = answers(builtin)
+    child = builtin.with_changes(changes(builtin), 3)
+    assert answers(child) != before
+    assert answers(builtin) == before
+    assert "900" not in builtin and "5" in builtin
+
+
+def test_incremental_child_matches_rebuild(builtin):
+    child = builtin.with_changes(changes(builtin), 3)
+    # A second generation, so copies of copies are covered too
+    grandchild = child.with_changes([("900", None, 4), ("7", {**child.get("7"), "name": "Seventh"}, 5)], 5)
+    for snapshot in (child, grandchild):
+        assert answers(snapshot) == answers(server.CatalogSnapshot(list(snapshot)))
+
+
+def test_concurrent_applies_share_one_snapshot(builtin):
+    publisher = server.CatalogPublisher(builtin)
+
+    async def burst():
+        return await asyncio.gather(*(
+            publisher.apply([(museum_id, {**builtin.get(museum_id), "name": f"Renamed {museum_id}"}, None)])
+            for museum_id in ("1", "2", "3", "4")
+        ))
+
+    published = asyncio.run(burst())
+    assert all(snapshot is published[0] for snapshot in published)
+    assert published[0] is publisher.current
+    assert published[0].version == builtin.version + 1
+    assert [published[0].get(museum_id)["name"] for museum_id in ("1", "2", "3", "4")] == [
+        "Renamed 1", "Renamed 2", "Renamed 3", "Renamed 4"
+    ]